@@ -0,0 +1,62 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# brotli 패키지가 있으면 br을 우선 사용 (없거나 starlette가 오래돼 응답 래퍼가 없으면 gzip만)
+try:
+    import brotli
+    from starlette.middleware.gzip import IdentityResponder
+except ImportError:
+    brotli = None
+
+
+def accepts_encoding(headers: Headers, encoding: str) -> bool:
+    """Accept-Encoding에 encoding이 있는지 (q=0으로 거절한 경우 제외)"""
+    for item in headers.get("accept-encoding", "").split(","):
+        name, _, params = item.strip().partition(";")
+        if name.strip().lower() == encoding:
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+if brotli is not None:
+
+    class BrotliResponder(IdentityResponder):
+        """starlette GZipResponder와 같은 방식으로 응답 본문을 brotli로 압축"""
+
+        content_encoding = "br"
+
+        def __init__(self, app: ASGIApp, minimum_size: int, quality: int, **kwargs):
+            super().__init__(app, minimum_size, **kwargs)
+            self.quality = quality
+            self._compressor = None
+
+        async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+            if self._compressor is None:
+                self._compressor = brotli.Compressor(quality=self.quality)
+            data = self._compressor.process(body)
+            return data + (self._compressor.flush() if more_body else self._compressor.finish())
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """응답 압축 (br 지원 클라이언트는 brotli, 그 외 gzip)
+
+    minimum_size보다 작은 응답, 이미지처럼 이미 압축된 형식, Content-Encoding이 있는 응답
+    (미리 압축해 둔 정적 파일)은 그대로 보낸다.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, compresslevel: int, brotli_quality: int):
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if brotli is not None and scope["type"] == "http" and accepts_encoding(Headers(scope=scope), "br"):
+            responder = BrotliResponder(
+                self.app,
+                self.minimum_size,
+                self.brotli_quality,
+                exclude_content_types=self.exclude_content_types,
+            )
+            await responder(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
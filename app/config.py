@@ -10,16 +10,123 @@ class Settings(BaseSettings):
     # External APIs (NanoBanana는 Gemini 이미지 생성 모델이므로 동일한 API 키 사용)
     gemini_api_key: str = ""
 
-    # Storage
+    # 생성 provider (gemini: 실제 API | fake: 로컬 가짜 응답, API 키 없이 오프라인 성능 테스트용
+    #               | replay: replay_file에 녹화된 응답/지연 재현)
+    llm_provider: str = "gemini"
+    image_provider: str = "gemini"
+
+    # fake provider 동작 (지연은 중앙값(초) + sigma의 로그정규분포, 같은 seed + 같은 입력이면 같은 결과)
+    fake_seed: int = 0
+    fake_llm_latency: float = 2.0
+    fake_image_latency: float = 8.0  # pro 모델 (에피소드 최종본)
+    fake_flash_image_latency: float = 3.0  # flash 모델 (캐릭터 시트 / 프리뷰)
+    fake_latency_sigma: float = 0.3
+    fake_failure_rate: float = 0.0  # 호출(시도)별 실패 확률
+    fake_episode_count: int = 2  # 시나리오 에피소드 수
+
+    # replay provider (benchmarks/record.py로 만든 녹화 파일, 녹화에 없는 호출은 fake 설정으로 대체)
+    replay_file: str = ""
+    replay_latency_scale: float = 1.0  # 녹화된 지연에 곱할 배율
+
+    # Gemini 컨텍스트 캐시 (정적 시스템 프롬프트)
+    gemini_context_cache_enabled: bool = True
+    gemini_context_cache_ttl: int = 3600  # 초
+    gemini_context_cache_refresh_margin: int = 300  # 만료 N초 전에 갱신
+
+    # LLM 호출 방식 (parallel: 검증/시나리오 2회 병렬 호출 | single: 통합 스키마 1회 호출)
+    llm_mode: str = "parallel"
+
+    # 긴 입력 map-reduce 시나리오 생성 (threshold 초과 시 청크 분할, 0이면 비활성화)
+    chunked_scenario_threshold: int = 8000  # 글자 수
+    chunked_scenario_chunk_size: int = 5000  # 청크당 목표 글자 수
+
+    # Progressive 렌더링 (flash 프리뷰를 먼저 보여주고 pro 최종본으로 교체)
+    progressive_rendering: bool = False
+
+    # 에피소드 이미지 모델 라우팅 (혼잡 시 pro 2K → pro 1K → flash 강등)
+    image_router_enabled: bool = True
+    image_router_min_samples: int = 10  # 지연/에러율 판단에 필요한 최소 샘플 수
+    image_router_degrade_latency: float = 60.0  # pro p90(초) 이상이면 1K
+    image_router_degrade_queue_depth: int = 12  # 진행 중 이미지 호출 수 이상이면 1K
+    image_router_flash_latency: float = 120.0  # pro p90(초) 이상이면 flash
+    image_router_flash_error_rate: float = 0.5  # pro 에러율 이상이면 flash
+    image_router_flash_queue_depth: int = 24  # 진행 중 이미지 호출 수 이상이면 flash
+    image_router_probe_ratio: float = 0.1  # 강등 중 pro로 보내는 비율 (회복 확인용)
+
+    # 에피소드 이미지 헤지 요청 (모델별 최근 p90 초과 시 중복 요청, 먼저 끝난 쪽 사용)
+    hedge_enabled: bool = True
+    hedge_min_samples: int = 20  # p90 산출에 필요한 최소 샘플 수
+    hedge_budget_ratio: float = 0.05  # 최근 호출 중 헤지 요청 비율 상한
+
+    # 에피소드 묶음 생성 (에피소드 2개를 이미지 1장으로 생성 후 분리, 호출 수 절반)
+    episode_packing_enabled: bool = False
+    episode_packing_min_episodes: int = 4  # 남은 에피소드가 이 수 이상일 때만 묶음
+
+    # 이미지 결과 캐시 (같은 프롬프트/레퍼런스/모델/설정이면 생성 생략)
+    image_cache_enabled: bool = True
+    image_cache_max_entries: int = 5000  # 초과 시 오래 안 쓴 항목부터 삭제
+    image_cache_touch_interval: float = 30.0  # 적중 기록(hit_count, last_used_at)을 모아서 반영하는 주기 (초)
+
+    # 첨부 이미지 전달 방식 (files: Files API 1회 업로드 후 재사용 | inline: 호출마다 bytes 전송)
+    attachment_mode: str = "files"
+
+    # 종료/재시작 처리
+    admin_token: str = ""  # /debug/* 관리 요청의 X-Admin-Token (비어 있으면 서버 로컬 요청만 허용)
+    shutdown_drain_timeout: float = 120.0  # 종료 시 진행 중인 파이프라인 대기 시간 (초)
+    stale_task_seconds: int = 90  # 이 시간 이상 heartbeat 없는 pending/processing 태스크는 중단된 것으로 간주
+    task_sweep_interval: int = 60  # 중단된 태스크 정리 주기 (초)
+    task_heartbeat_interval: int = 15  # 진행 중인 태스크 heartbeat 갱신 주기 (초)
+
+    # 멀티 워커 (uvicorn --workers N / 여러 호스트가 같은 DB 사용)
+    multi_worker: bool = False
+    leader_lease_ttl: int = 30  # 리더 lease 유효 시간 (초)
+
+    # 로깅 (text | json: 한 줄 JSON + task_id/visitor_id, 출력은 별도 스레드)
+    log_level: str = "INFO"
+    log_format: str = "text"
+    log_sample_rate: float = 0.1  # sampled()로 표시한 자주 찍히는 로그를 남길 비율
+    log_access_sample_rate: float = 0.05  # /status, /debug 폴링 성공 접근 로그를 남길 비율
+
+    # 이벤트 루프 모니터 (lag 지표 + 루프를 block_threshold초 이상 잡고 있는 코드의 스택 로그)
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval: float = 0.5  # heartbeat 주기 (초)
+    loop_block_threshold: float = 0.3  # 이 시간 이상 멈추면 스택 기록 (초)
+
+    # 첨부 이미지 업로드 제한
+    upload_max_images: int = 3
+    upload_max_file_bytes: int = 10 * 1024 * 1024
+    upload_max_request_bytes: int = 20 * 1024 * 1024
+    upload_spool_threshold: int = 1024 * 1024  # 이보다 크면 임시 파일에 저장
+
+    # 응답 압축 (brotli 패키지가 있으면 br 우선, 없으면 gzip)
+    compress_min_size: int = 1024  # 이보다 작은 응답은 압축하지 않음 (bytes)
+    gzip_level: int = 6
+    brotli_quality: int = 4  # 동적 응답용 (빌드 때 미리 압축하는 정적 파일은 최고 품질)
+
+    # Storage (정적 파일 해시 경로 빌드: python -m app.static_assets → static_dir/dist)
     static_dir: str = "app/static"
     images_dir: str = "app/static/images"
 
+    # 생성 이미지 저장소 (s3 | local: local_storage_dir에 저장하고 /media 경로로 서빙)
+    storage_backend: str = "s3"
+    local_storage_dir: str = "media"
+
     # S3 (선택)
     s3_access_key: str = ""
     s3_secret_key: str = ""
     s3_bucket: str = ""
     s3_region: str = "ap-northeast-2"
 
+    # 결과 페이지 발행 (완료 시 /view HTML을 한 번 렌더링해서 저장, off면 /view가 매번 렌더링)
+    # static: published_dir에 저장 후 /view가 바로 응답 | storage: 저장소(S3)에 올리고 /view가 리다이렉트
+    result_publish_target: str = "static"
+    published_dir: str = "published"
+    public_base_url: str = ""  # storage 발행 페이지가 정적 파일/API를 가져올 서비스 주소 (예: https://toonify.kr)
+
+    # JSON 컬럼 (Comic 시나리오/이미지 목록 등)을 PostgreSQL/MySQL에서 네이티브 JSON 타입으로 사용
+    # 기존 DB는 해당 컬럼을 JSON 타입으로 바꾼(ALTER) 뒤에 켤 것 (꺼져 있으면 Text에 JSON 문자열)
+    json_native_columns: bool = False
+
     # Environment
     env: str = "prod"  # dev | prod
 
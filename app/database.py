@@ -1,9 +1,19 @@
+import asyncio
+
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
+from app import json_codec
 from app.config import settings
 
-engine = create_async_engine(settings.database_url, echo=False)
+# JSON 타입 컬럼(네이티브 JSON 사용 시)도 같은 코덱으로 직렬화
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    json_serializer=json_codec.dumps,
+    json_deserializer=json_codec.loads,
+)
 
 async_session = async_sessionmaker(
     engine,
@@ -21,6 +31,16 @@ async def get_db() -> AsyncSession:
 
 
 async def init_db() -> None:
-    """데이터베이스 테이블 생성"""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    """데이터베이스 테이블 생성 (여러 워커가 동시에 만들다 충돌하면 재시도)
+
+    없는 테이블만 만들고 기존 테이블에 컬럼은 추가하지 않으므로, 기존 DB는 migrations/의 SQL을 먼저 실행할 것
+    """
+    for attempt in range(3):
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            return
+        except DBAPIError:
+            if attempt == 2:
+                raise
+            await asyncio.sleep(0.5)
@@ -0,0 +1,48 @@
+import json
+from datetime import date, datetime
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+# DB JSON 컬럼(JSONText), 엔진 JSON 타입, API 응답이 같은 코덱 사용 (orjson이 없으면 표준 json)
+# 출력은 공백 없는 compact 형식, 한글은 이스케이프하지 않음 (기존 ensure_ascii=False와 동일)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson이 없는 환경
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """표준 json 폴백용 (orjson과 같게 datetime은 ISO 문자열)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_bytes(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_default).encode()
+
+
+def dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_default)
+
+
+def loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """코덱(orjson)으로 직렬화하는 JSON 응답 (dict를 반환하는 라우트용)
+
+    response_model이 있는 라우트는 FastAPI가 Pydantic으로 바로 JSON bytes를 만드는 쪽이 더 빠르므로
+    기본 응답 클래스를 그대로 둔다 (response_class를 지정하면 그 경로를 타지 않음).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
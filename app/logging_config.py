@@ -0,0 +1,153 @@
+import atexit
+import json
+import logging
+import queue
+import random
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+
+from app.config import settings
+from app.services.trace_service import trace_service
+
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 상태 폴링처럼 많이 찍히는 접근 로그 (성공 응답만 샘플링)
+SAMPLED_ACCESS_PATHS = ("/status/", "/debug/")
+
+_visitor_id: ContextVar[str | None] = ContextVar("visitor_id", default=None)
+_listener: QueueListener | None = None
+
+
+def bind_visitor(visitor_id: str | None) -> None:
+    """현재 컨텍스트(요청 및 거기서 시작한 파이프라인)의 로그에 visitor_id 기록"""
+    _visitor_id.set(visitor_id)
+
+
+def sampled(rate: float = None) -> dict:
+    """자주 찍히는 로그를 rate 비율만 남기도록 하는 extra (logger.info(..., extra=sampled()))"""
+    return {"sample": settings.log_sample_rate if rate is None else rate}
+
+
+class Truncated:
+    """긴 값을 로그에 남길 때 출력 시점에만 문자열로 바꿔서 자르는 래퍼
+
+    logger.debug("응답: %s", Truncated(response, 500)) 처럼 %s 인자로 넘기면
+    레벨이 꺼져 있을 때는 str()도 호출되지 않고, 켜져 있으면 listener 스레드에서 변환된다.
+    """
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value, limit: int = 200):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        text = str(self.value)
+        if len(text) <= self.limit:
+            return text
+        return f"{text[:self.limit]}... ({len(text)}자)"
+
+
+class ContextFilter(logging.Filter):
+    """로그를 남긴 쪽의 컨텍스트(task_id / visitor_id)를 레코드에 기록 + 샘플링
+
+    QueueHandler에 붙어서 로그를 남긴 스레드/태스크에서 실행된다 (listener 스레드에서는 contextvar를 읽을 수 없음).
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = getattr(record, "sample", None)
+        if rate is not None and random.random() >= rate:
+            return False
+        record.task_id = trace_service.current_task_id()
+        record.visitor_id = _visitor_id.get()
+        return True
+
+
+class AccessSampleFilter(logging.Filter):
+    """uvicorn 접근 로그 중 폴링 경로의 성공 응답에 샘플링 비율 지정"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        args = record.args
+        if isinstance(args, tuple) and len(args) == 5:
+            _, _, path, _, status = args
+            if str(path).startswith(SAMPLED_ACCESS_PATHS) and status == 200:
+                record.sample = settings.log_access_sample_rate
+        return True
+
+
+class LazyQueueHandler(QueueHandler):
+    """메시지 포맷을 하지 않고 레코드를 그대로 큐에 넣는 핸들러
+
+    기본 QueueHandler는 넣기 전에 호출한 쪽에서 메시지를 포맷하므로,
+    %s 인자 변환(큰 응답 객체의 str 등)까지 listener 스레드로 넘기려고 prepare를 생략한다.
+    인자는 나중에 변환되므로 로그를 남긴 뒤 바뀌는 mutable 객체는 넘기지 않는다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON (로그 수집기용)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        task_id = getattr(record, "task_id", None)
+        if task_id:
+            entry["task_id"] = task_id
+        visitor_id = getattr(record, "visitor_id", None)
+        if visitor_id:
+            entry["visitor_id"] = visitor_id
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def setup_logging() -> None:
+    """루트 / uvicorn 로거를 큐 핸들러로 교체 (출력은 listener 스레드에서)
+
+    이벤트 루프에서는 레코드를 큐에 넣기만 하고, 포맷과 stderr 쓰기는 별도 스레드가 처리한다.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler()
+    if settings.log_format == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter(TEXT_FORMAT, DATE_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = LazyQueueHandler(log_queue)
+    handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(settings.log_level.upper())
+
+    # uvicorn은 자체 핸들러로 바로 쓰므로 같은 큐로 돌림 (uvicorn.error는 uvicorn으로 전파)
+    for name in ("uvicorn", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = [handler]
+        uvicorn_logger.propagate = False
+    logging.getLogger("uvicorn.access").filters = [AccessSampleFilter()]
+
+    _listener = QueueListener(log_queue, output)
+    _listener.start()
+    # uvicorn 종료 로그까지 출력되도록 lifespan이 아니라 프로세스 종료 시 정리
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """큐에 남은 로그를 모두 출력하고 listener 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -1,48 +1,71 @@
 import asyncio
-import json
 import logging
+import os
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 from fastapi import FastAPI, Request, Depends, HTTPException
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.compression import CompressionMiddleware
 from app.config import settings
 from app.database import init_db, get_db
+from app.logging_config import setup_logging
 from app.models import Task, Comic
-from app.routers import comic
+from app.routers import comic, debug
+from app.services.comic_service import comic_service
+from app.services.image_cache_service import image_cache_service
+from app.services.leader_service import leader_election
+from app.services.lifecycle_service import lifecycle_service
+from app.services.loop_monitor_service import loop_monitor
+from app.services.providers import get_llm_service
+from app.services.publish_service import publish_service
 from app.services.telegram_service import telegram_service
+from app.services.upload_service import UploadBodyLimitMiddleware
+from app.static_assets import AssetStaticFiles, static_assets
 
+setup_logging()
 logger = logging.getLogger(__name__)
 
 
 async def _health_check_loop() -> None:
-    """20분마다 헬스체크 알림"""
+    """20분마다 헬스체크 알림 (멀티 워커에서는 리더만)"""
     while True:
         await asyncio.sleep(20 * 60)
-        telegram_service.notify_health_check()
+        if leader_election.is_leader:
+            telegram_service.notify_health_check()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 시작/종료 이벤트"""
+    await loop_monitor.start()
     # dev 환경에서만 테이블 자동 생성 (Spring ddl-auto=update와 유사)
     if settings.env == "DEV":
         await init_db()
         logger.info("Dev mode: Database tables auto-created")
-    telegram_service.notify_server_started()
+    await leader_election.start()
+    if leader_election.is_leader:
+        telegram_service.notify_server_started()
+    # 컨텍스트 캐시를 쓰면 시작 시 LLM 서비스를 만들어 캐시 생성 (아니면 첫 요청 때 생성)
+    if settings.gemini_context_cache_enabled:
+        await get_llm_service().start()
+    # 이전 프로세스에서 중단된 태스크 재개/실패 처리
+    await lifecycle_service.start(comic_service.resume_comic)
     health_task = asyncio.create_task(_health_check_loop())
     yield
     health_task.cancel()
+    # 새 작업 접수 중단 후 진행 중인 파이프라인 대기
+    await lifecycle_service.drain()
+    await image_cache_service.flush()
+    await leader_election.stop()
+    if llm_service := get_llm_service.peek():
+        await llm_service.stop()
+    await loop_monitor.stop()
 
 
 app = FastAPI(
@@ -67,43 +90,61 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 정적 파일 및 템플릿 설정
-app.mount("/static", StaticFiles(directory=settings.static_dir), name="static")
-templates = Jinja2Templates(directory="app/templates")
+# 응답 압축
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compress_min_size,
+    compresslevel=settings.gzip_level,
+    brotli_quality=settings.brotli_quality,
+)
+
+# 첨부 이미지 업로드 요청 크기 제한 (multipart 파싱 중 받은 바이트 기준, Content-Length가 있으면 먼저 거절)
+UPLOAD_PATHS = {"/generate-with-images"}
+UPLOAD_FORM_OVERHEAD = 256 * 1024  # 회의 텍스트 + multipart 경계 여유분
+app.add_middleware(
+    UploadBodyLimitMiddleware,
+    paths=UPLOAD_PATHS,
+    max_bytes=settings.upload_max_request_bytes + UPLOAD_FORM_OVERHEAD,
+)
+
+
+# 정적 파일 설정 (빌드된 해시 경로는 immutable 캐시)
+app.mount("/static", AssetStaticFiles(directory=settings.static_dir), name="static")
+if settings.storage_backend == "local":
+    # 로컬 저장소 이미지 서빙 (LocalStorage가 /media/... URL 반환)
+    os.makedirs(settings.local_storage_dir, exist_ok=True)
+    app.mount("/media", StaticFiles(directory=settings.local_storage_dir), name="media")
+INDEX_TEMPLATE = Path("app/templates/index.html")
 
 # 라우터 등록
 app.include_router(comic.router)
+app.include_router(debug.router)
 
 
 @app.get("/")
-async def index(request: Request):
-    """메인 페이지"""
-    return templates.TemplateResponse("index.html", {"request": request})
+async def index():
+    """메인 페이지 (정적 파일 경로는 빌드된 해시 경로로 치환)"""
+    return HTMLResponse(static_assets.page(INDEX_TEMPLATE))
 
 
 @app.get("/view/{task_id}")
-async def view_result(request: Request, task_id: str, db: AsyncSession = Depends(get_db)):
-    """결과 페이지 (HTML)"""
+async def view_result(task_id: str, db: AsyncSession = Depends(get_db)):
+    """결과 페이지 (HTML, 완성된 결과는 발행해 둔 페이지를 그대로 응답)"""
+    published = publish_service.static_path(task_id)
+    if published:
+        return FileResponse(published, media_type="text/html", headers={"Cache-Control": "no-cache"})
+
     task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
+    if task.published_url and settings.result_publish_target == "storage":
+        return RedirectResponse(task.published_url)
 
-    result = await db.execute(select(Comic).where(Comic.task_id == task_id))
+    result = await db.execute(select(Comic).where(Comic.task_id == task_id).order_by(Comic.part_number))
     comics = result.scalars().all()
-
-    # 템플릿용 데이터 변환
-    comics_data = []
-    for comic in comics:
-        panels = json.loads(comic.panels_json) if comic.panels_json else []
-        image_paths = json.loads(comic.image_paths) if comic.image_paths else []
-        comics_data.append({
-            "part_number": comic.part_number,
-            "panels": panels,
-            "image_paths": image_paths,
-        })
-
-    return templates.TemplateResponse("result.html", {
-        "request": request,
-        "task": task,
-        "comics": comics_data,
-    })
+    if task.status == "completed":
+        # 발행 기능 이전에 완성됐거나 발행에 실패한 결과는 처음 열 때 발행
+        await publish_service.publish(db, task, comics)
+        if task.published_url and settings.result_publish_target == "storage":
+            return RedirectResponse(task.published_url)
+    return HTMLResponse(publish_service.render(task, comics))
@@ -1,3 +1,3 @@
-from .models import Task, Comic, Visitor
+from .models import Task, Comic, Visitor, GeminiUsage, ImageCacheEntry, Lease
 
-__all__ = ["Task", "Comic", "Visitor"]
+__all__ = ["Task", "Comic", "Visitor", "GeminiUsage", "ImageCacheEntry", "Lease"]
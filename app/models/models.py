@@ -7,11 +7,51 @@ KST = timezone(timedelta(hours=9))
 def now_kst() -> datetime:
     return datetime.now(KST).replace(tzinfo=None)
 
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Integer, Boolean, Float
+from sqlalchemy import JSON, Column, String, Text, DateTime, ForeignKey, Integer, Boolean, Float
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import relationship
 
+from app import json_codec
+from app.config import settings
 from app.database import Base
 
+NATIVE_JSON_DIALECTS = ("postgresql", "mysql")
+
+
+class JSONText(TypeDecorator):
+    """JSON 값 컬럼 (DB에서 읽을 때 1회 파싱, 쓸 때 1회 직렬화)
+
+    기본은 Text에 JSON 문자열로 저장해서 기존 데이터와 그대로 호환된다.
+    json_native_columns가 켜져 있고 DB가 JSON 타입을 지원하면 네이티브 컬럼(MySQL JSON / PostgreSQL JSONB)을 쓰고
+    직렬화는 엔진의 json_serializer(같은 코덱)에 맡긴다.
+    값은 list/dict로 다루며, 변경은 제자리 수정 대신 새 객체를 대입해야 UPDATE된다.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    @staticmethod
+    def _native(dialect) -> bool:
+        return settings.json_native_columns and dialect.name in NATIVE_JSON_DIALECTS
+
+    def load_dialect_impl(self, dialect):
+        if not self._native(dialect):
+            return super().load_dialect_impl(dialect)
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB(none_as_null=True))
+        return dialect.type_descriptor(JSON(none_as_null=True))
+
+    def process_bind_param(self, value, dialect):
+        if value is None or self._native(dialect):
+            return value
+        return json_codec.dumps(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None or self._native(dialect):
+            return value
+        return json_codec.loads(value)
+
 
 def generate_uuid() -> str:
     return uuid7str()
@@ -40,18 +80,24 @@ class Task(Base):
 
     id = Column(String(36), primary_key=True, default=generate_uuid)
     visitor_id = Column(String(36), ForeignKey("visitors.id"), nullable=True)
-    status = Column(String(20), default="pending")  # pending | processing | completed | failed | rejected
+    status = Column(String(20), default="pending")  # pending | processing | preview | completed | failed | rejected
     meeting_text = Column(Text, nullable=False)
     is_valid = Column(Boolean, default=True)
     reject_reason = Column(Text, nullable=True)
     error_message = Column(Text, nullable=True)
     character_sheet_url = Column(Text, nullable=True)  # 캐릭터 시트 이미지 URL (내부용)
-    meeting_img = Column(Text, nullable=True)  # 첨부 이미지 S3 URL (JSON array)
+    meeting_img = Column(JSONText, nullable=True)  # 첨부 이미지 URL 목록
+    image_tier = Column(String(30), nullable=True)  # 에피소드 이미지에 사용된 라우팅 tier (pro-2K | pro-1K | flash, 섞이면 콤마 구분)
     # 소요시간 (초)
     scenario_duration = Column(Float, nullable=True)  # 시나리오 생성
     character_sheet_duration = Column(Float, nullable=True)  # 캐릭터 시트 생성
     episode_image_duration = Column(Float, nullable=True)  # 에피소드 이미지 생성
     total_duration = Column(Float, nullable=True)  # 총 소요시간
+    trace_json = Column(Text, nullable=True)  # 단계별 span 타임라인 (압축 JSON)
+    published_url = Column(Text, nullable=True)  # 저장소(storage)에 발행된 결과 페이지 URL
+    # 파이프라인을 실행 중인 워커 (멀티 워커에서 중단된 태스크 판별용)
+    worker_id = Column(String(64), nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True, index=True)
     created_at = Column(DateTime, default=now_kst)
     updated_at = Column(DateTime, default=now_kst, onupdate=now_kst)
 
@@ -67,10 +113,53 @@ class Comic(Base):
     id = Column(String(36), primary_key=True, default=generate_uuid)
     task_id = Column(String(36), ForeignKey("tasks.id"), nullable=False)
     part_number = Column(Integer, default=1)
-    panels_json = Column(Text, nullable=True)  # 4컷 시나리오 JSON
-    image_paths = Column(Text, nullable=True)  # 이미지 경로 JSON array
+    panels_json = Column(JSONText, nullable=True)  # 4컷 시나리오 (PanelScenario dict 목록)
+    image_paths = Column(JSONText, nullable=True)  # 이미지 경로 목록
+    image_tiers = Column(JSONText, nullable=True)  # 이미지별 품질 목록 (preview | final)
     created_at = Column(DateTime, default=now_kst)
 
     task = relationship("Task", back_populates="comics")
 
 
+class Lease(Base):
+    """워커 간 리더 선출용 lease"""
+
+    __tablename__ = "leases"
+
+    name = Column(String(50), primary_key=True)
+    holder = Column(String(64), nullable=False)  # WORKER_ID
+    expires_at = Column(DateTime, nullable=False)
+
+
+class ImageCacheEntry(Base):
+    """생성된 이미지 캐시 (프롬프트 + 레퍼런스 + 모델 + 이미지 설정 해시 → 이미지 URL)"""
+
+    __tablename__ = "image_cache"
+
+    key = Column(String(64), primary_key=True)  # sha256 hex
+    image_path = Column(Text, nullable=False)
+    model = Column(String(50), nullable=False)
+    image_size = Column(String(10), nullable=True)
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime, default=now_kst)
+    last_used_at = Column(DateTime, default=now_kst, index=True)  # LRU 정리 기준
+
+
+class GeminiUsage(Base):
+    """Gemini 호출별 토큰 사용량"""
+
+    __tablename__ = "gemini_usages"
+
+    id = Column(String(36), primary_key=True, default=generate_uuid)
+    task_id = Column(String(36), ForeignKey("tasks.id"), nullable=True, index=True)
+    call_type = Column(String(30), nullable=False)  # validate | scenario | character_sheet | episode | image
+    model = Column(String(50), nullable=False)
+    prompt_tokens = Column(Integer, default=0)
+    cached_tokens = Column(Integer, default=0)
+    output_tokens = Column(Integer, default=0)
+    thoughts_tokens = Column(Integer, default=0)
+    image_tokens = Column(Integer, default=0)  # 입력 + 출력 이미지 토큰
+    total_tokens = Column(Integer, default=0)
+    latency = Column(Float, nullable=True)  # 성공한 시도의 응답 시간 (초)
+    attempts = Column(Integer, default=1)
+    created_at = Column(DateTime, default=now_kst, index=True)
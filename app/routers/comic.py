@@ -1,66 +1,134 @@
 import asyncio
 import json
 import logging
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Form, File, UploadFile, Request
+from typing import TYPE_CHECKING, Optional
+from fastapi import APIRouter, Depends, HTTPException, Form, File, UploadFile, Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-import httpx
 
+from app.config import settings
 from app.database import get_db, async_session
+from app.json_codec import FastJSONResponse
+from app.logging_config import bind_visitor
 from app.models import Task, Comic, Visitor
-from app.schemas import TaskCreate, TaskStatus, TaskResponse, ComicResponse, PanelScenario, GenerateResponse, TaskHistoryItem, HistoryResponse
-from app.services.comic_service import comic_service
-from app.services.image_service import image_service
-from app.services.llm_service import llm_service
+from app.models.models import now_kst
+from app.schemas import ValidationResult, TaskCreate, TaskStatus, TaskResponse, ComicResponse, GenerateResponse, TaskHistoryItem, HistoryResponse, EpisodeRegenerateRequest, EpisodeRegenerateResponse
+from app.services.comic_service import comic_service, get_friendly_error_message
+from app.services.leader_service import WORKER_ID
+from app.services.lifecycle_service import lifecycle_service, require_accepting, spawn_background
+from app.services.providers import get_attachment_service, get_llm_service, get_storage
 from app.services.telegram_service import telegram_service
+from app.services.trace_service import trace_service
+from app.services.upload_service import ImageIngestor, UploadLimitError
 from app.utils import generate_nickname
+
+if TYPE_CHECKING:
+    from app.services.attachment_service import AttachmentService
+    from app.services.llm_service import LLMServiceInterface
+    from app.services.storage_service import StorageInterface
+    from app.services.upload_service import SpooledImage
+
 logger = logging.getLogger(__name__)
 
 
-async def fetch_image_from_url(url: str) -> bytes | None:
-    """외부 URL에서 이미지를 다운로드"""
+async def _fetch_stored_image(storage: "StorageInterface", url: str) -> bytes | None:
+    """저장소에 올려 둔 첨부 이미지 다시 받기 (실패하면 None)"""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, follow_redirects=True)
-            if response.status_code == 200:
-                content_type = response.headers.get("content-type", "")
-                if "image" in content_type or url.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
-                    return response.content
-            logger.warning(f"이미지 다운로드 실패: {url} (status={response.status_code})")
+        return await storage.fetch(url)
     except Exception as e:
         logger.warning(f"이미지 다운로드 에러: {url} ({e})")
-    return None
+        return None
+
 
+async def _upload_meeting_image(storage: "StorageInterface", image: "SpooledImage") -> str:
+    with image.open() as file:
+        return await storage.upload_file(file, prefix="meeting-img")
 
-async def _upload_meeting_images(task_id: str, image_bytes_list: list[bytes]) -> None:
-    """첨부 이미지들을 S3에 업로드하고 Task.meeting_img 업데이트 (비동기, fire-and-forget)"""
+
+async def _upload_meeting_images(
+    storage: "StorageInterface", task_id: str, images: list["SpooledImage"]
+) -> None:
+    """첨부 이미지들을 저장소에 업로드하고 Task.meeting_img 업데이트 (비동기, fire-and-forget)"""
     try:
-        # 병렬로 이미지 업로드
-        upload_tasks = [
-            image_service.upload_bytes_to_s3(img_bytes, prefix="meeting-img")
-            for img_bytes in image_bytes_list
-        ]
-        image_urls = await asyncio.gather(*upload_tasks)
+        # 병렬로 이미지 업로드 (임시 파일에서 바로 스트리밍)
+        image_urls = await asyncio.gather(*[_upload_meeting_image(storage, image) for image in images])
 
         # 새 세션으로 Task 업데이트
         async with async_session() as db:
             task = await db.get(Task, task_id)
             if task:
-                task.meeting_img = json.dumps(image_urls)
+                task.meeting_img = image_urls
                 await db.commit()
                 logger.info(f"Task {task_id[:8]} meeting_img 업데이트 완료: {len(image_urls)}개")
     except Exception as e:
         logger.warning(f"meeting_img 업로드 실패 (task={task_id[:8]}): {e}")
 
+
+async def _close_images_after(ingestor: ImageIngestor, uploads: list[asyncio.Task]) -> None:
+    """저장소 업로드가 끝난 뒤 임시 이미지 정리"""
+    try:
+        if uploads:
+            await asyncio.wait(uploads)
+    finally:
+        ingestor.close()
+
+
+def _read_images(images: list["SpooledImage"]) -> list[bytes]:
+    return [image.read() for image in images]
+
+
+async def _fail_before_spawn(
+    db: AsyncSession, task: Task, error: BaseException, attachment_service: "AttachmentService" = None
+) -> None:
+    """검증/시나리오 시작 실패: trace와 첨부 핸들 정리 후 태스크 실패 처리 (요청 취소면 정리만)"""
+    trace_json = trace_service.finish(task.id)
+    if attachment_service:
+        spawn_background(attachment_service.release(task.id))
+    if isinstance(error, Exception):
+        logger.error(f"[Task {task.id[:8]}] 입력 검증 실패: {type(error).__name__}: {error}")
+        task.status = "failed"
+        task.error_message = get_friendly_error_message(error)
+        task.trace_json = trace_json
+        await db.commit()
+
+
+async def _start_validation_and_scenario(
+    llm_service: "LLMServiceInterface", meeting_text: str, images: list = None
+) -> tuple[ValidationResult, asyncio.Future]:
+    """설정된 LLM 모드로 검증 + 시나리오 생성 시작
+
+    - parallel: 검증/시나리오를 병렬로 시작하고 검증 결과만 기다림 (검증이 실패하면 시나리오도 취소)
+    - single: 통합 스키마 1회 호출 후 시나리오는 완료된 Future로 전달
+    """
+    if settings.llm_mode == "single":
+        result = await llm_service.validate_and_analyze(meeting_text, images)
+        validation = ValidationResult(
+            is_valid=result.is_valid,
+            reject_reason=result.reject_reason,
+            messages=result.messages,
+        )
+        scenario_future = asyncio.get_running_loop().create_future()
+        scenario_future.set_result(result.episodes)
+        return validation, scenario_future
+
+    validation_task = asyncio.create_task(llm_service.validate_input(meeting_text, images))
+    scenario_task = asyncio.create_task(llm_service.analyze_meeting(meeting_text, images))
+    try:
+        return await validation_task, scenario_task
+    except BaseException:
+        validation_task.cancel()
+        scenario_task.cancel()
+        raise
+
+
 router = APIRouter(tags=["comic"])
 
 
-@router.post("/generate", response_model=GenerateResponse)
+@router.post("/generate", response_model=GenerateResponse, dependencies=[Depends(require_accepting)])
 async def generate_comic(
     request: TaskCreate,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
+    llm_service: "LLMServiceInterface" = Depends(get_llm_service),
 ):
     """만화 생성 요청 (입력 검증 포함)"""
     # 1. Visitor 조회
@@ -71,53 +139,62 @@ async def generate_comic(
         if visitor:
             visitor_id = visitor.id
             nickname = visitor.nickname
+    bind_visitor(visitor_id)
 
     # 2. Task 먼저 생성 (validation 전에 저장)
     task = Task(
         visitor_id=visitor_id,
         meeting_text=request.meeting_text,
         status="pending",
+        worker_id=WORKER_ID,
+        heartbeat_at=now_kst(),
     )
     db.add(task)
     await db.commit()
     await db.refresh(task)
+    trace_service.start(task.id)
 
-    # 3. 텔레그램 알림 (validation 전에 알림)
-    telegram_service.notify_task_created(nickname, request.meeting_text)
-
-    # 4. Validation + 시나리오 생성 병렬 시작
-    validation_task = asyncio.create_task(llm_service.validate_input(request.meeting_text))
-    scenario_task = asyncio.create_task(llm_service.analyze_meeting(request.meeting_text))
+    # 검증이 길어져도 sweep이 중단된 태스크로 보지 않도록 spawn까지 heartbeat 유지
+    with lifecycle_service.admitting(task.id):
+        # 3. 텔레그램 알림 (validation 전에 알림)
+        telegram_service.notify_task_created(nickname, request.meeting_text)
 
-    # 5. Validation 결과 대기
-    validation = await validation_task
+        # 4-5. Validation + 시나리오 생성 시작, Validation 결과 대기
+        try:
+            validation, scenario_task = await _start_validation_and_scenario(llm_service, request.meeting_text)
+        except BaseException as e:
+            await _fail_before_spawn(db, task, e)
+            if isinstance(e, Exception):
+                raise HTTPException(status_code=503, detail=task.error_message)
+            raise
+
+        # 6. Task 업데이트 (validation 결과 반영)
+        task.is_valid = validation.is_valid
+        task.reject_reason = validation.reject_reason
+        if not validation.is_valid:
+            task.status = "rejected"
+            telegram_service.send_message(f"{nickname}님의 작업 rejected 됨\n{task.reject_reason}")
+            # Validation 실패 시 시나리오 task 취소
+            scenario_task.cancel()
+            task.trace_json = trace_service.finish(task.id)
+        await db.commit()
+        await db.refresh(task)
 
-    # 6. Task 업데이트 (validation 결과 반영)
-    task.is_valid = validation.is_valid
-    task.reject_reason = validation.reject_reason
-    if not validation.is_valid:
-        task.status = "rejected"
-        telegram_service.send_message(f"{nickname}님의 작업 rejected 됨\n{task.reject_reason}")
-        # Validation 실패 시 시나리오 task 취소
-        scenario_task.cancel()
-    await db.commit()
-    await db.refresh(task)
+        if not validation.is_valid:
+            raise HTTPException(
+                status_code=400,
+                detail=validation.reject_reason or "만화로 변환할 수 없는 입력입니다.",
+            )
 
-    if not validation.is_valid:
-        raise HTTPException(
-            status_code=400,
-            detail=validation.reject_reason or "만화로 변환할 수 없는 입력입니다.",
+        # 7. 백그라운드에서 시나리오 결과 대기 후 이미지 생성
+        task_id = task.id
+        lifecycle_service.spawn(
+            task_id,
+            lambda session: comic_service.create_comic_from_scenario(
+                session, task_id, request.meeting_text, scenario_task
+            ),
         )
 
-    # 7. 백그라운드에서 시나리오 결과 대기 후 이미지 생성
-    background_tasks.add_task(
-        comic_service.create_comic_from_scenario,
-        db,
-        task.id,
-        request.meeting_text,
-        scenario_task,
-    )
-
     return GenerateResponse(
         task=TaskStatus(
             id=task.id,
@@ -131,14 +208,16 @@ async def generate_comic(
     )
 
 
-@router.post("/generate-with-images", response_model=GenerateResponse)
+@router.post("/generate-with-images", response_model=GenerateResponse, dependencies=[Depends(require_accepting)])
 async def generate_comic_with_images(
-    background_tasks: BackgroundTasks,
     meeting_text: str = Form(""),
     visitor_id: Optional[str] = Form(None),
     images: list[UploadFile] = File(default=[]),
     image_urls: str = Form(""),  # JSON array of URLs
     db: AsyncSession = Depends(get_db),
+    llm_service: "LLMServiceInterface" = Depends(get_llm_service),
+    storage: "StorageInterface" = Depends(get_storage),
+    attachment_service: "AttachmentService" = Depends(get_attachment_service),
 ):
     """만화 생성 요청 (이미지 포함)"""
     # 1. Visitor 조회
@@ -149,88 +228,111 @@ async def generate_comic_with_images(
         if visitor:
             db_visitor_id = visitor.id
             nickname = visitor.nickname
+    bind_visitor(db_visitor_id)
 
-    # 2. 이미지 파일 읽기
-    image_bytes_list = []
-    for img in images:
-        if img.filename:
-            content = await img.read()
-            if content:
-                image_bytes_list.append(content)
-
-    # 2-1. 외부 URL 이미지 다운로드
+    # 2. 이미지 개수 제한 (읽기 전에 업로드 파일 개수로 먼저 거절, URL은 실제로 받은 것만 셈)
+    uploads = [img for img in images if img.filename]
+    urls = []
     if image_urls:
         try:
-            urls = json.loads(image_urls)
-            if isinstance(urls, list):
-                download_tasks = [fetch_image_from_url(url) for url in urls[:5]]  # 최대 5개
-                results = await asyncio.gather(*download_tasks)
-                for img_bytes in results:
-                    if img_bytes:
-                        image_bytes_list.append(img_bytes)
+            parsed = json.loads(image_urls)
+            if isinstance(parsed, list):
+                urls = parsed[:5]  # 최대 5개
         except json.JSONDecodeError:
             logger.warning(f"image_urls 파싱 실패: {image_urls}")
 
-    # 2-1. 이미지 개수 제한 (최대 3장)
-    if len(image_bytes_list) > 3:
+    if len(uploads) > settings.upload_max_images:
         raise HTTPException(
             status_code=400,
-            detail="이미지는 3장까지만 넣을 수 있어요 ㅠㅠ 좀만 줄여주세요!",
+            detail=f"이미지는 {settings.upload_max_images}장까지만 넣을 수 있어요 ㅠㅠ 좀만 줄여주세요!",
         )
 
-    # 3. Task 먼저 생성 (validation 전에 저장)
-    task = Task(
-        visitor_id=db_visitor_id,
-        meeting_text=meeting_text,
-        status="pending",
-    )
-    db.add(task)
-    await db.commit()
-    await db.refresh(task)
-
-    # 3-1. 이미지가 있으면 S3 업로드 비동기 시작 (병목 방지)
-    if image_bytes_list:
-        asyncio.create_task(
-            _upload_meeting_images(task.id, image_bytes_list)
+    # 2-1. 이미지 파일 복사 + 외부 URL 이미지 다운로드 (청크 단위, 크기/개수 제한 초과 시 즉시 중단)
+    # 이미지는 임시 파일로 들고 있다가 저장소/첨부 업로드가 끝나면 정리
+    ingestor = ImageIngestor()
+    try:
+        for upload in uploads:
+            await ingestor.add_upload(upload)
+        if urls:
+            await ingestor.add_urls(urls)
+
+        # 3. Task 먼저 생성 (validation 전에 저장)
+        task = Task(
+            visitor_id=db_visitor_id,
+            meeting_text=meeting_text,
+            status="pending",
+            worker_id=WORKER_ID,
+            heartbeat_at=now_kst(),
         )
+        db.add(task)
+        await db.commit()
+        await db.refresh(task)
+    except BaseException as e:
+        ingestor.close()
+        if isinstance(e, UploadLimitError):
+            raise HTTPException(status_code=e.status_code, detail=e.message)
+        raise
+    trace_service.start(task.id)
+
+    # 검증이 길어져도 sweep이 중단된 태스크로 보지 않도록 spawn까지 heartbeat 유지
+    with lifecycle_service.admitting(task.id):
+        uploads = []
+        try:
+            # 3-1. 이미지가 있으면 저장소 업로드 비동기 시작 (병목 방지)
+            if ingestor.images:
+                uploads.append(spawn_background(_upload_meeting_images(storage, task.id, ingestor.images)))
+
+            # 4. 텔레그램 알림 (validation 전에 알림)
+            telegram_service.notify_task_created(nickname, meeting_text)
+
+            # 5. 이미지는 한 번만 전송: Validation + 시나리오 생성이 한 번 업로드한 핸들을 같이 참조
+            # (single 모드는 호출이 1번뿐이라 업로드 없이 inline, 임시 파일 읽기는 스레드에서)
+            if settings.llm_mode == "single":
+                image_parts = await asyncio.get_running_loop().run_in_executor(None, _read_images, ingestor.images)
+            else:
+                image_parts = await attachment_service.upload(task.id, ingestor.images)
+        finally:
+            # 저장소 업로드는 응답 후에도 계속되므로 끝난 뒤 임시 파일 정리
+            spawn_background(_close_images_after(ingestor, uploads))
+
+        # 6. Validation 결과 대기
+        try:
+            validation, scenario_task = await _start_validation_and_scenario(llm_service, meeting_text, image_parts)
+        except BaseException as e:
+            await _fail_before_spawn(db, task, e, attachment_service)
+            if isinstance(e, Exception):
+                raise HTTPException(status_code=503, detail=task.error_message)
+            raise
+
+        # 7. Task 업데이트 (validation 결과 반영)
+        task.is_valid = validation.is_valid
+        task.reject_reason = validation.reject_reason
+        if not validation.is_valid:
+            task.status = "rejected"
+            telegram_service.send_message(f"{nickname}님의 작업 rejected 됨\n{task.reject_reason}")
+            # Validation 실패 시 시나리오 task 취소
+            scenario_task.cancel()
+            task.trace_json = trace_service.finish(task.id)
+            spawn_background(attachment_service.release(task.id))
+        await db.commit()
+        await db.refresh(task)
 
-    # 4. 텔레그램 알림 (validation 전에 알림)
-    telegram_service.notify_task_created(nickname, meeting_text)
-
-    # 5. Validation + 시나리오 생성 병렬 시작 (이미지 포함)
-    validation_task = asyncio.create_task(llm_service.validate_input(meeting_text, image_bytes_list))
-    scenario_task = asyncio.create_task(llm_service.analyze_meeting(meeting_text, image_bytes_list))
-
-    # 6. Validation 결과 대기
-    validation = await validation_task
-
-    # 7. Task 업데이트 (validation 결과 반영)
-    task.is_valid = validation.is_valid
-    task.reject_reason = validation.reject_reason
-    if not validation.is_valid:
-        task.status = "rejected"
-        telegram_service.send_message(f"{nickname}님의 작업 rejected 됨\n{task.reject_reason}")
-        # Validation 실패 시 시나리오 task 취소
-        scenario_task.cancel()
-    await db.commit()
-    await db.refresh(task)
+        if not validation.is_valid:
+            raise HTTPException(
+                status_code=400,
+                detail=validation.reject_reason or "만화로 변환할 수 없는 입력입니다.",
+            )
 
-    if not validation.is_valid:
-        raise HTTPException(
-            status_code=400,
-            detail=validation.reject_reason or "만화로 변환할 수 없는 입력입니다.",
+        # 8. 백그라운드에서 시나리오 결과 대기 후 이미지 생성
+        # (첨부 이미지는 넘기지 않음: 시나리오 task만 참조하므로 시나리오 단계가 끝나면 해제됨)
+        task_id = task.id
+        lifecycle_service.spawn(
+            task_id,
+            lambda session: comic_service.create_comic_from_scenario(
+                session, task_id, meeting_text, scenario_task
+            ),
         )
 
-    # 8. 백그라운드에서 시나리오 결과 대기 후 이미지 생성 (이미지 포함)
-    background_tasks.add_task(
-        comic_service.create_comic_from_scenario,
-        db,
-        task.id,
-        meeting_text,
-        scenario_task,
-        image_bytes_list,
-    )
-
     return GenerateResponse(
         task=TaskStatus(
             id=task.id,
@@ -252,7 +354,7 @@ def get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
 
 
-@router.post("/visitor")
+@router.post("/visitor", response_class=FastJSONResponse)
 async def get_or_create_visitor(
     request: Request,
     id: str = "",
@@ -291,11 +393,11 @@ async def get_history(visitor_id: str, db: AsyncSession = Depends(get_db)):
     if not visitor:
         return HistoryResponse(tasks=[])
 
-    # 최근 작업 조회 (completed, processing, pending만)
+    # 최근 작업 조회 (completed, preview, processing, pending만)
     result = await db.execute(
         select(Task)
         .where(Task.visitor_id == visitor_id)
-        .where(Task.status.in_(["completed", "processing", "pending"]))
+        .where(Task.status.in_(["completed", "preview", "processing", "pending"]))
         .order_by(Task.created_at.desc())
         .limit(20)
     )
@@ -305,15 +407,13 @@ async def get_history(visitor_id: str, db: AsyncSession = Depends(get_db)):
     for task in tasks:
         # 첫 번째 이미지 URL 가져오기
         thumbnail_url = None
-        if task.status == "completed":
+        if task.status in ("completed", "preview"):
             comic_result = await db.execute(
                 select(Comic).where(Comic.task_id == task.id).limit(1)
             )
             comic = comic_result.scalar_one_or_none()
             if comic and comic.image_paths:
-                image_paths = json.loads(comic.image_paths)
-                if image_paths:
-                    thumbnail_url = image_paths[0]
+                thumbnail_url = comic.image_paths[0]
 
         history_items.append(
             TaskHistoryItem(
@@ -328,6 +428,93 @@ async def get_history(visitor_id: str, db: AsyncSession = Depends(get_db)):
     return HistoryResponse(tasks=history_items)
 
 
+@router.post("/retry/{task_id}", response_model=TaskStatus, dependencies=[Depends(require_accepting)])
+async def retry_task(
+    task_id: str,
+    db: AsyncSession = Depends(get_db),
+    storage: "StorageInterface" = Depends(get_storage),
+):
+    """실패한 작업 재시도 (저장된 시나리오/캐릭터 시트가 있으면 빠진 에피소드만 생성)"""
+    task = await db.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if task.status != "failed":
+        raise HTTPException(status_code=409, detail="실패한 작업만 다시 시도할 수 있어요.")
+
+    comic_result = await db.execute(select(Comic).where(Comic.task_id == task_id).limit(1))
+    comic = comic_result.scalar_one_or_none()
+
+    task.status = "pending"
+    task.error_message = None
+    await db.commit()
+    await db.refresh(task)
+    trace_service.start(task.id)
+
+    if comic and comic.panels_json:
+        lifecycle_service.spawn(task_id, lambda session: comic_service.resume_comic(session, task_id))
+    else:
+        # 시나리오 단계에서 실패: 저장된 첨부 이미지를 다시 받아 전체 파이프라인 재실행
+        images = []
+        if task.meeting_img:
+            results = await asyncio.gather(*[_fetch_stored_image(storage, url) for url in task.meeting_img])
+            images = [img for img in results if img]
+        meeting_text = task.meeting_text
+        lifecycle_service.spawn(
+            task_id,
+            lambda session: comic_service.create_comic(session, task_id, meeting_text, images),
+        )
+
+    return TaskStatus(
+        id=task.id,
+        status=task.status,
+        error_message=task.error_message,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+    )
+
+
+@router.post(
+    "/tasks/{task_id}/episodes/{episode_number}/regenerate",
+    response_model=EpisodeRegenerateResponse,
+    dependencies=[Depends(require_accepting)],
+)
+async def regenerate_episode(
+    task_id: str,
+    episode_number: int,
+    request: EpisodeRegenerateRequest = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """완성된 만화에서 에피소드 1개만 다시 생성 (이미지 호출 1회)"""
+    task = await db.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    # 실패한 태스크는 /retry나 sweep이 이어서 생성하며 컷을 덮어쓸 수 있으므로 완성된 만화만
+    if task.status != "completed" or task_id in lifecycle_service.in_flight:
+        raise HTTPException(status_code=409, detail="만화 생성이 끝난 뒤에 다시 그릴 수 있어요.")
+
+    comic_result = await db.execute(select(Comic).where(Comic.task_id == task_id).limit(1))
+    comic = comic_result.scalar_one_or_none()
+    if not comic or not comic.panels_json:
+        raise HTTPException(status_code=404, detail="Comic not found")
+
+    panel_count = len(comic.panels_json)
+    if not 1 <= episode_number <= panel_count:
+        raise HTTPException(status_code=400, detail=f"에피소드 번호는 1~{panel_count} 사이여야 해요.")
+
+    prompt_tweak = request.prompt_tweak if request else None
+    try:
+        image_path = await comic_service.regenerate_episode(db, task, comic, episode_number - 1, prompt_tweak)
+    except Exception as e:
+        logger.error(f"[Task {task_id[:8]}] {episode_number}번 에피소드 재생성 실패: {e}")
+        raise HTTPException(status_code=503, detail=get_friendly_error_message(e))
+
+    return EpisodeRegenerateResponse(
+        task_id=task_id,
+        episode_number=episode_number,
+        image_path=image_path,
+    )
+
+
 @router.get("/status/{task_id}", response_model=TaskStatus)
 async def get_status(task_id: str, db: AsyncSession = Depends(get_db)):
     """작업 상태 조회"""
@@ -356,17 +543,14 @@ async def get_result(task_id: str, db: AsyncSession = Depends(get_db)):
 
     comic_responses = []
     for comic in comics:
-        panels_data = json.loads(comic.panels_json) if comic.panels_json else []
-        panels = [PanelScenario(**p) for p in panels_data]
-        image_paths = json.loads(comic.image_paths) if comic.image_paths else []
-
         comic_responses.append(
             ComicResponse(
                 id=comic.id,
                 task_id=comic.task_id,
                 part_number=comic.part_number,
-                panels=panels,
-                image_paths=image_paths,
+                panels=comic.panels_json or [],
+                image_paths=comic.image_paths or [],
+                image_tiers=comic.image_tiers or [],
                 created_at=comic.created_at,
             )
         )
@@ -0,0 +1,205 @@
+import secrets
+from datetime import timedelta
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import json_codec
+from app.json_codec import FastJSONResponse
+from app.config import settings
+from app.database import get_db
+from app.models import Task, GeminiUsage
+from app.models.models import now_kst
+from app.schemas import (
+    TraceResponse,
+    UsageRecord,
+    TaskUsageResponse,
+    UsageSummaryItem,
+    ExpensiveTaskItem,
+    UsageReportResponse,
+)
+from app.services.leader_service import WORKER_ID, leader_election
+from app.services.lifecycle_service import lifecycle_service
+from app.services.loop_monitor_service import loop_monitor
+from app.services.metrics_service import metrics_service
+from app.services.trace_service import trace_service, build_waterfall
+
+LOOPBACK_HOSTS = {"127.0.0.1", "::1", "localhost"}
+
+
+def require_admin(request: Request, x_admin_token: str = Header(None)) -> None:
+    """관리 요청 확인 (ADMIN_TOKEN이 있으면 X-Admin-Token 일치, 없으면 서버 로컬 요청만)"""
+    if settings.admin_token:
+        if x_admin_token and secrets.compare_digest(x_admin_token, settings.admin_token):
+            return
+    elif request.client and request.client.host in LOOPBACK_HOSTS:
+        return
+    raise HTTPException(status_code=403, detail="Forbidden")
+
+
+# 태스크 ID/트레이스/스택 등 내부 정보를 보여주므로 모든 debug 엔드포인트는 관리 요청만
+router = APIRouter(prefix="/debug", tags=["debug"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/trace/{task_id}", response_model=TraceResponse)
+async def get_trace(task_id: str, db: AsyncSession = Depends(get_db)):
+    """태스크별 단계/외부 호출 타임라인 (워터폴)"""
+    task = await db.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    # 진행 중이면 메모리의 Trace, 끝났으면 DB에 저장된 Trace 사용
+    active = trace_service.get_active(task_id)
+    if active is not None:
+        rows = active.to_compact()
+    elif task.trace_json:
+        rows = json_codec.loads(task.trace_json)
+    else:
+        rows = []
+
+    waterfall = build_waterfall(rows)
+    return TraceResponse(
+        task_id=task.id,
+        status=task.status,
+        in_progress=active is not None,
+        **waterfall,
+    )
+
+
+@router.get("/metrics", response_class=FastJSONResponse)
+async def get_metrics():
+    """프로세스 내 지표 (모델별 지연/에러율, 라우팅, 대기열 등)"""
+    return metrics_service.snapshot()
+
+
+@router.get("/loop", response_class=FastJSONResponse)
+async def get_loop():
+    """이벤트 루프 지연 분포 + 루프를 오래 잡고 있던 코드의 스택 (최근 것부터)"""
+    return loop_monitor.snapshot()
+
+
+@router.get("/lifecycle", response_class=FastJSONResponse)
+async def get_lifecycle():
+    """이 워커의 drain 여부/리더 여부/진행 중인 태스크 + DB 기준 전체 워커의 진행 중인 태스크"""
+    return {
+        "worker_id": WORKER_ID,
+        "leader": leader_election.is_leader,
+        "draining": lifecycle_service.draining,
+        "in_flight": lifecycle_service.in_flight,
+        "workers": await lifecycle_service.active_tasks(),
+    }
+
+
+@router.post("/drain", response_class=FastJSONResponse)
+async def start_drain(timeout: float = None):
+    """새 작업 접수를 멈추고 진행 중인 파이프라인이 끝날 때까지 대기 (배포 전 pre-stop 용)"""
+    await lifecycle_service.drain(timeout)
+    return {"draining": True, "in_flight": lifecycle_service.in_flight}
+
+
+@router.post("/undrain", response_class=FastJSONResponse)
+async def stop_drain():
+    """drain 취소 (배포를 중단했을 때 새 작업 접수 재개)"""
+    lifecycle_service.undrain()
+    return {"draining": lifecycle_service.draining, "in_flight": lifecycle_service.in_flight}
+
+
+@router.get("/usage", response_model=UsageReportResponse)
+async def get_usage_report(hours: int = 24, top: int = 10, db: AsyncSession = Depends(get_db)):
+    """호출 유형/모델별 토큰 사용량 집계 + 토큰을 많이 쓴 태스크"""
+    since = now_kst() - timedelta(hours=hours)
+
+    result = await db.execute(
+        select(
+            GeminiUsage.call_type,
+            GeminiUsage.model,
+            func.count(),
+            func.sum(GeminiUsage.prompt_tokens),
+            func.sum(GeminiUsage.cached_tokens),
+            func.sum(GeminiUsage.output_tokens),
+            func.sum(GeminiUsage.image_tokens),
+            func.sum(GeminiUsage.total_tokens),
+            func.avg(GeminiUsage.latency),
+        )
+        .where(GeminiUsage.created_at >= since)
+        .group_by(GeminiUsage.call_type, GeminiUsage.model)
+        .order_by(func.sum(GeminiUsage.total_tokens).desc())
+    )
+    summary = [
+        UsageSummaryItem(
+            call_type=call_type,
+            model=model,
+            calls=calls,
+            prompt_tokens=prompt or 0,
+            cached_tokens=cached or 0,
+            output_tokens=output or 0,
+            image_tokens=image or 0,
+            total_tokens=total or 0,
+            avg_prompt_tokens=round((prompt or 0) / calls, 1),
+            avg_latency=round(latency, 2) if latency is not None else None,
+        )
+        for call_type, model, calls, prompt, cached, output, image, total, latency in result.all()
+    ]
+
+    # 입력 길이와 토큰/지연 시간을 함께 보기 위해 tasks 조인
+    result = await db.execute(
+        select(
+            GeminiUsage.task_id,
+            func.max(func.length(Task.meeting_text)),
+            func.sum(GeminiUsage.total_tokens),
+            func.sum(GeminiUsage.image_tokens),
+            func.sum(GeminiUsage.prompt_tokens),
+            func.sum(GeminiUsage.latency),
+        )
+        .join(Task, Task.id == GeminiUsage.task_id)
+        .where(GeminiUsage.created_at >= since)
+        .group_by(GeminiUsage.task_id)
+        .order_by(func.sum(GeminiUsage.total_tokens).desc())
+        .limit(top)
+    )
+    top_tasks = [
+        ExpensiveTaskItem(
+            task_id=task_id,
+            meeting_text_length=text_length or 0,
+            total_tokens=total or 0,
+            image_tokens=image or 0,
+            prompt_tokens=prompt or 0,
+            total_latency=round(latency, 2) if latency is not None else None,
+        )
+        for task_id, text_length, total, image, prompt, latency in result.all()
+    ]
+
+    return UsageReportResponse(since=since, summary=summary, top_tasks=top_tasks)
+
+
+@router.get("/usage/{task_id}", response_model=TaskUsageResponse)
+async def get_task_usage(task_id: str, db: AsyncSession = Depends(get_db)):
+    """태스크의 Gemini 호출별 토큰 사용량"""
+    result = await db.execute(
+        select(GeminiUsage)
+        .where(GeminiUsage.task_id == task_id)
+        .order_by(GeminiUsage.created_at)
+    )
+    usages = result.scalars().all()
+
+    return TaskUsageResponse(
+        task_id=task_id,
+        total_tokens=sum(u.total_tokens or 0 for u in usages),
+        calls=[
+            UsageRecord(
+                call_type=u.call_type,
+                model=u.model,
+                prompt_tokens=u.prompt_tokens,
+                cached_tokens=u.cached_tokens,
+                output_tokens=u.output_tokens,
+                thoughts_tokens=u.thoughts_tokens,
+                image_tokens=u.image_tokens,
+                total_tokens=u.total_tokens,
+                latency=u.latency,
+                attempts=u.attempts,
+                created_at=u.created_at,
+            )
+            for u in usages
+        ],
+    )
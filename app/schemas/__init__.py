@@ -5,9 +5,20 @@ from .schemas import (
     TaskStatus,
     ComicResponse,
     PanelScenario,
+    CharacterTagMapping,
+    ValidatedScenario,
+    EpisodeRegenerateRequest,
+    EpisodeRegenerateResponse,
     GenerateResponse,
     TaskHistoryItem,
     HistoryResponse,
+    TraceSpan,
+    TraceResponse,
+    UsageRecord,
+    TaskUsageResponse,
+    UsageSummaryItem,
+    ExpensiveTaskItem,
+    UsageReportResponse,
 )
 
 __all__ = [
@@ -17,7 +28,18 @@ __all__ = [
     "TaskStatus",
     "ComicResponse",
     "PanelScenario",
+    "CharacterTagMapping",
+    "ValidatedScenario",
+    "EpisodeRegenerateRequest",
+    "EpisodeRegenerateResponse",
     "GenerateResponse",
     "TaskHistoryItem",
     "HistoryResponse",
+    "TraceSpan",
+    "TraceResponse",
+    "UsageRecord",
+    "TaskUsageResponse",
+    "UsageSummaryItem",
+    "ExpensiveTaskItem",
+    "UsageReportResponse",
 ]
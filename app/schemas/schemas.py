@@ -34,6 +34,22 @@ class PanelScenario(BaseModel):
     image_prompt: str
 
 
+class CharacterTagMapping(BaseModel):
+    """청크 간 같은 인물의 Visual Tag 통일 매핑"""
+
+    canonical: str
+    aliases: list[str] = []
+
+
+class ValidatedScenario(BaseModel):
+    """검증 + 시나리오 통합 결과 (single 모드)"""
+
+    is_valid: bool
+    reject_reason: str | None = None
+    messages: list[str] = []
+    episodes: list[PanelScenario] = []
+
+
 class ComicResponse(BaseModel):
     """생성된 만화 응답"""
 
@@ -41,10 +57,25 @@ class ComicResponse(BaseModel):
     task_id: str
     part_number: int
     panels: list[PanelScenario]
-    image_paths: list[str]
+    image_paths: list[str | None]  # progressive 모드에서는 아직 생성 전인 컷이 None
+    image_tiers: list[str | None] = []  # 이미지별 품질 (preview | final)
     created_at: datetime
 
 
+class EpisodeRegenerateRequest(BaseModel):
+    """에피소드 1개 재생성 요청"""
+
+    prompt_tweak: str | None = None  # 기존 이미지 프롬프트에 덧붙일 수정 요청
+
+
+class EpisodeRegenerateResponse(BaseModel):
+    """에피소드 재생성 결과"""
+
+    task_id: str
+    episode_number: int
+    image_path: str
+
+
 class GenerateResponse(BaseModel):
     """만화 생성 요청 응답 (검증 통과 시)"""
 
@@ -74,3 +105,84 @@ class HistoryResponse(BaseModel):
     """작업 내역 응답"""
 
     tasks: list[TaskHistoryItem] = []
+
+
+class TraceSpan(BaseModel):
+    """트레이스 span (워터폴 한 줄)"""
+
+    name: str
+    depth: int
+    start_ms: int
+    duration_ms: int
+    end_ms: int
+    attrs: dict = {}
+    bar: str
+
+
+class TraceResponse(BaseModel):
+    """태스크 트레이스 워터폴 응답"""
+
+    task_id: str
+    status: str
+    in_progress: bool
+    total_ms: int
+    spans: list[TraceSpan] = []
+    critical_path: list[int] = []
+
+
+class UsageRecord(BaseModel):
+    """Gemini 호출 1건의 토큰 사용량"""
+
+    call_type: str
+    model: str
+    prompt_tokens: int
+    cached_tokens: int
+    output_tokens: int
+    thoughts_tokens: int
+    image_tokens: int
+    total_tokens: int
+    latency: float | None = None
+    attempts: int
+    created_at: datetime
+
+
+class TaskUsageResponse(BaseModel):
+    """태스크별 토큰 사용량 응답"""
+
+    task_id: str
+    total_tokens: int
+    calls: list[UsageRecord] = []
+
+
+class UsageSummaryItem(BaseModel):
+    """호출 유형/모델별 토큰 사용량 집계"""
+
+    call_type: str
+    model: str
+    calls: int
+    prompt_tokens: int
+    cached_tokens: int
+    output_tokens: int
+    image_tokens: int
+    total_tokens: int
+    avg_prompt_tokens: float
+    avg_latency: float | None = None
+
+
+class ExpensiveTaskItem(BaseModel):
+    """토큰을 많이 쓴 태스크"""
+
+    task_id: str
+    meeting_text_length: int
+    total_tokens: int
+    image_tokens: int
+    prompt_tokens: int
+    total_latency: float | None = None
+
+
+class UsageReportResponse(BaseModel):
+    """토큰 사용량 집계 리포트"""
+
+    since: datetime
+    summary: list[UsageSummaryItem] = []
+    top_tasks: list[ExpensiveTaskItem] = []
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, BinaryIO
+
+from google.genai import types
+
+from app.config import settings
+from app.services.trace_service import trace_service
+
+if TYPE_CHECKING:
+    from app.services.upload_service import SpooledImage
+
+logger = logging.getLogger(__name__)
+
+
+class AttachmentStoreInterface(ABC):
+    """첨부 이미지 저장소 인터페이스"""
+
+    @abstractmethod
+    async def upload(self, file: BinaryIO) -> tuple[types.Part, str | None]:
+        """파일 객체에서 이미지를 올리고 (프롬프트에 넣을 Part, 삭제용 핸들) 반환 (닫는 건 호출한 쪽)"""
+        pass
+
+    @abstractmethod
+    async def delete(self, handle: str) -> None:
+        """업로드한 핸들 삭제"""
+        pass
+
+
+class InlineAttachmentStore(AttachmentStoreInterface):
+    """업로드 없이 inline bytes Part를 그대로 사용 (로컬/테스트용)"""
+
+    async def upload(self, file: BinaryIO) -> tuple[types.Part, str | None]:
+        # inline Part는 요청 본문에 bytes로 들어가므로 여기서는 읽을 수밖에 없음 (파일 읽기는 스레드에서)
+        data = await asyncio.get_running_loop().run_in_executor(None, file.read)
+        return types.Part.from_bytes(data=data, mime_type="image/png"), None
+
+    async def delete(self, handle: str) -> None:
+        pass
+
+
+class GeminiFileAttachmentStore(AttachmentStoreInterface):
+    """Gemini Files API에 한 번 업로드하고 file URI로 참조"""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def upload(self, file: BinaryIO) -> tuple[types.Part, str | None]:
+        uploaded = await self.client.aio.files.upload(
+            file=file,
+            config=types.UploadFileConfig(mime_type="image/png"),
+        )
+        return types.Part.from_uri(file_uri=uploaded.uri, mime_type=uploaded.mime_type), uploaded.name
+
+    async def delete(self, handle: str) -> None:
+        await self.client.aio.files.delete(name=handle)
+
+
+class AttachmentService:
+    """태스크 단위 첨부 이미지 핸들 관리
+
+    검증/시나리오 호출이 같은 핸들을 참조하도록 이미지를 한 번만 업로드하고,
+    태스크가 끝나면 핸들을 정리한다.
+    """
+
+    def __init__(self, store: AttachmentStoreInterface):
+        self.store = store
+        self._handles: dict[str, list[str]] = {}
+
+    @trace_service.traced("upload_attachments")
+    async def upload(self, task_id: str, images: list["SpooledImage"]) -> list[types.Part]:
+        """이미지들을 병렬 업로드하고 Part 목록 반환 (실패한 이미지는 inline으로 대체)"""
+        if not images:
+            return []
+
+        results = await asyncio.gather(
+            *[self._upload(img) for img in images],
+            return_exceptions=True,
+        )
+
+        parts = []
+        handles = []
+        for img, result in zip(images, results):
+            if isinstance(result, Exception):
+                logger.warning(f"첨부 이미지 업로드 실패, inline 사용: {type(result).__name__}: {result}")
+                data = await asyncio.get_running_loop().run_in_executor(None, img.read)
+                parts.append(types.Part.from_bytes(data=data, mime_type="image/png"))
+                continue
+            part, handle = result
+            parts.append(part)
+            if handle:
+                handles.append(handle)
+
+        if handles:
+            self._handles.setdefault(task_id, []).extend(handles)
+        return parts
+
+    async def _upload(self, image: "SpooledImage") -> tuple[types.Part, str | None]:
+        with image.open() as file:
+            return await self.store.upload(file)
+
+    async def release(self, task_id: str) -> None:
+        """태스크의 업로드 핸들 삭제 (실패해도 무시)"""
+        handles = self._handles.pop(task_id, [])
+        for handle in handles:
+            try:
+                await self.store.delete(handle)
+            except Exception as e:
+                logger.warning(f"첨부 이미지 핸들 삭제 실패: {handle} ({e})")
+
+
+def create_store() -> AttachmentStoreInterface:
+    # Files API는 Gemini LLM provider에서만 사용 가능
+    if settings.attachment_mode == "files" and settings.llm_provider == "gemini":
+        from app.services.providers import get_llm_service
+        return GeminiFileAttachmentStore(get_llm_service().client)
+    return InlineAttachmentStore()
@@ -1,21 +1,41 @@
 import asyncio
-import json
 import logging
 import time
+from contextlib import asynccontextmanager
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from google.genai.errors import ServerError
 
+from app.config import settings
+from app.logging_config import Truncated, bind_visitor
 from app.models import Task, Comic
-from app.services.llm_service import llm_service
-from app.services.image_service import image_service
+from app.schemas import PanelScenario
+from app.services.lifecycle_service import lifecycle_service
+from app.services.providers import get_attachment_service, get_image_service, get_llm_service
+from app.services.publish_service import publish_service
 from app.services.telegram_service import telegram_service
+from app.services.trace_service import trace_service
 
 logger = logging.getLogger(__name__)
 
+BASE_STYLE_PROMPT = "Masterpiece, best quality, 2D Webtoon style, bold black outlines, flat colors, comic book layout, vibrant pastel tones. "
+
+
+class EpisodeFailedError(Exception):
+    """일부 에피소드 이미지 생성 실패 (성공한 컷은 Comic에 저장되어 있음)"""
+
+    def __init__(self, failed: list[int], cause: Exception):
+        self.failed = failed
+        self.cause = cause
+        super().__init__(f"{len(failed)}개 에피소드 생성 실패 ({failed}): {cause}")
+
 
 def get_friendly_error_message(e: Exception) -> str:
     """에러를 사용자 친화적 메시지로 변환"""
+    from google.genai.errors import ServerError
+
+    if isinstance(e, EpisodeFailedError):
+        e = e.cause
     error_str = str(e).lower()
 
     if isinstance(e, ServerError) or "503" in error_str or "overloaded" in error_str:
@@ -30,25 +50,81 @@ def get_friendly_error_message(e: Exception) -> str:
         return f"문제가 발생했어요. 잠시 후 다시 시도해 주세요. ({type(e).__name__})"
 
 
+class ComicProgress:
+    """Comic 레코드에 에피소드 이미지를 나오는 대로 반영 (체크포인트, 프리뷰 → 최종본 교체)"""
+
+    def __init__(self, db: AsyncSession, task: Task, comic: Comic, count: int):
+        self.db = db
+        self.task = task
+        self.comic = comic
+        # 재시도 시에는 이전 실행에서 저장된 컷부터 시작 (컬럼 값은 제자리 수정하지 않도록 복사)
+        self.paths: list[str | None] = list(comic.image_paths) if comic.image_paths else [None] * count
+        self.tiers: list[str | None] = list(comic.image_tiers) if comic.image_tiers else [None] * count
+        # 같은 세션에 병렬 commit 방지
+        self.lock = asyncio.Lock()
+
+    def missing(self) -> list[int]:
+        """최종본이 아직 없는 에피소드 인덱스"""
+        return [i for i, tier in enumerate(self.tiers) if tier != "final"]
+
+    async def save_character_sheet(self, url: str) -> None:
+        async with self.lock:
+            self.task.character_sheet_url = url
+            await self.db.commit()
+
+    async def save(self, index: int, path: str, tier: str) -> None:
+        async with self.lock:
+            if self.tiers[index] == "final":
+                return
+            self.paths[index] = path
+            self.tiers[index] = tier
+            self.comic.image_paths = list(self.paths)
+            self.comic.image_tiers = list(self.tiers)
+            # 모든 컷의 프리뷰가 준비되면 결과 페이지에서 볼 수 있는 상태로 전환
+            if self.task.status == "processing" and "preview" in self.tiers and all(self.paths):
+                logger.info(f"[Task {self.task.id[:8]}] processing → preview")
+                self.task.status = "preview"
+            await self.db.commit()
+
+
 class ComicService:
     """만화 생성 오케스트레이션 서비스"""
 
+    def __init__(self):
+        # 태스크별 Comic 갱신 lock (lock, 사용 중인 요청 수)
+        self._comic_locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+    @asynccontextmanager
+    async def _comic_lock(self, task_id: str):
+        """같은 태스크의 에피소드 재생성 반영을 직렬화 (마지막 요청이 들어오면 lock 정리)"""
+        lock, users = self._comic_locks.get(task_id, (asyncio.Lock(), 0))
+        self._comic_locks[task_id] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._comic_locks[task_id]
+            if users == 1:
+                del self._comic_locks[task_id]
+            else:
+                self._comic_locks[task_id] = (lock, users - 1)
+
     async def create_comic_from_scenario(
         self,
         db: AsyncSession,
         task_id: str,
         meeting_text: str,
-        scenario_task: asyncio.Task,
-        images: list[bytes] = None,
+        scenario_task: asyncio.Future,
     ) -> None:
-        """이미 시작된 시나리오 생성 task를 받아서 결과 대기 후 이미지 생성"""
-        images = images or []
+        """이미 시작된 시나리오 생성 task(또는 완료된 Future)를 받아서 결과 대기 후 이미지 생성"""
         task = await db.get(Task, task_id)
         if not task:
             return
 
         total_start = time.time()
         short_id = task_id[:8]
+        trace_service.bind(task_id)
+        bind_visitor(task.visitor_id)
 
         try:
             # 1. 상태 업데이트
@@ -60,56 +136,52 @@ class ComicService:
 
             # 2. 시나리오 생성 결과 대기 (이미 시작된 task)
             scenario_start = time.time()
-            panels = await scenario_task
+            async with trace_service.span("scenario_wait"):
+                panels = await scenario_task
             scenario_elapsed = time.time() - scenario_start
             task.scenario_duration = round(scenario_elapsed, 1)
             logger.info(f"[Task {short_id}] 시나리오 생성 완료 ({scenario_elapsed:.1f}s) - {len(panels)}개 에피소드")
 
-            # 3. 에피소드 수에 따라 분기
-            if len(panels) >= 2:
-                # 캐릭터 시트 방식: 레퍼런스 이미지 생성 후 병렬 처리
-                image_paths, sheet_elapsed, episode_elapsed = await self._generate_with_character_sheet(task, panels, short_id)
-                task.character_sheet_duration = round(sheet_elapsed, 1)
-                task.episode_image_duration = round(episode_elapsed, 1)
-            else:
-                # 단일 에피소드: 기존 방식
-                image_paths, episode_elapsed = await self._generate_single(panels, short_id)
-                task.episode_image_duration = round(episode_elapsed, 1)
-
-            # 4. Comic 저장
-            comic = Comic(
-                task_id=task_id,
-                part_number=1,
-                panels_json=json.dumps([p.model_dump() for p in panels], ensure_ascii=False),
-                image_paths=json.dumps(image_paths),
-            )
-            db.add(comic)
+            # 3-4. 이미지 생성 + Comic 저장
+            image_paths = await self._render_comic(db, task, panels, short_id)
 
             # 5. 완료 상태 업데이트
             total_elapsed = time.time() - total_start
             task.total_duration = round(total_elapsed, 1)
-            logger.info(f"[Task {short_id}] processing → completed (총 {total_elapsed:.1f}s)")
+            logger.info(f"[Task {short_id}] {task.status} → completed (총 {total_elapsed:.1f}s)")
             task.status = "completed"
+            task.trace_json = trace_service.finish(task_id)
             await db.commit()
+            await publish_service.publish(db, task)
 
             telegram_service.notify_task_completed(
                 task_id, meeting_text, image_paths, total_elapsed
             )
 
         except asyncio.CancelledError:
+            if lifecycle_service.draining:
+                # 종료 중 취소: 상태를 그대로 두고 다음 시작 시 sweep이 이어서 처리
+                logger.info(f"[Task {short_id}] 종료로 중단됨 ({task.status})")
+                raise
             logger.info(f"[Task {short_id}] 시나리오 생성 취소됨")
             task.status = "failed"
             task.error_message = "입력이 유효하지 않아 생성이 취소되었습니다."
+            task.trace_json = trace_service.finish(task_id)
             await db.commit()
 
         except Exception as e:
             logger.error(f"[Task {short_id}] 만화 생성 실패: {e}")
             task.status = "failed"
             task.error_message = get_friendly_error_message(e)
+            task.trace_json = trace_service.finish(task_id)
             await db.commit()
 
             telegram_service.notify_task_failed(task_id, str(e))
 
+        finally:
+            # 검증/시나리오에서 공유한 첨부 이미지 핸들 정리
+            await get_attachment_service().release(task_id)
+
     async def create_comic(
         self,
         db: AsyncSession,
@@ -125,6 +197,8 @@ class ComicService:
 
         total_start = time.time()
         short_id = task_id[:8]
+        trace_service.bind(task_id)
+        bind_visitor(task.visitor_id)
 
         try:
             # 1. 상태 업데이트
@@ -136,37 +210,22 @@ class ComicService:
 
             # 2. LLM으로 시나리오 생성 (이미지 포함)
             scenario_start = time.time()
-            panels = await llm_service.analyze_meeting(meeting_text, images)
+            panels = await get_llm_service().analyze_meeting(meeting_text, images)
             scenario_elapsed = time.time() - scenario_start
             task.scenario_duration = round(scenario_elapsed, 1)
             logger.info(f"[Task {short_id}] 시나리오 생성 완료 ({scenario_elapsed:.1f}s) - {len(panels)}개 에피소드")
 
-            # 3. 에피소드 수에 따라 분기
-            if len(panels) >= 2:
-                # 캐릭터 시트 방식: 레퍼런스 이미지 생성 후 병렬 처리
-                image_paths, sheet_elapsed, episode_elapsed = await self._generate_with_character_sheet(task, panels, short_id)
-                task.character_sheet_duration = round(sheet_elapsed, 1)
-                task.episode_image_duration = round(episode_elapsed, 1)
-            else:
-                # 단일 에피소드: 기존 방식
-                image_paths, episode_elapsed = await self._generate_single(panels, short_id)
-                task.episode_image_duration = round(episode_elapsed, 1)
-
-            # 4. Comic 저장
-            comic = Comic(
-                task_id=task_id,
-                part_number=1,
-                panels_json=json.dumps([p.model_dump() for p in panels], ensure_ascii=False),
-                image_paths=json.dumps(image_paths),
-            )
-            db.add(comic)
+            # 3-4. 이미지 생성 + Comic 저장
+            image_paths = await self._render_comic(db, task, panels, short_id)
 
             # 5. 완료 상태 업데이트
             total_elapsed = time.time() - total_start
             task.total_duration = round(total_elapsed, 1)
-            logger.info(f"[Task {short_id}] processing → completed (총 {total_elapsed:.1f}s)")
+            logger.info(f"[Task {short_id}] {task.status} → completed (총 {total_elapsed:.1f}s)")
             task.status = "completed"
+            task.trace_json = trace_service.finish(task_id)
             await db.commit()
+            await publish_service.publish(db, task)
 
             telegram_service.notify_task_completed(
                 task_id, meeting_text, image_paths, total_elapsed
@@ -176,33 +235,216 @@ class ComicService:
             logger.error(f"[Task {short_id}] 만화 생성 실패: {e}")
             task.status = "failed"
             task.error_message = get_friendly_error_message(e)
+            task.trace_json = trace_service.finish(task_id)
             await db.commit()
 
             telegram_service.notify_task_failed(task_id, str(e))
 
-    async def _generate_single(self, panels, short_id: str = "") -> tuple[list[str], float]:
+    async def resume_comic(self, db: AsyncSession, task_id: str) -> None:
+        """실패한 태스크에서 빠진 에피소드만 다시 생성 (저장된 시나리오와 캐릭터 시트 재사용)"""
+        task = await db.get(Task, task_id)
+        if not task:
+            return
+        result = await db.execute(select(Comic).where(Comic.task_id == task_id).limit(1))
+        comic = result.scalar_one_or_none()
+        if not comic or not comic.panels_json:
+            return
+
+        total_start = time.time()
+        short_id = task_id[:8]
+        trace_service.bind(task_id)
+        bind_visitor(task.visitor_id)
+
+        try:
+            logger.info(f"[Task {short_id}] {task.status} → processing (재시도)")
+            task.status = "processing"
+            task.error_message = None
+            await db.commit()
+
+            panels = [PanelScenario(**p) for p in comic.panels_json]
+            image_paths = await self._render_comic(db, task, panels, short_id, comic)
+
+            total_elapsed = time.time() - total_start
+            task.total_duration = round((task.total_duration or 0) + total_elapsed, 1)
+            logger.info(f"[Task {short_id}] {task.status} → completed (재시도 {total_elapsed:.1f}s)")
+            task.status = "completed"
+            task.trace_json = trace_service.finish(task_id)
+            await db.commit()
+            await publish_service.publish(db, task)
+
+            telegram_service.notify_task_completed(
+                task_id, task.meeting_text, image_paths, total_elapsed
+            )
+
+        except Exception as e:
+            logger.error(f"[Task {short_id}] 재시도 실패: {e}")
+            task.status = "failed"
+            task.error_message = get_friendly_error_message(e)
+            task.trace_json = trace_service.finish(task_id)
+            await db.commit()
+
+            telegram_service.notify_task_failed(task_id, str(e))
+
+    async def regenerate_episode(
+        self,
+        db: AsyncSession,
+        task: Task,
+        comic: Comic,
+        index: int,
+        prompt_tweak: str | None = None,
+    ) -> str:
+        """저장된 시나리오와 캐릭터 시트로 에피소드 1개만 다시 생성하고 image_paths 교체
+
+        사용자가 결과가 마음에 들지 않아 요청하는 것이므로 이미지 캐시를 거치지 않는다.
+        """
+        panels = comic.panels_json
+        prompt = panels[index]["image_prompt"]
+        if prompt_tweak:
+            prompt = f"{prompt}\n\n**Additional direction:** {prompt_tweak}"
+
+        # 토큰 사용량을 태스크에 귀속시키기 위한 별도 Trace (기존 trace_json과 진행 중인 Trace는 유지)
+        bind_visitor(task.visitor_id)
+        with trace_service.scoped(task.id):
+            if task.character_sheet_url:
+                path = await get_image_service().generate_image_with_reference(
+                    prompt, task.character_sheet_url, use_cache=False
+                )
+            else:
+                # 단일 에피소드 태스크는 캐릭터 시트가 없음
+                path = await get_image_service().generate_image(BASE_STYLE_PROMPT + prompt, use_cache=False)
+
+        # 생성 중에 다른 컷이 교체됐을 수 있으므로 최신 값 기준으로 반영
+        # 같은 프로세스의 동시 재생성은 lock으로, 다른 워커와는 행 잠금(FOR UPDATE)으로 읽기~commit 사이를 직렬화
+        async with self._comic_lock(task.id):
+            await db.refresh(comic, with_for_update=True)
+            image_paths = list(comic.image_paths) if comic.image_paths else [None] * len(panels)
+            image_tiers = list(comic.image_tiers) if comic.image_tiers else [None] * len(panels)
+            image_paths[index] = path
+            image_tiers[index] = "final"
+            comic.image_paths = image_paths
+            comic.image_tiers = image_tiers
+            await db.commit()
+            # 완성된 결과는 바뀐 이미지로 결과 페이지 다시 발행 (늦게 반영된 쪽이 마지막으로 발행되도록 lock 안에서)
+            await publish_service.publish(db, task)
+
+        logger.info(f"[Task {task.id[:8]}] {index + 1}번 에피소드 재생성 완료")
+        return path
+
+    async def _render_comic(self, db: AsyncSession, task: Task, panels, short_id: str, comic: Comic = None) -> list[str]:
+        """에피소드 이미지를 생성하고 Comic에 컷 단위로 체크포인트 (comic이 주어지면 빠진 컷만 생성)"""
+        if comic is None:
+            # 완성된 컷을 바로 저장할 수 있도록 Comic을 먼저 저장
+            comic = Comic(
+                task_id=task.id,
+                part_number=1,
+                panels_json=[p.model_dump() for p in panels],
+                image_paths=[None] * len(panels),
+                image_tiers=[None] * len(panels),
+            )
+            db.add(comic)
+            await db.commit()
+        progress = ComicProgress(db, task, comic, len(panels))
+
+        # 에피소드 수에 따라 분기
+        if len(panels) >= 2:
+            # 캐릭터 시트 방식: 레퍼런스 이미지 생성 후 병렬 처리
+            sheet_elapsed, episode_elapsed = await self._generate_with_character_sheet(task, panels, short_id, progress)
+            if sheet_elapsed is not None:
+                task.character_sheet_duration = round(sheet_elapsed, 1)
+            task.episode_image_duration = round(episode_elapsed, 1)
+        else:
+            # 단일 에피소드: 기존 방식
+            episode_elapsed = await self._generate_single(panels, short_id, progress)
+            task.episode_image_duration = round(episode_elapsed, 1)
+
+        # 라우터가 고른 모델/해상도 기록 (혼잡 시 강등 여부 확인용)
+        routed_tiers = trace_service.collect("tier")
+        if routed_tiers:
+            task.image_tier = ",".join(sorted(routed_tiers))
+
+        return progress.paths
+
+    async def _gather_episodes(self, progress: ComicProgress, groups: list[list[int]], coros: list) -> None:
+        """에피소드 그룹(단일 또는 묶음)을 병렬 생성 (하나가 실패해도 나머지는 끝까지 진행하고 저장)"""
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        failed = [i for group, r in zip(groups, results) if isinstance(r, Exception) for i in group]
+        if failed:
+            cause = next(r for r in results if isinstance(r, Exception))
+            logger.warning(f"[Task {progress.task.id[:8]}] {len(failed)}개 에피소드 실패, 성공한 컷은 저장됨: {cause}")
+            raise EpisodeFailedError([i + 1 for i in failed], cause)
+
+    async def _with_preview(self, progress: ComicProgress, index: int, preview_call, final_call) -> str:
+        """progressive 모드: flash 프리뷰를 먼저 저장하고, 최종본이 나오면 교체"""
+        if not settings.progressive_rendering:
+            path = await final_call()
+            await progress.save(index, path, "final")
+            return path
+
+        saving = False
+
+        async def preview():
+            nonlocal saving
+            try:
+                async with trace_service.span("episode_preview", episode=index + 1):
+                    path = await preview_call()
+                saving = True
+                await progress.save(index, path, "preview")
+            except Exception as e:
+                logger.warning(f"[Task {progress.task.id[:8]}] {index + 1}번 프리뷰 생성 실패 (최종본 대기): {e}")
+
+        preview_task = asyncio.create_task(preview())
+        try:
+            path = await final_call()
+        finally:
+            # 최종본이 먼저 끝났거나 실패하면 프리뷰는 더 이상 필요 없음
+            # 단, 저장 중이면 공유 세션의 commit 도중에 취소하지 않도록 끝날 때까지 기다림 (저장은 final이 덮어씀)
+            if saving:
+                await asyncio.wait([preview_task])
+            else:
+                preview_task.cancel()
+        await progress.save(index, path, "final")
+        return path
+
+    async def _generate_single(self, panels, short_id: str, progress: ComicProgress) -> float:
         """단일 에피소드 이미지 생성 (기존 방식)"""
+        image_service = get_image_service()
         image_start = time.time()
-        base_style_prompt = "Masterpiece, best quality, 2D Webtoon style, bold black outlines, flat colors, comic book layout, vibrant pastel tones. "
         async def generate_with_index(index: int, prompt: str):
-            path = await image_service.generate_image(base_style_prompt + prompt)
-            return index, path
+            async def final():
+                async with trace_service.span("episode", episode=index + 1):
+                    return await image_service.generate_image(BASE_STYLE_PROMPT + prompt)
+
+            return await self._with_preview(
+                progress, index,
+                lambda: image_service.generate_image(BASE_STYLE_PROMPT + prompt, preview=True),
+                final,
+            )
 
-        tasks = [
-            generate_with_index(i, panel.image_prompt)
-            for i, panel in enumerate(panels)
-        ]
-        results = await asyncio.gather(*tasks)
+        missing = progress.missing()
+        await self._gather_episodes(progress, [[i] for i in missing], [
+            generate_with_index(i, panels[i].image_prompt)
+            for i in missing
+        ])
 
         image_elapsed = time.time() - image_start
-        logger.info(f"[Task {short_id}] 에피소드 이미지 생성 완료 ({image_elapsed:.1f}s) - {len(panels)}장")
-
-        paths = [path for _, path in sorted(results, key=lambda x: x[0])]
-        return paths, image_elapsed
-
-    async def _generate_with_character_sheet(self, task: Task, panels, short_id: str = "") -> tuple[list[str], float, float]:
-        """캐릭터 시트를 먼저 생성하고, 이를 레퍼런스로 에피소드 이미지 생성"""
-        # 1. 캐릭터 시트 프롬프트 직접 구성 (인물 정보만 추출)
+        logger.info(f"[Task {short_id}] 에피소드 이미지 생성 완료 ({image_elapsed:.1f}s) - {len(missing)}장")
+        return image_elapsed
+
+    def _episode_groups(self, missing: list[int]) -> list[list[int]]:
+        """묶음 모드면 남은 에피소드를 2개씩 묶음 (홀수면 마지막 1개는 단독 생성)
+
+        progressive 모드는 컷별 프리뷰 → 최종본 교체 흐름이라 묶지 않는다.
+        """
+        if (
+            not settings.episode_packing_enabled
+            or settings.progressive_rendering
+            or len(missing) < settings.episode_packing_min_episodes
+        ):
+            return [[i] for i in missing]
+        return [missing[i:i + 2] for i in range(0, len(missing), 2)]
+
+    def _build_character_sheet_prompt(self, panels, short_id: str) -> str:
+        """캐릭터 시트 프롬프트 직접 구성 (인물 정보만 추출)"""
         logger.info(f"[Task {short_id}] 캐릭터 시트 프롬프트 구성 중...")
         all_prompts = "\n\n".join([
             f"Episode {p.episode_number}:\n{p.image_prompt}"
@@ -222,36 +464,61 @@ Create a CHARACTER DESIGN SHEET (Turnaround view) for the main characters.
 
 {all_prompts}""".strip()
 
-        logger.info(f"[Task {short_id}] 캐릭터 시트 프롬프트: {character_sheet_prompt[:200]}...")
-
-        # 2. 캐릭터 시트 이미지 생성 (flash 모델 사용)
-        sheet_start = time.time()
-        character_sheet_url = await image_service.generate_image_fast(character_sheet_prompt)
-        sheet_elapsed = time.time() - sheet_start
-        logger.info(f"[Task {short_id}] 캐릭터 시트 생성 완료 ({sheet_elapsed:.1f}s)")
-
-        # 3. Task에 캐릭터 시트 URL 저장
-        task.character_sheet_url = character_sheet_url
-
-        # 4. 캐릭터 시트를 레퍼런스로 모든 에피소드 이미지 병렬 생성
-        logger.info(f"[Task {short_id}] 레퍼런스 기반 {len(panels)}개 에피소드 이미지 생성 중...")
+        logger.debug("[Task %s] 캐릭터 시트 프롬프트: %s", short_id, Truncated(character_sheet_prompt, 200))
+        return character_sheet_prompt
+
+    async def _generate_with_character_sheet(self, task: Task, panels, short_id: str, progress: ComicProgress) -> tuple[float | None, float]:
+        """캐릭터 시트를 먼저 생성하고, 이를 레퍼런스로 에피소드 이미지 생성
+
+        재시도 시에는 저장된 캐릭터 시트를 그대로 쓰고, 시트 소요시간은 None으로 반환한다.
+        """
+        image_service = get_image_service()
+        # 1-3. 캐릭터 시트 이미지 생성 (flash 모델 사용) 후 바로 Task에 저장
+        character_sheet_url = task.character_sheet_url
+        sheet_elapsed = None
+        if character_sheet_url:
+            logger.info(f"[Task {short_id}] 저장된 캐릭터 시트 재사용")
+        else:
+            character_sheet_prompt = self._build_character_sheet_prompt(panels, short_id)
+            sheet_start = time.time()
+            character_sheet_url = await image_service.generate_image_fast(character_sheet_prompt)
+            sheet_elapsed = time.time() - sheet_start
+            logger.info(f"[Task {short_id}] 캐릭터 시트 생성 완료 ({sheet_elapsed:.1f}s)")
+            await progress.save_character_sheet(character_sheet_url)
+
+        # 4. 캐릭터 시트를 레퍼런스로 남은 에피소드 이미지 병렬 생성
+        missing = progress.missing()
+        logger.info(f"[Task {short_id}] 레퍼런스 기반 {len(missing)}개 에피소드 이미지 생성 중...")
         episode_start = time.time()
 
         async def generate_with_reference_index(index: int, prompt: str):
-            path = await image_service.generate_image_with_reference(prompt, character_sheet_url)
-            return index, path
+            async def final():
+                async with trace_service.span("episode", episode=index + 1):
+                    return await image_service.generate_image_with_reference(prompt, character_sheet_url)
+
+            return await self._with_preview(
+                progress, index,
+                lambda: image_service.generate_image_with_reference(prompt, character_sheet_url, preview=True),
+                final,
+            )
 
-        tasks = [
-            generate_with_reference_index(i, panel.image_prompt)
-            for i, panel in enumerate(panels)
-        ]
-        results = await asyncio.gather(*tasks)
+        async def generate_packed(indices: list[int]):
+            async with trace_service.span("episode_pack", episodes=[i + 1 for i in indices]):
+                paths = await image_service.generate_packed_with_reference(
+                    [panels[i].image_prompt for i in indices], character_sheet_url
+                )
+            for index, path in zip(indices, paths):
+                await progress.save(index, path, "final")
+
+        groups = self._episode_groups(missing)
+        await self._gather_episodes(progress, groups, [
+            generate_packed(group) if len(group) > 1 else generate_with_reference_index(group[0], panels[group[0]].image_prompt)
+            for group in groups
+        ])
 
         episode_elapsed = time.time() - episode_start
-        logger.info(f"[Task {short_id}] 에피소드 이미지 생성 완료 ({episode_elapsed:.1f}s) - {len(panels)}장")
-
-        paths = [path for _, path in sorted(results, key=lambda x: x[0])]
-        return paths, sheet_elapsed, episode_elapsed
+        logger.info(f"[Task {short_id}] 에피소드 이미지 생성 완료 ({episode_elapsed:.1f}s) - {len(missing)}장")
+        return sheet_elapsed, episode_elapsed
 
 
 comic_service = ComicService()
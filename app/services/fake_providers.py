@@ -0,0 +1,187 @@
+import asyncio
+import hashlib
+import logging
+import random
+import textwrap
+import time
+from collections import defaultdict
+from io import BytesIO
+from types import SimpleNamespace
+
+from PIL import Image, ImageDraw
+
+from app.config import settings
+from app.schemas import PanelScenario, ValidationResult, ValidatedScenario
+from app.services.image_service import ImageServiceInterface
+from app.services.llm_service import LLMServiceInterface
+from app.services.storage_service import StorageInterface
+from app.services.trace_service import trace_service
+from app.services.usage_service import usage_service
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER_SIZE = (288, 512)  # 9:16
+FAKE_CHARACTERS = ("[Character: PM]", "[Character: Dev]", "[Character: Designer]")
+
+
+class FakeProviderError(Exception):
+    """fake provider가 설정된 확률로 내는 실패 (실제 API의 503과 같은 메시지)"""
+
+
+class FakeModel:
+    """호출별 지연/실패를 seed 기반으로 결정하는 가짜 모델
+
+    (seed, 모델, 입력, 같은 입력의 몇 번째 호출인지)로 난수를 만들어서
+    동시 실행 순서와 관계없이 같은 입력은 같은 지연/실패를 재현하고, 재시도는 다른 결과를 낸다.
+    실제 서비스처럼 최대 3회 시도하고 사용량을 기록한다.
+    """
+
+    def __init__(self, name: str, median_latency: float):
+        self.name = name
+        self.median_latency = median_latency
+        self._calls: dict[str, int] = defaultdict(int)
+
+    def _rng(self, key: str) -> random.Random:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        count = self._calls[digest]
+        self._calls[digest] += 1
+        return random.Random(f"{settings.fake_seed}:{self.name}:{digest}:{count}")
+
+    def _sample(self, call_type: str, key: str) -> tuple[float, bool]:
+        """이번 시도의 (지연, 실패 여부)"""
+        rng = self._rng(key)
+        return self.median_latency * rng.lognormvariate(0, settings.fake_latency_sigma), rng.random() < settings.fake_failure_rate
+
+    async def call(self, call_type: str, key: str) -> None:
+        last_error = None
+        for attempt in range(3):
+            trace_service.annotate(attempts=attempt + 1)
+            latency, failed = self._sample(call_type, key)
+            start = time.perf_counter()
+            await asyncio.sleep(latency)
+            if failed:
+                last_error = FakeProviderError(f"503 UNAVAILABLE (fake {self.name})")
+                logger.warning(f"{self.name} 호출 실패 (시도 {attempt + 1}/3)")
+                continue
+            usage_service.record(call_type, self.name, _fake_response(key), time.perf_counter() - start, attempt + 1)
+            return
+        raise last_error
+
+
+def _fake_response(key: str) -> SimpleNamespace:
+    """usage_service.record에 넘길 응답 (토큰 수는 입력 길이로 대략 계산)"""
+    return SimpleNamespace(usage_metadata=SimpleNamespace(
+        prompt_token_count=len(key) // 2,
+        cached_content_token_count=0,
+        candidates_token_count=0,
+        thoughts_token_count=0,
+        prompt_tokens_details=None,
+        candidates_tokens_details=None,
+        total_token_count=len(key) // 2,
+    ))
+
+
+def render_placeholder(prompt: str, label: str) -> bytes:
+    """프롬프트 해시 색상 배경 + 프롬프트 앞부분 텍스트의 9:16 PNG"""
+    digest = hashlib.sha256(prompt.encode()).digest()
+    image = Image.new("RGB", PLACEHOLDER_SIZE, (128 + digest[0] // 2, 128 + digest[1] // 2, 128 + digest[2] // 2))
+    draw = ImageDraw.Draw(image)
+    draw.text((12, 12), label, fill="black")
+    for i, line in enumerate(textwrap.wrap(prompt, 40)[:30]):
+        draw.text((12, 36 + i * 14), line, fill="black")
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class FakeLLMService(LLMServiceInterface):
+    """설정된 에피소드 수만큼 입력 텍스트를 나눠 시나리오를 만드는 가짜 LLM"""
+
+    def __init__(self, model: FakeModel = None):
+        self.model = model or FakeModel("fake-llm", settings.fake_llm_latency)
+
+    def _episodes(self, text: str) -> list[PanelScenario]:
+        count = settings.fake_episode_count
+        size = max(1, len(text) // count)
+        return [
+            PanelScenario(
+                episode_number=i + 1,
+                image_prompt=(
+                    f"{FAKE_CHARACTERS[i % len(FAKE_CHARACTERS)]} and {FAKE_CHARACTERS[(i + 1) % len(FAKE_CHARACTERS)]} "
+                    f"discuss in a meeting room. Episode {i + 1}: {text[i * size:(i + 1) * size][:200]}"
+                ),
+            )
+            for i in range(count)
+        ]
+
+    def _validation(self, text: str, images: list) -> ValidationResult:
+        if not text.strip() and not images:
+            return ValidationResult(is_valid=False, reject_reason="입력 내용이 비어 있어요.")
+        return ValidationResult(is_valid=True, messages=["회의 내용을 만화로 그리고 있어요 (fake)"])
+
+    @trace_service.traced("validate_input")
+    async def validate_input(self, text: str, images: list = None) -> ValidationResult:
+        await self.model.call("validate", "validate:" + text)
+        return self._validation(text, images)
+
+    @trace_service.traced("validate_and_analyze")
+    async def validate_and_analyze(self, text: str, images: list = None) -> ValidatedScenario:
+        await self.model.call("combined", "combined:" + text)
+        validation = self._validation(text, images)
+        return ValidatedScenario(
+            **validation.model_dump(),
+            episodes=self._episodes(text) if validation.is_valid else [],
+        )
+
+    @trace_service.traced("analyze_meeting")
+    async def analyze_meeting(self, meeting_text: str, images: list = None) -> list[PanelScenario]:
+        await self.model.call("scenario", "scenario:" + meeting_text)
+        return self._episodes(meeting_text)
+
+
+class FakeImageService(ImageServiceInterface):
+    """지연만 흉내 내고 플레이스홀더 PNG를 저장소에 올리는 가짜 이미지 생성 서비스"""
+
+    def __init__(self, storage: StorageInterface, model: FakeModel = None, flash_model: FakeModel = None):
+        self.storage = storage
+        self.model = model or FakeModel("fake-image-pro", settings.fake_image_latency)
+        self.flash_model = flash_model or FakeModel("fake-image-flash", settings.fake_flash_image_latency)
+
+    async def _render_and_upload(self, prompts: list[str], label: str) -> list[str]:
+        loop = asyncio.get_running_loop()
+        images = await asyncio.gather(*[
+            loop.run_in_executor(None, render_placeholder, prompt, label) for prompt in prompts
+        ])
+        return list(await asyncio.gather(*[
+            self.storage.upload(image, prefix="toon-minutes") for image in images
+        ]))
+
+    @trace_service.traced("generate_image")
+    async def generate_image(self, prompt: str, preview: bool = False, use_cache: bool = True) -> str:
+        if preview:
+            await self.flash_model.call("episode_preview", prompt)
+            return (await self._render_and_upload([prompt], "fake preview"))[0]
+        await self.model.call("image", prompt)
+        return (await self._render_and_upload([prompt], "fake pro"))[0]
+
+    @trace_service.traced("generate_image_fast")
+    async def generate_image_fast(self, prompt: str) -> str:
+        await self.flash_model.call("character_sheet", prompt)
+        return (await self._render_and_upload([prompt], "fake flash"))[0]
+
+    @trace_service.traced("generate_image_with_reference")
+    async def generate_image_with_reference(
+        self, prompt: str, reference_image_url: str, preview: bool = False, use_cache: bool = True
+    ) -> str:
+        await self.storage.fetch(reference_image_url)
+        if preview:
+            await self.flash_model.call("episode_preview", prompt)
+            return (await self._render_and_upload([prompt], "fake preview"))[0]
+        await self.model.call("episode", prompt)
+        return (await self._render_and_upload([prompt], "fake pro"))[0]
+
+    @trace_service.traced("generate_packed_with_reference")
+    async def generate_packed_with_reference(self, prompts: list[str], reference_image_url: str) -> list[str]:
+        await self.storage.fetch(reference_image_url)
+        await self.model.call("episode_packed", "\n".join(prompts))
+        return await self._render_and_upload(prompts, "fake packed")
@@ -0,0 +1,138 @@
+import asyncio
+import hashlib
+import logging
+
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import async_session
+from app.models import ImageCacheEntry
+from app.models.models import now_kst
+from app.services.lifecycle_service import spawn_background
+from app.services.metrics_service import metrics_service
+from app.services.trace_service import trace_service
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(prompt: str, reference_image: bytes | None, model: str, image_size: str | None, aspect_ratio: str) -> str:
+    """프롬프트 + 레퍼런스 이미지 내용 + 모델 + 이미지 설정 해시
+
+    레퍼런스는 URL이 아니라 내용으로 해시한다 (캐릭터 시트는 만들 때마다 새 URL이라 URL로는 적중하지 않음).
+    """
+    reference = hashlib.sha256(reference_image).hexdigest() if reference_image else ""
+    raw = "\n".join([model, image_size or "", aspect_ratio, reference, prompt])
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class ImageCacheService:
+    """생성된 이미지 URL 캐시 (DB 저장, 최근 사용 기준 LRU 정리)
+
+    같은 시나리오 재실행(재시도, 재제출)에서 이미지 호출을 건너뛰기 위한 용도.
+    캐시 조회/저장 실패는 생성 흐름에 영향을 주지 않는다.
+    적중 기록(hit_count, last_used_at)은 조회마다 쓰지 않고 모아 두었다가 image_cache_touch_interval마다 반영한다.
+    """
+
+    def __init__(self):
+        # 아직 반영하지 않은 적중 횟수 (key → 횟수)
+        self._hits: dict[str, int] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    async def lookup(self, keys: list[str]) -> str | None:
+        """keys 순서대로 조회해서 처음 찾은 이미지 URL 반환 (없으면 None)"""
+        if not settings.image_cache_enabled:
+            return None
+        try:
+            async with async_session() as db:
+                result = await db.execute(
+                    select(ImageCacheEntry.key, ImageCacheEntry.image_path).where(ImageCacheEntry.key.in_(keys))
+                )
+                paths = dict(result.all())
+            for key in keys:
+                if key in paths:
+                    self._touch(key)
+                    self._observe(hit=True)
+                    trace_service.annotate(cache="hit")
+                    return paths[key]
+        except Exception as e:
+            logger.warning(f"이미지 캐시 조회 실패: {e}")
+        self._observe(hit=False)
+        return None
+
+    def store(self, key: str, image_path: str, model: str, image_size: str | None) -> None:
+        """생성 결과 저장 (같은 키면 최신 결과로 교체)"""
+        if not settings.image_cache_enabled:
+            return
+        spawn_background(self._save(key, image_path, model, image_size))
+
+    async def flush(self) -> None:
+        """모아 둔 적중 기록을 한 번에 반영 (종료 시에도 호출)"""
+        hits, self._hits = self._hits, {}
+        if not hits:
+            return
+        try:
+            async with async_session() as db:
+                await self._apply_hits(db, hits)
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"이미지 캐시 적중 기록 실패: {e}")
+
+    @staticmethod
+    async def _apply_hits(db: AsyncSession, hits: dict[str, int]) -> None:
+        if not hits:
+            return
+        table = ImageCacheEntry.__table__
+        await db.execute(
+            update(table)
+            .where(table.c.key == bindparam("hit_key"))
+            .values(hit_count=table.c.hit_count + bindparam("hits"), last_used_at=now_kst()),
+            [{"hit_key": key, "hits": count} for key, count in hits.items()],
+        )
+
+    def _touch(self, key: str) -> None:
+        self._hits[key] = self._hits.get(key, 0) + 1
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(settings.image_cache_touch_interval)
+        self._flush_task = None
+        await self.flush()
+
+    def _observe(self, hit: bool) -> None:
+        metrics_service.incr("image.cache.hit" if hit else "image.cache.miss")
+        # 최근 적중률 (/debug/metrics의 distributions.image.cache.hit_ratio.mean)
+        metrics_service.observe("image.cache.hit_ratio", 1 if hit else 0)
+
+    async def _save(self, key: str, image_path: str, model: str, image_size: str | None) -> None:
+        """새 세션으로 저장 후 최대 개수를 넘으면 오래 안 쓴 항목부터 삭제 (내부용)"""
+        try:
+            async with async_session() as db:
+                await db.merge(ImageCacheEntry(
+                    key=key,
+                    image_path=image_path,
+                    model=model,
+                    image_size=image_size,
+                    last_used_at=now_kst(),
+                ))
+                await db.commit()
+
+                count = await db.scalar(select(func.count()).select_from(ImageCacheEntry))
+                overflow = count - settings.image_cache_max_entries
+                if overflow > 0:
+                    # 오래 안 쓴 항목을 고르기 전에 모아 둔 적중 기록 반영
+                    hits, self._hits = self._hits, {}
+                    await self._apply_hits(db, hits)
+                    # MySQL은 같은 테이블 서브쿼리/IN 안의 LIMIT을 지원하지 않으므로 키를 먼저 조회
+                    stale = await db.scalars(
+                        select(ImageCacheEntry.key).order_by(ImageCacheEntry.last_used_at).limit(overflow)
+                    )
+                    await db.execute(delete(ImageCacheEntry).where(ImageCacheEntry.key.in_(stale.all())))
+                    await db.commit()
+                    metrics_service.incr("image.cache.evicted", overflow)
+        except Exception as e:
+            logger.warning(f"이미지 캐시 저장 실패: {e}")
+
+
+image_cache_service = ImageCacheService()
@@ -1,194 +1,440 @@
 import asyncio
 import logging
-import uuid
+import random
+import time
 from abc import ABC, abstractmethod
 from io import BytesIO
+from typing import NamedTuple
 
-import httpx
-import boto3
 from google import genai
 from google.genai import types
+from PIL import Image
 
 from app.config import settings
+from app.services.image_cache_service import image_cache_service, make_cache_key
+from app.services.metrics_service import metrics_service
+from app.services.storage_service import StorageInterface
+from app.services.trace_service import trace_service
+from app.services.usage_service import usage_service
 
 logger = logging.getLogger(__name__)
 
+ASPECT_RATIO = "9:16"
+
+# 에피소드 묶음 생성: 9:16 컷 2개를 1:1 캔버스에 좌우로 배치 (API에 9:32 비율이 없음)
+PACKED_ASPECT_RATIO = "1:1"
+PACKED_GUTTER_RATIO = 0.02  # 가운데 세로 여백 (전체 폭 대비)
+PACKED_POSITIONS = ("LEFT", "RIGHT")
+
+REFERENCE_INSTRUCTION = """The attached image is a CHARACTER SHEET and STYLE REFERENCE.
+You MUST maintain exactly:
+- Same character designs (appearance, clothing, accessories)
+- Same art style (line thickness, coloring method)
+- Same color palette and tone
+- Same background atmosphere
+
+Now draw the following scene using these characters and style:
+
+"""
+
+PACKED_LAYOUT_INSTRUCTION = """**LAYOUT CONTRACT (must follow exactly):**
+- Draw {count} INDEPENDENT comic pages side-by-side in this single square image.
+- Each page fills exactly one vertical column of equal width ({positions}), with a plain white vertical gutter ({gutter}% of the width) between them.
+- Nothing crosses the gutter. Each page has its own background, characters and speech bubbles.
+- Keep all important content (faces, speech bubbles, text) away from the top and bottom 7% of the image.
+
+"""
+
+
+def split_packed_image(image_bytes: bytes, count: int) -> list[bytes]:
+    """좌우로 나란히 그린 묶음 이미지를 컷별 9:16 PNG로 분리 (CPU 작업, executor에서 실행)"""
+    with Image.open(BytesIO(image_bytes)) as image:
+        image = image.convert("RGB")
+        width, height = image.size
+        column = width / count
+        gutter = round(width * PACKED_GUTTER_RATIO / 2)
+        # 컬럼 폭 기준 9:16 높이만큼 가운데에서 잘라냄
+        crop_height = min(height, round((column - 2 * gutter) * 16 / 9))
+        top = (height - crop_height) // 2
+
+        parts = []
+        for i in range(count):
+            left = round(i * column) + gutter
+            right = round((i + 1) * column) - gutter
+            buffer = BytesIO()
+            image.crop((left, top, right, top + crop_height)).save(buffer, format="PNG")
+            parts.append(buffer.getvalue())
+    return parts
+
 
 class ImageServiceInterface(ABC):
     """이미지 생성 서비스 인터페이스"""
 
     @abstractmethod
-    async def generate_image(self, prompt: str) -> str:
-        """프롬프트로 이미지를 생성하고 URL 반환"""
+    async def generate_image(self, prompt: str, preview: bool = False, use_cache: bool = True) -> str:
+        """프롬프트로 이미지를 생성하고 URL 반환 (preview: 빠른 저화질 모델, use_cache=False면 캐시 조회 생략)"""
         pass
 
     @abstractmethod
-    async def generate_image_with_reference(self, prompt: str, reference_image_url: str) -> str:
-        """레퍼런스 이미지를 참조하여 이미지를 생성하고 URL 반환"""
+    async def generate_image_fast(self, prompt: str) -> str:
+        """빠른 모델로 이미지를 생성하고 URL 반환 (캐릭터 시트용)"""
         pass
 
+    @abstractmethod
+    async def generate_image_with_reference(
+        self, prompt: str, reference_image_url: str, preview: bool = False, use_cache: bool = True
+    ) -> str:
+        """레퍼런스 이미지를 참조하여 이미지를 생성하고 URL 반환 (preview: 빠른 저화질 모델)"""
+        pass
 
-class NanoBananaImageService(ImageServiceInterface):
-    """NanoBanana (Gemini Image) API를 사용한 이미지 생성 서비스"""
+    @abstractmethod
+    async def generate_packed_with_reference(self, prompts: list[str], reference_image_url: str) -> list[str]:
+        """여러 에피소드를 이미지 1장으로 생성한 뒤 컷별로 분리해서 URL 목록 반환"""
+        pass
 
-    def __init__(self):
-        self.client = genai.Client(api_key=settings.gemini_api_key)
-        self.model = "gemini-3-pro-image-preview"
-        self.flash_model = "gemini-2.5-flash-image"
 
-        # S3 클라이언트
-        self.s3 = boto3.client(
-            "s3",
-            aws_access_key_id=settings.s3_access_key,
-            aws_secret_access_key=settings.s3_secret_key,
-            region_name=settings.s3_region,
-        )
-        self.bucket = settings.s3_bucket
+class Route(NamedTuple):
+    """이미지 생성 호출 1건의 모델/해상도 선택 결과"""
 
-    async def _generate_with_retry(self, prompt: str, model: str = None):
-        """재시도 로직이 포함된 이미지 생성 (즉시 3회 시도)"""
-        model = model or self.model
-        last_error = None
+    tier: str  # pro-2K | pro-1K | flash
+    model: str
+    image_size: str | None  # Flash 모델은 image_size 미지원 → None
 
-        for attempt in range(3):
-            try:
-                return await self.client.aio.models.generate_content(
-                    model=model,
-                    contents=[prompt],
-                    config=types.GenerateContentConfig(
-                        image_config=types.ImageConfig(
-                            aspect_ratio="9:16",
-                            image_size="2K",
-                        ),
-                        response_modalities=["IMAGE", "TEXT"],
-                    ),
-                )
-            except Exception as e:
-                last_error = e
-                logger.warning(f"이미지 생성 실패 (시도 {attempt + 1}/3): {type(e).__name__}: {e}")
 
-        logger.error(f"이미지 생성 최종 실패: {type(last_error).__name__}: {last_error}")
-        raise last_error
+class ImageModelRouter:
+    """실시간 지표로 에피소드 이미지의 모델/해상도를 선택
 
-    async def generate_image(self, prompt: str) -> str:
-        """Gemini API로 이미지 생성 후 S3에 업로드"""
-        response = await self._generate_with_retry(prompt)
+    최근 pro 모델 지연 p90, 에러율, 로컬 대기열(진행 중인 이미지 호출 수)을 보고
+    혼잡하면 pro 1K → flash 순으로 강등한다. 강등 중에도 일부 호출은 pro로 보내
+    지표가 회복되는지 확인한다.
+    """
 
-        for part in response.candidates[0].content.parts:
-            if part.inline_data is not None:
-                return await self.upload_bytes_to_s3(part.inline_data.data, prefix="toon-minutes")
+    def __init__(self, pro_model: str, flash_model: str):
+        self.pro_model = pro_model
+        self.flash_model = flash_model
+        self.in_flight = 0
 
-        raise ValueError("이미지 생성 실패: 응답에 이미지가 없습니다")
+    def ladder(self) -> list[Route]:
+        """품질 높은 순 route 목록"""
+        return [
+            Route("pro-2K", self.pro_model, "2K"),
+            Route("pro-1K", self.pro_model, "1K"),
+            Route("flash", self.flash_model, None),
+        ]
 
-    async def generate_image_fast(self, prompt: str) -> str:
-        """Flash 모델로 빠른 이미지 생성 (캐릭터 시트용)"""
-        last_error = None
+    def choose(self) -> Route:
+        pro = Route("pro-2K", self.pro_model, "2K")
+        if not settings.image_router_enabled:
+            return pro
 
-        for attempt in range(3):
-            try:
-                response = await self.client.aio.models.generate_content(
-                    model=self.flash_model,
-                    contents=[prompt],
-                    config=types.GenerateContentConfig(
-                        image_config=types.ImageConfig(
-                            aspect_ratio="9:16",
-                            # Flash 모델은 image_size 미지원
-                        ),
-                        response_modalities=["IMAGE", "TEXT"],
-                    ),
-                )
-                break
-            except Exception as e:
-                last_error = e
-                logger.warning(f"Flash 이미지 생성 실패 (시도 {attempt + 1}/3): {type(e).__name__}: {e}")
-        else:
-            logger.error(f"Flash 이미지 생성 최종 실패: {type(last_error).__name__}: {last_error}")
-            raise last_error
+        min_samples = settings.image_router_min_samples
+        # 지연은 pro-2K 기준 (1K 호출이 섞이면 강등 중 p90이 낮아져 너무 일찍 복귀함)
+        p90 = metrics_service.percentile(f"image.latency.{pro.tier}", 0.9, min_samples)
+        error_rate = metrics_service.mean(f"image.error.{self.pro_model}", min_samples)
+        depth = self.in_flight
 
-        for part in response.candidates[0].content.parts:
-            if part.inline_data is not None:
-                return await self.upload_bytes_to_s3(part.inline_data.data, prefix="toon-minutes")
-
-        raise ValueError("이미지 생성 실패: 응답에 이미지가 없습니다")
+        overloaded = (
+            depth >= settings.image_router_flash_queue_depth
+            or (error_rate is not None and error_rate >= settings.image_router_flash_error_rate)
+            or (p90 is not None and p90 >= settings.image_router_flash_latency)
+        )
+        congested = (
+            depth >= settings.image_router_degrade_queue_depth
+            or (p90 is not None and p90 >= settings.image_router_degrade_latency)
+        )
+        if not (overloaded or congested):
+            return pro
 
-    async def _fetch_image(self, url: str) -> bytes:
-        """URL에서 이미지 다운로드"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.content
+        # 강등 중 회복 확인용 프로브 (대기열이 가득 찬 경우는 제외)
+        if depth < settings.image_router_flash_queue_depth and random.random() < settings.image_router_probe_ratio:
+            return pro
+        if overloaded:
+            return Route("flash", self.flash_model, None)
+        return Route("pro-1K", self.pro_model, "1K")
 
-    async def _generate_with_reference_retry(self, prompt: str, reference_image: bytes):
-        """레퍼런스 이미지를 참조하여 이미지 생성 (즉시 3회 시도)"""
-        reference_instruction = """The attached image is a CHARACTER SHEET and STYLE REFERENCE.
-You MUST maintain exactly:
-- Same character designs (appearance, clothing, accessories)
-- Same art style (line thickness, coloring method)
-- Same color palette and tone
-- Same background atmosphere
 
-Now draw the following scene using these characters and style:
+class NanoBananaImageService(ImageServiceInterface):
+    """NanoBanana (Gemini Image) API를 사용한 이미지 생성 서비스"""
 
-"""
+    def __init__(self, storage: StorageInterface):
+        self.client = genai.Client(api_key=settings.gemini_api_key)
+        self.model = "gemini-3-pro-image-preview"
+        self.flash_model = "gemini-2.5-flash-image"
+        self.router = ImageModelRouter(self.model, self.flash_model)
+        self.storage = storage
+
+    async def _call_model(
+        self,
+        route: Route,
+        contents: list,
+        call_type: str,
+        attempt: int,
+        aspect_ratio: str = ASPECT_RATIO,
+        observe_latency: bool = True,
+    ):
+        """generate_content 1회 호출 + tier별 지연, 모델별 에러, 대기열 지표 기록
+
+        observe_latency가 켜져 있으면 취소된 호출도 취소될 때까지 걸린 시간을 지연으로 기록한다
+        (끝까지 기다렸다면 최소 그만큼 걸렸으므로, 빼면 느린 호출이 빠져 p90이 계속 낮아짐).
+        """
+        image_config = (
+            types.ImageConfig(aspect_ratio=aspect_ratio, image_size=route.image_size)
+            if route.image_size
+            else types.ImageConfig(aspect_ratio=aspect_ratio)
+        )
+        self.router.in_flight += 1
+        metrics_service.set_gauge("image.in_flight", self.router.in_flight)
+        start = time.perf_counter()
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=route.model,
+                contents=contents,
+                config=types.GenerateContentConfig(
+                    image_config=image_config,
+                    response_modalities=["IMAGE", "TEXT"],
+                ),
+            )
+        except asyncio.CancelledError:
+            if observe_latency:
+                metrics_service.observe(f"image.latency.{route.tier}", time.perf_counter() - start)
+            raise
+        except Exception:
+            metrics_service.observe(f"image.error.{route.model}", 1)
+            raise
+        finally:
+            self.router.in_flight -= 1
+            metrics_service.set_gauge("image.in_flight", self.router.in_flight)
+
+        elapsed = time.perf_counter() - start
+        metrics_service.observe(f"image.error.{route.model}", 0)
+        if observe_latency:
+            metrics_service.observe(f"image.latency.{route.tier}", elapsed)
+        usage_service.record(call_type, route.model, response, elapsed, attempt)
+        return response
+
+    def _hedge_delay(self, tier: str) -> float | None:
+        """헤지 요청을 보낼 대기 시간 (해당 tier의 최근 p90, 샘플이 부족하면 헤지 안 함)"""
+        if not settings.hedge_enabled:
+            return None
+        return metrics_service.percentile(f"image.latency.{tier}", 0.9, settings.hedge_min_samples)
+
+    async def _call_model_hedged(
+        self, route: Route, contents: list, call_type: str, attempt: int, aspect_ratio: str = ASPECT_RATIO
+    ):
+        """호출이 같은 tier의 최근 p90보다 오래 걸리면 같은 요청을 하나 더 보내 먼저 끝난 쪽 사용
+
+        추가 호출 비율은 hedge_budget_ratio로 제한하고, 진 쪽은 취소한다.
+        지연 분포(헤지 기준 p90)는 원래 호출로만 집계한다: 늦게 시작한 헤지 호출까지 넣으면
+        분포가 짧은 쪽으로 치우치고, 원래 호출은 져서 취소돼도 그때까지의 시간을 기록한다.
+        """
+        delay = self._hedge_delay(route.tier)
+        if delay is None:
+            return await self._call_model(route, contents, call_type, attempt, aspect_ratio)
+
+        primary = asyncio.create_task(self._call_model(route, contents, call_type, attempt, aspect_ratio))
+        hedge = None
+        # 기다리는 중에 호출한 쪽이 취소돼도 원래 호출이 남아 돌지 않도록 만든 직후부터 정리 보장
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            issued_ratio = metrics_service.mean("image.hedge.issued") or 0
+            if done or issued_ratio >= settings.hedge_budget_ratio:
+                if not done:
+                    metrics_service.incr("image.hedge.skipped_budget")
+                metrics_service.observe("image.hedge.issued", 0)
+                return await primary
+
+            metrics_service.observe("image.hedge.issued", 1)
+            metrics_service.incr("image.hedge.launched")
+            trace_service.annotate(hedged=True)
+            logger.info(f"헤지 요청 시작 ({route.tier}, {delay:.1f}s 초과)")
+            hedge = asyncio.create_task(
+                self._call_model(route, contents, call_type, attempt, aspect_ratio, observe_latency=False)
+            )
+
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    if finished.exception() is None:
+                        won = "won" if finished is hedge else "lost"
+                        metrics_service.incr(f"image.hedge.{won}")
+                        trace_service.annotate(hedge_result=won)
+                        return finished.result()
+            # 둘 다 실패: 원래 호출의 에러를 올리고 헤지 쪽 에러는 로그 + 원인으로 연결
+            hedge_error = hedge.exception()
+            logger.warning(f"헤지 요청도 실패 ({route.tier}): {type(hedge_error).__name__}: {hedge_error}")
+            raise primary.exception() from hedge_error
+        finally:
+            for t in (primary, hedge):
+                if t is not None and not t.done():
+                    t.cancel()
+
+    async def _generate_with_retry(
+        self,
+        contents: list,
+        call_type: str,
+        route: Route = None,
+        label: str = "이미지",
+        aspect_ratio: str = ASPECT_RATIO,
+    ):
+        """재시도 로직이 포함된 이미지 생성 (즉시 3회 시도), (응답, 사용한 route) 반환
+
+        route를 지정하지 않으면 시도마다 라우터가 모델/해상도를 다시 고른다.
+        """
         last_error = None
 
         for attempt in range(3):
+            current = route or self.router.choose()
+            trace_service.annotate(attempts=attempt + 1)
+            if route is None:
+                # 라우팅된 호출만 tier 기록 (태스크의 image_tier 집계용)
+                metrics_service.incr(f"image.route.{current.tier}")
+                trace_service.annotate(tier=current.tier)
             try:
-                return await self.client.aio.models.generate_content(
-                    model=self.model,
-                    contents=[
-                        types.Part.from_bytes(data=reference_image, mime_type="image/png"),
-                        reference_instruction + prompt,
-                    ],
-                    config=types.GenerateContentConfig(
-                        image_config=types.ImageConfig(
-                            aspect_ratio="9:16",
-                            image_size="2K",
-                        ),
-                        response_modalities=["IMAGE", "TEXT"],
-                    ),
-                )
+                if route is None:
+                    response = await self._call_model_hedged(current, contents, call_type, attempt + 1, aspect_ratio)
+                else:
+                    response = await self._call_model(current, contents, call_type, attempt + 1, aspect_ratio)
+                return response, current
             except Exception as e:
                 last_error = e
-                logger.warning(f"레퍼런스 이미지 생성 실패 (시도 {attempt + 1}/3): {type(e).__name__}: {e}")
+                logger.warning(f"{label} 생성 실패 (시도 {attempt + 1}/3, {current.tier}): {type(e).__name__}: {e}")
 
-        logger.error(f"레퍼런스 이미지 생성 최종 실패: {type(last_error).__name__}: {last_error}")
+        logger.error(f"{label} 생성 최종 실패: {type(last_error).__name__}: {last_error}")
         raise last_error
 
-    async def generate_image_with_reference(self, prompt: str, reference_image_url: str) -> str:
-        """레퍼런스 이미지를 참조하여 이미지 생성 후 S3에 업로드"""
-        # 레퍼런스 이미지 다운로드
-        reference_image = await self._fetch_image(reference_image_url)
-
-        # 레퍼런스와 함께 이미지 생성
-        response = await self._generate_with_reference_retry(prompt, reference_image)
-
+    def _first_image_bytes(self, response) -> bytes:
         for part in response.candidates[0].content.parts:
             if part.inline_data is not None:
-                return await self.upload_bytes_to_s3(part.inline_data.data, prefix="toon-minutes")
+                return part.inline_data.data
 
         raise ValueError("이미지 생성 실패: 응답에 이미지가 없습니다")
 
-    async def upload_bytes_to_s3(self, image_bytes: bytes, prefix: str = "meeting-img") -> str:
-        """바이트 데이터를 S3에 업로드하고 URL 반환"""
-        filename = f"{prefix}/{uuid.uuid4()}.png"
-
-        # run_in_executor로 동기 S3 업로드를 비동기로 실행
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            lambda: self.s3.upload_fileobj(
-                BytesIO(image_bytes),
-                self.bucket,
-                filename,
-                ExtraArgs={
-                    "ContentType": "image/png",
-                    "ACL": "public-read",
-                },
+    async def _upload_first_image(self, response) -> str:
+        return await self.storage.upload(self._first_image_bytes(response), prefix="toon-minutes")
+
+    def _cache_keys(self, prompt: str, reference_image: bytes | None, route: Route | None) -> list[str]:
+        """캐시 조회 키 목록 (라우팅 호출은 지금 라우터가 고를 tier 이상의 결과까지 허용)"""
+        if route is not None:
+            routes = [route]
+        else:
+            ladder = self.router.ladder()
+            routes = ladder[: ladder.index(self.router.choose()) + 1]
+        return [
+            make_cache_key(prompt, reference_image, r.model, r.image_size, ASPECT_RATIO)
+            for r in routes
+        ]
+
+    async def _generate_cached(
+        self,
+        prompt: str,
+        reference_image: bytes | None,
+        route: Route | None,
+        use_cache: bool,
+        generate,
+    ) -> str:
+        """캐시에 있으면 생성 생략, 없으면 generate()로 (응답, route) 생성 후 업로드 + 캐시 저장"""
+        if use_cache:
+            cached = await image_cache_service.lookup(self._cache_keys(prompt, reference_image, route))
+            if cached:
+                return cached
+
+        response, used = await generate()
+        path = await self._upload_first_image(response)
+        image_cache_service.store(
+            make_cache_key(prompt, reference_image, used.model, used.image_size, ASPECT_RATIO),
+            path, used.model, used.image_size,
+        )
+        return path
+
+    @trace_service.traced("generate_image")
+    async def generate_image(self, prompt: str, preview: bool = False, use_cache: bool = True) -> str:
+        """Gemini API로 이미지 생성 후 저장소에 업로드 (preview면 flash 모델로 빠르게)"""
+        if preview:
+            # 프리뷰는 곧 최종본으로 교체되므로 캐시하지 않음
+            response, _ = await self._generate_with_retry(
+                [prompt],
+                call_type="episode_preview",
+                route=Route("flash", self.flash_model, None),
+                label="프리뷰 이미지",
+            )
+            return await self._upload_first_image(response)
+        return await self._generate_cached(
+            prompt, None, None, use_cache,
+            lambda: self._generate_with_retry([prompt], call_type="image"),
+        )
+
+    @trace_service.traced("generate_image_fast")
+    async def generate_image_fast(self, prompt: str) -> str:
+        """Flash 모델로 빠른 이미지 생성 (캐릭터 시트용)"""
+        route = Route("flash", self.flash_model, None)
+        return await self._generate_cached(
+            prompt, None, route, True,
+            lambda: self._generate_with_retry(
+                [prompt],
+                call_type="character_sheet",
+                route=route,
+                label="Flash 이미지",
             ),
         )
 
-        return f"https://{self.bucket}.s3.{settings.s3_region}.amazonaws.com/{filename}"
+    @trace_service.traced("generate_image_with_reference")
+    async def generate_image_with_reference(
+        self, prompt: str, reference_image_url: str, preview: bool = False, use_cache: bool = True
+    ) -> str:
+        """레퍼런스 이미지를 참조하여 이미지 생성 후 저장소에 업로드 (preview면 flash 모델로 빠르게)
+
+        최종본은 이미지 캐시를 거친다 (키는 레퍼런스 이미지 내용 기준, 캐시 적중 시 생성 생략).
+        """
+        # 레퍼런스 이미지 다운로드
+        reference_image = await self.storage.fetch(reference_image_url)
+
+        async def generate():
+            # 레퍼런스와 함께 이미지 생성 (preview는 flash 고정, 최종본은 라우터가 선택)
+            return await self._generate_with_retry(
+                [
+                    types.Part.from_bytes(data=reference_image, mime_type="image/png"),
+                    REFERENCE_INSTRUCTION + prompt,
+                ],
+                call_type="episode_preview" if preview else "episode",
+                route=Route("flash", self.flash_model, None) if preview else None,
+                label="레퍼런스 이미지",
+            )
+
+        if preview:
+            # 프리뷰는 곧 최종본으로 교체되므로 캐시하지 않음
+            response, _ = await generate()
+            return await self._upload_first_image(response)
+        return await self._generate_cached(prompt, reference_image, None, use_cache, generate)
+
+    @trace_service.traced("generate_packed_with_reference")
+    async def generate_packed_with_reference(self, prompts: list[str], reference_image_url: str) -> list[str]:
+        """에피소드 2개를 한 장에 좌우로 그리게 한 뒤 Pillow로 잘라서 컷별 URL 반환"""
+        positions = PACKED_POSITIONS[: len(prompts)]
+        layout = PACKED_LAYOUT_INSTRUCTION.format(
+            count=len(prompts),
+            positions=", ".join(positions),
+            gutter=round(PACKED_GUTTER_RATIO * 100),
+        )
+        scenes = "\n\n".join(
+            f"[{position} page]\n{prompt}" for position, prompt in zip(positions, prompts)
+        )
 
+        reference_image = await self.storage.fetch(reference_image_url)
+        response, _ = await self._generate_with_retry(
+            [
+                types.Part.from_bytes(data=reference_image, mime_type="image/png"),
+                REFERENCE_INSTRUCTION + layout + scenes,
+            ],
+            call_type="episode_packed",
+            label="묶음 이미지",
+            aspect_ratio=PACKED_ASPECT_RATIO,
+        )
 
-image_service = NanoBananaImageService()
+        loop = asyncio.get_running_loop()
+        parts = await loop.run_in_executor(
+            None, split_packed_image, self._first_image_bytes(response), len(prompts)
+        )
+        return list(await asyncio.gather(*[
+            self.storage.upload(part, prefix="toon-minutes") for part in parts
+        ]))
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import timedelta
+
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
+
+from app.config import settings
+from app.database import async_session
+from app.models import Lease
+from app.models.models import now_kst
+
+logger = logging.getLogger(__name__)
+
+# 프로세스(워커) 식별자: 재시작하면 새 값
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class LeaderElection:
+    """DB lease 기반 리더 선출
+
+    워커가 여러 개일 때 헬스체크/고아 태스크 정리 같은 싱글톤 루프를 리더 1곳에서만 돌린다.
+    리더는 TTL의 1/3마다 lease를 갱신하고, 갱신이 끊기면 TTL 후 다른 워커가 가져간다.
+    single 모드에서는 DB를 쓰지 않고 항상 리더로 동작한다.
+
+    멀티 워커 모드 (MULTI_WORKER=true, uvicorn --workers N 또는 여러 호스트가 같은 DB 사용):
+    - 태스크 소유 워커와 진행 여부는 Task.worker_id / heartbeat_at으로 DB에서 공유
+    - 워커가 죽으면 stale_task_seconds 후 리더의 sweep이 태스크를 가져가 이어서 생성
+    - 지표(/debug/metrics), 모델 라우터 상태, 이미지 캐시 조회 통계는 워커별로 따로 집계
+    - SQLite는 단일 호스트에서만 사용 (여러 호스트는 PostgreSQL 등 공유 DB 필요)
+    """
+
+    def __init__(self, name: str = "leader", worker_id: str = WORKER_ID):
+        self.name = name
+        self.worker_id = worker_id
+        self.is_leader = False
+        self._renew_task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if not settings.multi_worker:
+            self.is_leader = True
+            return
+        await self._acquire()
+        self._renew_task = asyncio.create_task(self._renew_loop())
+
+    async def stop(self) -> None:
+        """lease 반납 (다른 워커가 TTL을 기다리지 않고 바로 리더가 되도록)"""
+        if self._renew_task:
+            self._renew_task.cancel()
+            self._renew_task = None
+        if not settings.multi_worker or not self.is_leader:
+            return
+        try:
+            async with async_session() as db:
+                await db.execute(
+                    update(Lease)
+                    .where(Lease.name == self.name, Lease.holder == self.worker_id)
+                    .values(expires_at=now_kst())
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"리더 lease 반납 실패: {e}")
+        self.is_leader = False
+
+    async def _acquire(self) -> None:
+        """내가 가진 lease면 연장, 만료된 lease면 가져옴 (조건부 UPDATE 1회로 원자적 처리)"""
+        now = now_kst()
+        expires_at = now + timedelta(seconds=settings.leader_lease_ttl)
+        was_leader = self.is_leader
+        try:
+            async with async_session() as db:
+                result = await db.execute(
+                    update(Lease)
+                    .where(Lease.name == self.name, or_(Lease.holder == self.worker_id, Lease.expires_at < now))
+                    .values(holder=self.worker_id, expires_at=expires_at)
+                )
+                acquired = result.rowcount == 1
+                if result.rowcount == 0 and await db.get(Lease, self.name) is None:
+                    db.add(Lease(name=self.name, holder=self.worker_id, expires_at=expires_at))
+                    try:
+                        await db.flush()
+                        acquired = True
+                    except IntegrityError:
+                        # 다른 워커가 먼저 생성
+                        await db.rollback()
+                        acquired = False
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"리더 lease 갱신 실패: {e}")
+            acquired = False
+
+        self.is_leader = acquired
+        if acquired and not was_leader:
+            logger.info(f"리더 선출됨: {self.worker_id}")
+        elif was_leader and not acquired:
+            logger.warning(f"리더 lease 상실: {self.worker_id}")
+
+    async def _renew_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.leader_lease_ttl / 3)
+            await self._acquire()
+
+
+leader_election = LeaderElection()
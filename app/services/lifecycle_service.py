@@ -0,0 +1,241 @@
+import asyncio
+import logging
+from contextlib import contextmanager
+from datetime import timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import async_session
+from app.models import Task, Comic
+from app.models.models import now_kst
+from app.services.leader_service import WORKER_ID, leader_election
+
+logger = logging.getLogger(__name__)
+
+INTERRUPTED_MESSAGE = "서버가 재시작되어 작업이 중단됐어요. 다시 시도해 주세요."
+
+# fire-and-forget task가 GC되지 않도록 참조 유지
+_background_tasks: set[asyncio.Task] = set()
+
+
+def spawn_background(coro) -> asyncio.Task:
+    """결과를 기다리지 않는 부수 작업(알림, 사용량/캐시 저장, 정리)을 task로 실행"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+class LifecycleService:
+    """만화 생성 파이프라인 실행/종료 관리
+
+    - spawn: 파이프라인을 요청과 분리된 task로 실행하고 in-flight 목록에 등록
+      (Task.worker_id / heartbeat_at으로 DB에도 소유 워커를 기록)
+    - drain: 새 작업을 받지 않고, 진행 중인 파이프라인을 deadline까지 기다림 (undrain으로 되돌림)
+    - sweep: heartbeat가 끊긴 pending/processing 태스크를
+      저장된 시나리오로 이어서 생성하거나 실패 처리 (멀티 워커에서는 리더만 실행)
+    """
+
+    def __init__(self):
+        self.draining = False
+        self._pipelines: dict[str, asyncio.Task] = {}
+        self._admitting: set[str] = set()
+        self._sweep_task: asyncio.Task | None = None
+        self._heartbeat_task: asyncio.Task | None = None
+        self._resume = None
+
+    @property
+    def in_flight(self) -> list[str]:
+        return list(self._pipelines)
+
+    def spawn(self, task_id: str, pipeline) -> None:
+        """pipeline(db) 코루틴을 새 DB 세션으로 실행"""
+        async def run():
+            async with async_session() as db:
+                await db.execute(
+                    update(Task).where(Task.id == task_id).values(worker_id=WORKER_ID, heartbeat_at=now_kst())
+                )
+                await db.commit()
+                await pipeline(db)
+
+        task = asyncio.create_task(run())
+        self._pipelines[task_id] = task
+        task.add_done_callback(lambda _: self._pipelines.pop(task_id, None))
+
+    @contextmanager
+    def admitting(self, task_id: str):
+        """요청 핸들러가 검증 중인 태스크 (spawn 전까지 heartbeat 갱신, 이 워커의 sweep 대상에서 제외)
+
+        검증(재시도 포함)이나 긴 입력 분석이 stale_task_seconds를 넘어도 중단된 것으로 보지 않도록 한다.
+        태스크는 worker_id / heartbeat_at을 넣어서 생성할 것.
+        """
+        self._admitting.add(task_id)
+        try:
+            yield
+        finally:
+            self._admitting.discard(task_id)
+
+    async def start(self, resume) -> None:
+        """시작 시 고아 태스크 정리 후 주기적 정리 루프 시작 (resume: 시나리오가 저장된 태스크를 이어서 생성할 파이프라인)"""
+        self._resume = resume
+        if not settings.multi_worker:
+            # 롤링 재시작 중에는 이전 프로세스가 아직 drain하며 실행 중일 수 있으므로
+            # 시작 시에도 heartbeat가 끊긴 태스크만 정리 (나머지는 stale이 된 뒤 주기적 정리에서)
+            await self.sweep(settings.stale_task_seconds)
+        self._start_loops()
+
+    def _start_loops(self) -> None:
+        if self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        if self._sweep_task is None:
+            self._sweep_task = asyncio.create_task(self._sweep_loop())
+
+    async def drain(self, timeout: float = None) -> None:
+        """새 작업 접수 중단 후 진행 중인 파이프라인을 timeout까지 대기
+
+        시간 안에 끝나지 않은 파이프라인은 취소하고 상태를 그대로 두어,
+        다음 시작 시 sweep이 이어서 처리하도록 한다.
+        """
+        timeout = settings.shutdown_drain_timeout if timeout is None else timeout
+        self.draining = True
+        if self._sweep_task:
+            self._sweep_task.cancel()
+            self._sweep_task = None
+
+        pending = set(self._pipelines.values())
+        if not pending:
+            self._stop_heartbeat()
+            return
+        logger.info(f"drain 시작: 진행 중인 파이프라인 {len(pending)}개 (최대 {timeout:.0f}s 대기)")
+        _, pending = await asyncio.wait(pending, timeout=timeout)
+        if pending:
+            logger.warning(f"drain 시간 초과: 파이프라인 {len(pending)}개 취소 (다음 시작 시 재개)")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        else:
+            logger.info("drain 완료")
+        # heartbeat를 멈춰야 취소된 태스크를 다른 워커가 stale로 보고 가져감
+        self._stop_heartbeat()
+
+    def undrain(self) -> None:
+        """drain 취소: 새 작업 접수와 heartbeat/정리 루프 재개
+
+        drain 시간 초과로 취소된 파이프라인은 되살리지 않고, stale이 되면 sweep이 이어서 처리한다.
+        """
+        if not self.draining:
+            return
+        self.draining = False
+        if self._resume is not None:
+            self._start_loops()
+        logger.info("drain 취소: 새 작업 접수 재개")
+
+    def _stop_heartbeat(self) -> None:
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+
+    async def sweep(self, stale_after: float) -> None:
+        """이 프로세스에서 실행 중이 아닌 미완료 태스크 정리
+
+        stale_after초 이상 heartbeat(없으면 updated_at)가 없는 태스크가 대상이다.
+        여러 워커가 동시에 정리해도 한 곳만 가져가도록 heartbeat 조건부 UPDATE로 선점한다.
+        """
+        last_seen = func.coalesce(Task.heartbeat_at, Task.updated_at)
+        query = select(Task).where(
+            Task.status.in_(["pending", "processing", "preview"]),
+            last_seen < now_kst() - timedelta(seconds=stale_after),
+        )
+
+        async with async_session() as db:
+            tasks = [
+                t for t in (await db.execute(query)).scalars()
+                if t.id not in self._pipelines and t.id not in self._admitting
+            ]
+            for task in tasks:
+                if not await self._claim(db, task):
+                    continue
+
+                result = await db.execute(select(Comic.id).where(Comic.task_id == task.id, Comic.panels_json.isnot(None)).limit(1))
+                if result.scalar_one_or_none():
+                    logger.info(f"[Task {task.id[:8]}] 중단된 태스크 재개 ({task.status})")
+                    self.spawn(task.id, lambda db, task_id=task.id: self._resume(db, task_id))
+                else:
+                    # 시나리오가 저장되기 전에 중단됨: 실패 처리 (사용자가 /retry로 재시도 가능)
+                    logger.info(f"[Task {task.id[:8]}] 중단된 태스크 실패 처리 ({task.status})")
+                    task.status = "failed"
+                    task.error_message = INTERRUPTED_MESSAGE
+            await db.commit()
+
+    @staticmethod
+    async def _claim(db: AsyncSession, task: Task) -> bool:
+        """조회한 시점의 heartbeat가 그대로일 때만 이 워커로 가져옴 (동시에 정리해도 한 곳만 성공)"""
+        claimed = await db.execute(
+            update(Task)
+            .where(
+                Task.id == task.id,
+                Task.heartbeat_at.is_(None) if task.heartbeat_at is None else Task.heartbeat_at == task.heartbeat_at,
+            )
+            .values(worker_id=WORKER_ID, heartbeat_at=now_kst())
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return claimed.rowcount == 1
+
+    async def active_tasks(self) -> dict[str, list[str]]:
+        """DB 기준 워커별 진행 중인 태스크 (heartbeat가 살아 있는 것만)"""
+        cutoff = now_kst() - timedelta(seconds=settings.stale_task_seconds)
+        async with async_session() as db:
+            result = await db.execute(
+                select(Task.worker_id, Task.id)
+                .where(Task.status.in_(["pending", "processing", "preview"]), Task.heartbeat_at >= cutoff)
+            )
+            workers: dict[str, list[str]] = {}
+            for worker_id, task_id in result:
+                workers.setdefault(worker_id, []).append(task_id)
+            return workers
+
+    async def _heartbeat_loop(self) -> None:
+        """이 워커가 검증/실행 중인 태스크의 heartbeat 갱신"""
+        while True:
+            await asyncio.sleep(settings.task_heartbeat_interval)
+            task_ids = set(self._pipelines) | self._admitting
+            if not task_ids:
+                continue
+            try:
+                async with async_session() as db:
+                    await db.execute(
+                        update(Task)
+                        .where(Task.id.in_(task_ids), Task.worker_id == WORKER_ID)
+                        .values(heartbeat_at=now_kst())
+                        .execution_options(synchronize_session=False)
+                    )
+                    await db.commit()
+            except Exception as e:
+                logger.warning(f"태스크 heartbeat 갱신 실패: {e}")
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.task_sweep_interval)
+            if not leader_election.is_leader:
+                continue
+            try:
+                await self.sweep(settings.stale_task_seconds)
+            except Exception as e:
+                logger.warning(f"태스크 정리 실패: {e}")
+
+
+def require_accepting() -> None:
+    """drain 중이면 새 작업 요청 거절 (라우터 dependency)"""
+    if lifecycle_service.draining:
+        raise HTTPException(
+            status_code=503,
+            detail="서버 점검 중이에요. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": "30"},
+        )
+
+
+lifecycle_service = LifecycleService()
@@ -1,10 +1,18 @@
+import asyncio
 import logging
+import re
+import time
+from abc import ABC, abstractmethod
 
 from google import genai
 from google.genai import types
 
 from app.config import settings
-from app.schemas import PanelScenario, ValidationResult
+from app.logging_config import Truncated, sampled
+from app.schemas import PanelScenario, ValidationResult, ValidatedScenario, CharacterTagMapping
+from app.services.prompt_cache import PromptCacheManager, is_cache_error
+from app.services.trace_service import trace_service
+from app.services.usage_service import usage_service
 
 logger = logging.getLogger(__name__)
 
@@ -144,32 +152,164 @@ VALIDATION_PROMPT = """
 """.strip()
 
 
-class LLMService:
+COMBINED_PROMPT = f"""
+이 요청은 두 단계로 처리합니다. 아래 [1단계]로 입력을 판별하고, 허용된 경우에만 [2단계]로 만화 시나리오를 작성하세요.
+
+# [1단계] 입력 판별
+{VALIDATION_PROMPT}
+
+# [2단계] 만화 시나리오 작성
+{SYSTEM_PROMPT}
+
+# 응답 형식
+- is_valid, reject_reason, messages는 [1단계] 규칙을 따릅니다.
+- episodes는 [2단계]의 에피소드 목록입니다.
+- 거부(is_valid: false)인 경우 episodes는 빈 배열로 반환하세요.
+""".strip()
+
+
+RECONCILE_PROMPT = """
+입력은 긴 텍스트를 여러 부분으로 나눠 각각 만든 4컷 만화 에피소드들의 image_prompt 목록입니다.
+부분마다 따로 만들어져서, 같은 인물이 에피소드마다 다른 외형 묘사(Visual Tag)로 적혀 있을 수 있습니다.
+
+## 할 일
+- 같은 인물을 가리키는 외형 묘사들을 찾아 하나의 대표 묘사(canonical)로 통일하세요.
+- aliases에는 image_prompt에 실제로 적힌 묘사 문자열을 **한 글자도 바꾸지 말고 그대로** 복사하세요. (문자열 치환에 사용됩니다)
+- canonical은 가장 자세하고 자주 쓰인 묘사를 고르거나, 그 형식 그대로 다듬어 작성하세요.
+- 이미 모든 에피소드에서 같은 묘사를 쓰는 인물은 반환하지 마세요.
+- 스토리, 대사, 연출은 절대 바꾸지 마세요.
+""".strip()
+
+# 청크 분할 기준: 섹션 경계(마크다운 제목, 구분선, [섹션]) / 발화자 턴("이름: ...")
+_SECTION_RE = re.compile(r"^\s*(#{1,6}\s|={3,}|-{3,}|\[[^\]]{1,40}\]\s*$)")
+_SPEAKER_RE = re.compile(r"^\s*[^\s:：]{1,15}(\s[^\s:：]{1,10})?\s*[:：]")
+
+
+def split_meeting_text(text: str, chunk_size: int) -> list[str]:
+    """긴 텍스트를 섹션 경계와 발화자 턴 단위로 잘라 chunk_size 근처 크기의 청크로 묶음"""
+    # 1. 블록 분리: 섹션 시작, 발화자 턴, 빈 줄에서 새 블록
+    blocks: list[tuple[bool, str]] = []  # (섹션 시작 여부, 블록 텍스트)
+    current: list[str] = []
+    current_is_section = False
+    for line in text.splitlines():
+        is_section = bool(_SECTION_RE.match(line))
+        if current and (is_section or _SPEAKER_RE.match(line) or not line.strip()):
+            blocks.append((current_is_section, "\n".join(current)))
+            current, current_is_section = [], False
+        if line.strip():
+            if not current:
+                current_is_section = is_section
+            current.append(line)
+    if current:
+        blocks.append((current_is_section, "\n".join(current)))
+
+    # 2. 청크 묶기: 크기 초과 시 분리, 절반 이상 찼으면 섹션 경계에서 우선 분리
+    chunks: list[str] = []
+    buffer: list[str] = []
+    size = 0
+    for is_section, block in blocks:
+        if buffer and (size + len(block) > chunk_size or (is_section and size >= chunk_size // 2)):
+            chunks.append("\n".join(buffer))
+            buffer, size = [], 0
+        # 한 블록이 너무 길면(발화 하나가 매우 긴 경우) 글자 수로 자름
+        while len(block) > chunk_size:
+            chunks.append(block[:chunk_size])
+            block = block[chunk_size:]
+        buffer.append(block)
+        size += len(block) + 1
+    if buffer:
+        chunks.append("\n".join(buffer))
+    return chunks
+
+
+def _image_parts(images: list) -> list:
+    """이미지 bytes는 inline Part로, 이미 업로드된 Part(file URI)는 그대로 사용"""
+    return [
+        img if isinstance(img, types.Part) else types.Part.from_bytes(data=img, mime_type="image/png")
+        for img in images
+    ]
+
+
+class LLMServiceInterface(ABC):
+    """회의록 검증 / 시나리오 생성 서비스 인터페이스
+
+    images에는 이미지 bytes 또는 첨부 저장소가 만든 Part를 넣는다.
+    """
+
+    @abstractmethod
+    async def validate_input(self, text: str, images: list = None) -> ValidationResult:
+        """입력이 만화로 만들 수 있는 내용인지 검증"""
+        pass
+
+    @abstractmethod
+    async def validate_and_analyze(self, text: str, images: list = None) -> ValidatedScenario:
+        """검증 + 시나리오 생성을 1회 호출로 처리 (single 모드)"""
+        pass
+
+    @abstractmethod
+    async def analyze_meeting(self, meeting_text: str, images: list = None) -> list[PanelScenario]:
+        """회의록을 에피소드별 이미지 프롬프트로 변환"""
+        pass
+
+    async def start(self) -> None:
+        """시작 시 준비 작업 (기본: 없음)"""
+
+    async def stop(self) -> None:
+        """종료 시 정리 작업 (기본: 없음)"""
+
+
+class LLMService(LLMServiceInterface):
     """Gemini LLM을 사용한 회의록 분석 서비스"""
 
     def __init__(self):
         self.client = genai.Client(api_key=settings.gemini_api_key)
         self.model = "gemini-3-flash-preview"
 
-    async def _generate_with_retry(self, contents, config):
+        # 정적 시스템 프롬프트는 컨텍스트 캐시로 재사용 (불가 시 인라인)
+        self.prompt_cache = PromptCacheManager(self.client, self.model)
+        self.prompt_cache.register("validate", VALIDATION_PROMPT)
+        self.prompt_cache.register("scenario", SYSTEM_PROMPT)
+        if settings.llm_mode == "single":
+            self.prompt_cache.register("combined", COMBINED_PROMPT)
+
+    async def start(self) -> None:
+        """컨텍스트 캐시 생성 + 갱신 루프 시작"""
+        await self.prompt_cache.start()
+
+    async def stop(self) -> None:
+        await self.prompt_cache.stop()
+
+    async def _generate_with_retry(self, contents, config, call_type: str, cache_key: str = None):
         """재시도 로직이 포함된 API 호출 (즉시 3회 시도)"""
         last_error = None
 
         for attempt in range(3):
+            trace_service.annotate(attempts=attempt + 1)
             try:
-                return await self.client.aio.models.generate_content(
+                start = time.perf_counter()
+                response = await self.client.aio.models.generate_content(
                     model=self.model,
                     contents=contents,
                     config=config,
                 )
+                usage_service.record(call_type, self.model, response, time.perf_counter() - start, attempt + 1)
+                return response
             except Exception as e:
                 last_error = e
                 logger.warning(f"LLM API 호출 실패 (시도 {attempt + 1}/3): {type(e).__name__}: {e}")
+                # 캐시가 만료/삭제된 경우에만 남은 시도는 인라인 프롬프트로 (일시 장애/429는 캐시 유지)
+                if cache_key and config.cached_content and is_cache_error(e):
+                    self.prompt_cache.invalidate(cache_key)
+                    config = config.model_copy(update={
+                        "cached_content": None,
+                        "system_instruction": self.prompt_cache.prompts[cache_key],
+                    })
 
         logger.error(f"LLM API 호출 최종 실패: {type(last_error).__name__}: {last_error}")
         raise last_error
 
-    async def validate_input(self, text: str, images: list[bytes] = None) -> ValidationResult:
+    @trace_service.traced("validate_input")
+    async def validate_input(self, text: str, images: list[bytes | types.Part] = None) -> ValidationResult:
         """입력 텍스트가 만화로 변환할 만한 콘텐츠인지 검증하고, 대기 메시지 생성"""
         images = images or []
 
@@ -189,73 +329,184 @@ class LLMService:
 ---""".strip()
 
         # 멀티모달 입력: 이미지들 + 텍스트
-        contents = []
-        for img_bytes in images:
-            contents.append(types.Part.from_bytes(data=img_bytes, mime_type="image/png"))
+        contents = _image_parts(images)
         contents.append(prompt)
 
         response = await self._generate_with_retry(
             contents=contents,
             config=types.GenerateContentConfig(
-                system_instruction=VALIDATION_PROMPT,
+                **self.prompt_cache.config_kwargs("validate"),
                 temperature=0.2,
                 response_mime_type="application/json",
                 response_schema=ValidationResult,
             ),
+            call_type="validate",
+            cache_key="validate",
         )
-        logger.info(f"검증 응답 수신: model={response.model_version}")
+        logger.info("검증 응답 수신: model=%s", response.model_version, extra=sampled())
 
         if not response.parsed:
-            logger.error(f"검증 응답 파싱 실패: {response}")
+            logger.error("검증 응답 파싱 실패: %s", Truncated(response, 2000))
             raise ValueError("입력 검증 중 오류가 발생했습니다")
 
         return response.parsed
 
-    async def analyze_meeting(self, meeting_text: str, images: list[bytes] = None) -> list[PanelScenario]:
+    @trace_service.traced("validate_and_analyze")
+    async def validate_and_analyze(
+        self, text: str, images: list[bytes | types.Part] = None
+    ) -> ValidatedScenario:
+        """검증 + 대기 메시지 + 시나리오를 통합 스키마 1회 호출로 생성 (single 모드)"""
+        images = images or []
+
+        # 길이 제한 (3만자)
+        if len(text) > 30000:
+            return ValidatedScenario(
+                is_valid=False,
+                reject_reason="입력 텍스트가 너무 깁니다. 3만자 이내로 줄여주세요.",
+            )
+
+        prompt = f"""
+다음 텍스트를 판별하고, 허용되면 4컷 만화 시나리오로 변환해주세요.
+{f"(첨부된 {len(images)}개의 이미지도 내용 파악에 참고하세요)" if images else ""}
+---
+{text}
+---""".strip()
+
+        contents = _image_parts(images)
+        contents.append(prompt)
+
+        response = await self._generate_with_retry(
+            contents=contents,
+            config=types.GenerateContentConfig(
+                **self.prompt_cache.config_kwargs("combined"),
+                temperature=0.9,
+                response_mime_type="application/json",
+                response_schema=ValidatedScenario,
+            ),
+            call_type="combined",
+            cache_key="combined",
+        )
+        logger.info("통합 응답 수신: model=%s", response.model_version, extra=sampled())
+
+        result = response.parsed
+        if not result or (result.is_valid and not result.episodes):
+            logger.error("통합 응답 파싱 실패: %s", Truncated(response, 2000))
+            raise ValueError("입력 검증 중 오류가 발생했습니다")
+
+        return result
+
+    @trace_service.traced("analyze_meeting")
+    async def analyze_meeting(self, meeting_text: str, images: list[bytes | types.Part] = None) -> list[PanelScenario]:
         """회의록을 분석하여 4컷 만화 시나리오 생성 (이미지 포함 가능)"""
         images = images or []
 
+        # 긴 입력은 청크별 병렬 생성 후 캐릭터 태그 통일 (map-reduce)
+        threshold = settings.chunked_scenario_threshold
+        if threshold and len(meeting_text) > threshold:
+            return await self._analyze_chunked(meeting_text, images)
+
+        return await self._analyze_text(meeting_text, images)
+
+    async def _analyze_chunked(self, meeting_text: str, images: list) -> list[PanelScenario]:
+        """청크별 시나리오를 병렬 생성하고 캐릭터 태그를 통일한 뒤 episode_number 재부여"""
+        chunks = split_meeting_text(meeting_text, settings.chunked_scenario_chunk_size)
+        logger.info(f"긴 입력 청크 분할: {len(meeting_text)}자 → {len(chunks)}개 청크")
+
+        async def analyze_chunk(index: int, chunk: str) -> list[PanelScenario]:
+            async with trace_service.span("analyze_chunk", chunk=index + 1, chars=len(chunk)):
+                note = (
+                    f"(전체 {len(chunks)}개 부분 중 {index + 1}번째 부분입니다. "
+                    f"이 부분의 내용만 빠짐없이 에피소드로 만드세요. episode_number는 1부터 시작하세요.)"
+                )
+                return await self._analyze_text(chunk, images, note=note)
+
+        results = await asyncio.gather(*[analyze_chunk(i, chunk) for i, chunk in enumerate(chunks)])
+        panels = [panel for chunk_panels in results for panel in chunk_panels]
+
+        panels = await self._reconcile_characters(panels)
+        for number, panel in enumerate(panels, start=1):
+            panel.episode_number = number
+        return panels
+
+    @trace_service.traced("reconcile_characters")
+    async def _reconcile_characters(self, panels: list[PanelScenario]) -> list[PanelScenario]:
+        """청크마다 다르게 묘사된 같은 인물의 Visual Tag를 하나로 통일 (실패 시 원본 유지)"""
+        all_prompts = "\n\n".join(f"[Episode {i + 1}]\n{p.image_prompt}" for i, p in enumerate(panels))
+        try:
+            response = await self._generate_with_retry(
+                contents=[all_prompts],
+                config=types.GenerateContentConfig(
+                    system_instruction=RECONCILE_PROMPT,
+                    temperature=0.1,
+                    response_mime_type="application/json",
+                    response_schema=list[CharacterTagMapping],
+                ),
+                call_type="reconcile",
+            )
+        except Exception as e:
+            logger.warning(f"캐릭터 태그 통일 실패, 원본 유지: {type(e).__name__}: {e}")
+            return panels
+
+        mappings = response.parsed or []
+        # 별칭 → 대표 태그 (대표 태그 안에 들어 있는 별칭은 치환하면 대표 태그가 중복 확장되므로 제외)
+        replacements = {}
+        for mapping in mappings:
+            for alias in mapping.aliases:
+                if alias and alias not in mapping.canonical:
+                    replacements.setdefault(alias, mapping.canonical)
+        if replacements:
+            # 긴 별칭부터 맞추고 한 번에 치환 (치환 결과를 다시 치환하지 않도록)
+            pattern = re.compile("|".join(re.escape(alias) for alias in sorted(replacements, key=len, reverse=True)))
+            for panel in panels:
+                panel.image_prompt = pattern.sub(lambda m: replacements[m.group(0)], panel.image_prompt)
+        logger.info(f"캐릭터 태그 통일: {len(mappings)}명")
+        return panels
+
+    async def _analyze_text(self, meeting_text: str, images: list, note: str = "") -> list[PanelScenario]:
+        """단일 호출로 시나리오 생성 (note: 청크 위치 등 추가 지시)"""
+        notes = [f"(첨부된 {len(images)}개의 이미지도 내용 파악에 참고하세요)" if images else ""]
+        if note:
+            notes.append(note)
+        header = "\n".join(notes)
+
         prompt = f"""
         다음 텍스트를을 4컷 만화 시나리오로 변환해주세요.
-{f"(첨부된 {len(images)}개의 이미지도 내용 파악에 참고하세요)" if images else ""}
+{header}
 ---
 {meeting_text}
 ---""".strip()
 
         # 멀티모달 입력: 이미지들 + 텍스트
-        contents = []
-        for img_bytes in images:
-            contents.append(types.Part.from_bytes(data=img_bytes, mime_type="image/png"))
+        contents = _image_parts(images)
         contents.append(prompt)
 
         response = await self._generate_with_retry(
             contents=contents,
             config=types.GenerateContentConfig(
-                system_instruction=SYSTEM_PROMPT,
+                **self.prompt_cache.config_kwargs("scenario"),
                 temperature=0.9,
                 response_mime_type="application/json",
                 response_schema=list[PanelScenario],
             ),
+            call_type="scenario",
+            cache_key="scenario",
         )
-        logger.info(f"Gemini 응답 수신: model={response.model_version}")
-        logger.debug(f"응답 전체: {response}")
+        logger.info("Gemini 응답 수신: model=%s", response.model_version, extra=sampled())
+        # 응답 전체는 DEBUG일 때만 (listener 스레드에서 문자열 변환)
+        logger.debug("응답 전체: %s", response)
 
         if response.candidates:
             candidate = response.candidates[0]
-            logger.info(f"finish_reason: {candidate.finish_reason}")
+            logger.info("finish_reason: %s", candidate.finish_reason, extra=sampled())
             if candidate.content and candidate.content.parts:
-                logger.info(f"content parts: {len(candidate.content.parts)}")
+                logger.info("content parts: %d", len(candidate.content.parts), extra=sampled())
             else:
                 logger.warning("content가 비어있음")
             if hasattr(candidate, 'safety_ratings') and candidate.safety_ratings:
                 logger.warning(f"safety_ratings: {candidate.safety_ratings}")
 
         if not response.parsed:
-            logger.error(f"LLM 응답 파싱 실패: {response}")
+            logger.error("LLM 응답 파싱 실패: %s", Truncated(response, 2000))
             raise ValueError(f"LLM 응답 파싱 실패: {response}")
 
         return response.parsed  # 이미 list[PanelScenario]
-
-
-
-llm_service = LLMService()
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+from app.config import settings
+from app.services.metrics_service import metrics_service
+
+logger = logging.getLogger(__name__)
+
+ASYNCIO_DIR = os.path.dirname(asyncio.__file__)
+
+
+class LoopMonitor:
+    """이벤트 루프 지연 측정 + 루프를 오래 잡고 있는 코드의 스택 기록
+
+    - heartbeat: 루프에서 interval마다 깨어나 예정 시각과의 차이(lag)를 loop.lag 지표로 기록
+    - watchdog: 별도 스레드가 heartbeat가 block_threshold 이상 멈춘 것을 보면
+      그 순간 루프 스레드의 스택(sys._current_frames)과 실행 중인 태스크를 로그로 남김
+    루프가 멈춰 있는 동안 스택을 뜨기 때문에 json.dumps, 템플릿 렌더링, 동기 I/O처럼
+    await 없이 오래 도는 코드가 그대로 찍힌다. 평소 비용은 interval마다 sleep 1회와 스레드 polling뿐.
+    """
+
+    def __init__(self, max_reports: int = 20):
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._last_beat = time.monotonic()
+        self._beat = 0
+        self._reported_beat = -1
+        self.reports: deque[dict] = deque(maxlen=max_reports)
+
+    async def start(self) -> None:
+        if not settings.loop_monitor_enabled or self._task:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watchdog, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    async def _heartbeat(self) -> None:
+        interval = settings.loop_monitor_interval
+        while True:
+            expected = time.monotonic() + interval
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            self._last_beat = now
+            self._beat += 1
+            metrics_service.observe("loop.lag", lag)
+            if lag >= settings.loop_block_threshold:
+                metrics_service.incr("loop.blocked")
+                metrics_service.observe("loop.blocked_seconds", lag)
+                if self.reports and self.reports[-1]["beat"] == self._beat - 1:
+                    self.reports[-1]["lag"] = round(lag, 3)
+                logger.warning(f"이벤트 루프 멈춤 해소: {lag:.2f}초")
+
+    def _watchdog(self) -> None:
+        threshold = settings.loop_block_threshold
+        while not self._stop.wait(threshold / 2):
+            stalled = time.monotonic() - self._last_beat - settings.loop_monitor_interval
+            beat = self._beat
+            if stalled < threshold or beat == self._reported_beat:
+                continue
+            self._reported_beat = beat
+            self._report(stalled, beat)
+
+    def _report(self, stalled: float, beat: int) -> None:
+        """멈춰 있는 루프 스레드의 현재 스택을 기록 (watchdog 스레드에서 호출)"""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        # 이벤트 루프 내부(asyncio) 프레임은 빼고 콜백/코루틴부터
+        frames = traceback.extract_stack(frame)
+        for i in range(len(frames) - 1, -1, -1):
+            if frames[i].filename.startswith(ASYNCIO_DIR):
+                frames = frames[i + 1:]
+                break
+        stack = "".join(traceback.format_list(frames))
+        task = asyncio.current_task(self._loop)
+        task_name = f"{task.get_name()} ({task.get_coro().__qualname__})" if task else None
+        self.reports.append({
+            "beat": beat,
+            "at": time.time(),
+            "stalled": round(stalled, 3),
+            "lag": None,  # 루프가 풀린 뒤 heartbeat가 측정한 지연
+            "task": task_name,
+            "stack": stack,
+        })
+        logger.warning(f"이벤트 루프 {stalled:.2f}초째 멈춤, 태스크 {task_name}\n{stack}")
+
+    def snapshot(self) -> dict:
+        """최근 지연 분포 + 멈춤 기록 (/debug/loop)"""
+        return {
+            "enabled": self._task is not None,
+            "interval": settings.loop_monitor_interval,
+            "block_threshold": settings.loop_block_threshold,
+            "lag": metrics_service.snapshot()["distributions"].get("loop.lag"),
+            "blocked": metrics_service.counter("loop.blocked"),
+            "reports": [
+                {key: value for key, value in report.items() if key != "beat"}
+                for report in reversed(self.reports)
+            ],
+        }
+
+
+loop_monitor = LoopMonitor()
@@ -0,0 +1,85 @@
+import time
+from collections import defaultdict, deque
+
+
+class RollingWindow:
+    """최근 N개 / 최근 max_age초 관측값 윈도우"""
+
+    def __init__(self, maxlen: int = 200, max_age: float = 600):
+        self.samples: deque[tuple[float, float]] = deque(maxlen=maxlen)
+        self.max_age = max_age
+
+    def add(self, value: float) -> None:
+        self.samples.append((time.monotonic(), value))
+
+    def values(self) -> list[float]:
+        cutoff = time.monotonic() - self.max_age
+        while self.samples and self.samples[0][0] < cutoff:
+            self.samples.popleft()
+        return [value for _, value in self.samples]
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class MetricsService:
+    """프로세스 내 지표 수집 (카운터 / 게이지 / 최근 관측값 분포)"""
+
+    def __init__(self):
+        self._windows: dict[str, RollingWindow] = defaultdict(RollingWindow)
+        self._counters: dict[str, int] = defaultdict(int)
+        self._gauges: dict[str, float] = {}
+
+    def observe(self, name: str, value: float) -> None:
+        self._windows[name].add(value)
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        self._counters[name] += amount
+
+    def set_gauge(self, name: str, value: float) -> None:
+        self._gauges[name] = value
+
+    def counter(self, name: str) -> int:
+        return self._counters.get(name, 0)
+
+    def percentile(self, name: str, q: float, min_samples: int = 1) -> float | None:
+        """최근 관측값의 분위수 (샘플이 부족하면 None)"""
+        window = self._windows.get(name)
+        values = window.values() if window else []
+        if len(values) < min_samples:
+            return None
+        return _percentile(values, q)
+
+    def mean(self, name: str, min_samples: int = 1) -> float | None:
+        window = self._windows.get(name)
+        values = window.values() if window else []
+        if len(values) < min_samples:
+            return None
+        return sum(values) / len(values)
+
+    def snapshot(self) -> dict:
+        """전체 지표 요약 (/debug/metrics)"""
+        distributions = {}
+        for name, window in self._windows.items():
+            values = window.values()
+            if not values:
+                continue
+            distributions[name] = {
+                "count": len(values),
+                "mean": round(sum(values) / len(values), 4),
+                "p50": round(_percentile(values, 0.5), 4),
+                "p90": round(_percentile(values, 0.9), 4),
+                "p99": round(_percentile(values, 0.99), 4),
+                "max": round(max(values), 4),
+            }
+        return {
+            "counters": dict(self._counters),
+            "gauges": dict(self._gauges),
+            "distributions": distributions,
+        }
+
+
+metrics_service = MetricsService()
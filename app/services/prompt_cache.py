@@ -0,0 +1,125 @@
+import asyncio
+import hashlib
+import logging
+import re
+from datetime import datetime, timezone, timedelta
+
+from google.genai import types
+from google.genai.errors import ClientError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# "CachedContent not found", "Cache content ... is expired" 등
+_CACHE_ERROR_RE = re.compile(r"cache[d_ ]*content", re.IGNORECASE)
+
+
+def is_cache_error(error: Exception) -> bool:
+    """캐시가 삭제/만료돼서 난 에러인지 (4xx이고 메시지에 cached content가 있을 때만, 5xx/429는 캐시와 무관)"""
+    return isinstance(error, ClientError) and error.code != 429 and bool(_CACHE_ERROR_RE.search(str(error)))
+
+
+class PromptCacheManager:
+    """정적 시스템 프롬프트를 Gemini 컨텍스트 캐시로 관리
+
+    시작 시 프롬프트별 캐시를 만들고 TTL 만료 전에 갱신한다.
+    캐시를 쓸 수 없으면(비활성화, 최소 토큰 미달, API 오류) 인라인 프롬프트로 대체한다.
+    """
+
+    CHECK_INTERVAL = 60  # 만료 확인 주기 (초)
+
+    def __init__(self, client, model: str):
+        self.client = client
+        self.model = model
+        self.prompts: dict[str, str] = {}
+        self._names: dict[str, str] = {}
+        self._expires: dict[str, datetime] = {}
+        self._refresh_task: asyncio.Task | None = None
+
+    def register(self, key: str, prompt: str) -> None:
+        """캐시 대상 프롬프트 등록"""
+        self.prompts[key] = prompt
+
+    def config_kwargs(self, key: str) -> dict:
+        """GenerateContentConfig에 넣을 인자 (캐시가 유효하면 cached_content, 아니면 system_instruction)"""
+        name = self._names.get(key)
+        if name and self._expires[key] > datetime.now(timezone.utc):
+            return {"cached_content": name}
+        return {"system_instruction": self.prompts[key]}
+
+    def invalidate(self, key: str) -> None:
+        """캐시가 더 이상 유효하지 않을 때 호출 (다음 확인 주기에 재생성)"""
+        self._names.pop(key, None)
+        self._expires.pop(key, None)
+
+    async def start(self) -> None:
+        """캐시 생성 후 갱신 루프 시작"""
+        if not settings.gemini_context_cache_enabled:
+            return
+        for key in self.prompts:
+            await self._ensure(key)
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    def _display_name(self, key: str) -> str:
+        """모델 + 프롬프트 해시 (프롬프트가 바뀌면 새 캐시 생성)"""
+        digest = hashlib.sha256(f"{self.model}\n{self.prompts[key]}".encode()).hexdigest()[:12]
+        return f"toonify-{key}-{digest}"
+
+    async def _ensure(self, key: str) -> None:
+        """캐시가 없으면 생성, 만료가 가까우면 TTL 연장"""
+        ttl = f"{settings.gemini_context_cache_ttl}s"
+        margin = timedelta(seconds=settings.gemini_context_cache_refresh_margin)
+        now = datetime.now(timezone.utc)
+
+        name = self._names.get(key)
+        if name:
+            if self._expires[key] - now > margin:
+                return
+            try:
+                cached = await self.client.aio.caches.update(
+                    name=name,
+                    config=types.UpdateCachedContentConfig(ttl=ttl),
+                )
+                self._expires[key] = cached.expire_time
+                logger.info(f"컨텍스트 캐시 갱신: {key} (만료 {cached.expire_time})")
+                return
+            except Exception as e:
+                logger.warning(f"컨텍스트 캐시 갱신 실패, 재생성 시도: {key} ({type(e).__name__}: {e})")
+                self.invalidate(key)
+
+        try:
+            cached = await self._find_existing(key) or await self.client.aio.caches.create(
+                model=self.model,
+                config=types.CreateCachedContentConfig(
+                    display_name=self._display_name(key),
+                    system_instruction=self.prompts[key],
+                    ttl=ttl,
+                ),
+            )
+            self._names[key] = cached.name
+            self._expires[key] = cached.expire_time
+            logger.info(f"컨텍스트 캐시 사용: {key} → {cached.name} (만료 {cached.expire_time})")
+        except Exception as e:
+            # 최소 토큰 수 미달 등: 인라인 프롬프트로 동작
+            logger.warning(f"컨텍스트 캐시 생성 실패, 인라인 프롬프트 사용: {key} ({type(e).__name__}: {e})")
+
+    async def _find_existing(self, key: str):
+        """같은 프롬프트로 이미 만들어진 캐시가 있으면 재사용"""
+        display_name = self._display_name(key)
+        margin = timedelta(seconds=settings.gemini_context_cache_refresh_margin)
+        async for cached in await self.client.aio.caches.list():
+            if cached.display_name == display_name and cached.expire_time - datetime.now(timezone.utc) > margin:
+                return cached
+        return None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.CHECK_INTERVAL)
+            for key in self.prompts:
+                await self._ensure(key)
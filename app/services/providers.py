@@ -0,0 +1,76 @@
+from typing import TYPE_CHECKING, Callable, Generic, TypeVar
+
+from app.config import settings
+
+if TYPE_CHECKING:
+    from app.services.attachment_service import AttachmentService
+    from app.services.image_service import ImageServiceInterface
+    from app.services.llm_service import LLMServiceInterface
+    from app.services.storage_service import StorageInterface
+
+T = TypeVar("T")
+
+
+class Provider(Generic[T]):
+    """서비스 인스턴스 지연 생성
+
+    google-genai / boto3 import와 클라이언트 생성은 무거우므로 모듈 import 시점이 아니라
+    처음 사용할 때(또는 lifespan에서) 한 번만 만든다.
+    라우터에서는 Depends(provider)로 주입받고, 서비스 내부에서는 provider()로 가져온다.
+    구현체는 Settings(llm_provider / image_provider / storage_backend)로 고른다.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._instance: T | None = None
+
+    def __call__(self) -> T:
+        if self._instance is None:
+            self._instance = self._factory()
+        return self._instance
+
+    def peek(self) -> T | None:
+        """이미 생성된 인스턴스 (없으면 생성하지 않고 None)"""
+        return self._instance
+
+    def override(self, instance: T | None) -> None:
+        """인스턴스 교체 (벤치마크 등에서 사용, None이면 다음 사용 시 다시 생성)"""
+        self._instance = instance
+
+
+def _create_llm_service() -> "LLMServiceInterface":
+    if settings.llm_provider == "replay":
+        from app.services.replay_providers import ReplayLLMService, load_recording
+        return ReplayLLMService(load_recording(settings.replay_file))
+    if settings.llm_provider == "fake":
+        from app.services.fake_providers import FakeLLMService
+        return FakeLLMService()
+    from app.services.llm_service import LLMService
+    return LLMService()
+
+
+def _create_image_service() -> "ImageServiceInterface":
+    if settings.image_provider == "replay":
+        from app.services.replay_providers import ReplayImageService, load_recording
+        return ReplayImageService(get_storage(), load_recording(settings.replay_file))
+    if settings.image_provider == "fake":
+        from app.services.fake_providers import FakeImageService
+        return FakeImageService(get_storage())
+    from app.services.image_service import NanoBananaImageService
+    return NanoBananaImageService(get_storage())
+
+
+def _create_storage() -> "StorageInterface":
+    from app.services.storage_service import create_storage
+    return create_storage()
+
+
+def _create_attachment_service() -> "AttachmentService":
+    from app.services.attachment_service import AttachmentService, create_store
+    return AttachmentService(create_store())
+
+
+get_llm_service: Provider["LLMServiceInterface"] = Provider(_create_llm_service)
+get_image_service: Provider["ImageServiceInterface"] = Provider(_create_image_service)
+get_attachment_service: Provider["AttachmentService"] = Provider(_create_attachment_service)
+get_storage: Provider["StorageInterface"] = Provider(_create_storage)
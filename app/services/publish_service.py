@@ -0,0 +1,97 @@
+import asyncio
+import html
+import logging
+import os
+import re
+import uuid
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import json_codec
+from app.config import settings
+from app.models import Comic, Task
+from app.services.providers import get_storage
+from app.static_assets import static_assets
+
+logger = logging.getLogger(__name__)
+
+RESULT_TEMPLATE = Path("app/templates/result.html")
+# result.html은 GitHub Pages용으로 그대로 복사되기도 하므로 Jinja 문법 대신 주석 자리에 데이터를 끼워 넣음
+DATA_MARKER = "<!-- result-data -->"
+TASK_ID_PATTERN = re.compile(r"^[0-9a-f-]{36}$")
+
+
+def _script_json(value) -> str:
+    """<script> 안에 넣을 JSON (값 안의 </script> 등으로 태그가 끝나지 않도록 이스케이프)"""
+    return json_codec.dumps(value).replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026")
+
+
+class PublishService:
+    """완성된 결과 페이지(/view)를 한 번 렌더링해서 발행
+
+    result.html에 결과 데이터를 넣은 HTML을 저장해 두고, /view는 DB 조회/렌더링 없이 그대로 응답한다.
+    - static: published_dir/{task_id}.html에 저장, /view가 파일을 바로 응답
+    - storage: 저장소(S3 등)에 발행할 때마다 새 key로 올리고 /view는 Task.published_url로 리다이렉트
+      (다른 도메인에서 열리므로 <base>로 정적 파일/API 경로를 public_base_url에 맞춤)
+    완료될 때와 에피소드 재생성으로 만화가 바뀔 때만 다시 발행한다.
+    """
+
+    def render(self, task: Task, comics: list[Comic], base_url: str = "") -> str:
+        """결과 데이터(/result와 같은 형태)를 넣은 결과 페이지 HTML"""
+        data = {
+            "task": {"id": task.id, "status": task.status},
+            "comics": [
+                {
+                    "part_number": comic.part_number,
+                    "panels": comic.panels_json or [],
+                    "image_paths": comic.image_paths or [],
+                }
+                for comic in comics
+            ],
+            "view_url": f"{base_url}/view/{task.id}",
+        }
+        head = f'<script id="result-data" type="application/json">{_script_json(data)}</script>'
+        if base_url:
+            head = f'<base href="{html.escape(base_url)}/">\n    {head}'
+        return static_assets.page(RESULT_TEMPLATE).replace(DATA_MARKER, head, 1)
+
+    def static_path(self, task_id: str) -> Path | None:
+        """static으로 발행된 결과 페이지 파일 (발행 전이면 None)"""
+        if settings.result_publish_target != "static" or not TASK_ID_PATTERN.match(task_id):
+            return None
+        path = Path(settings.published_dir) / f"{task_id}.html"
+        return path if path.is_file() else None
+
+    async def publish(self, db: AsyncSession, task: Task, comics: list[Comic] = None) -> None:
+        """완성된 태스크의 결과 페이지 발행 (실패해도 /view가 매번 렌더링으로 대신하므로 로그만 남김)"""
+        target = settings.result_publish_target
+        if target not in ("static", "storage") or task.status != "completed":
+            return
+        try:
+            if comics is None:
+                result = await db.execute(select(Comic).where(Comic.task_id == task.id).order_by(Comic.part_number))
+                comics = result.scalars().all()
+            if target == "static":
+                page = self.render(task, comics)
+                await asyncio.get_running_loop().run_in_executor(None, self._write, task.id, page)
+            else:
+                page = self.render(task, comics, settings.public_base_url)
+                key = f"results/{task.id}/{uuid.uuid4().hex[:8]}.html"
+                task.published_url = await get_storage().put(page.encode(), key, "text/html; charset=utf-8")
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"[Task {task.id[:8]}] 결과 페이지 발행 실패: {e}")
+
+    @staticmethod
+    def _write(task_id: str, page: str) -> None:
+        """임시 파일에 쓰고 교체 (읽는 쪽이 쓰다 만 파일을 보지 않도록)"""
+        directory = Path(settings.published_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = directory / f".{task_id}.{os.getpid()}.tmp"
+        tmp.write_text(page, encoding="utf-8")
+        os.replace(tmp, directory / f"{task_id}.html")
+
+
+publish_service = PublishService()
@@ -0,0 +1,191 @@
+import hashlib
+import hmac
+import json
+import logging
+import re
+import statistics
+from collections import defaultdict
+from pathlib import Path
+
+from app.config import settings
+from app.schemas import PanelScenario, ValidationResult
+from app.services.fake_providers import FakeImageService, FakeLLMService, FakeModel
+from app.services.storage_service import StorageInterface
+from app.services.trace_service import trace_service
+
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r"[가-힣]+|[A-Za-z]+|[0-9]+")
+KEEP_WORDS = {"Character"}  # 프롬프트 구조에 쓰이는 단어는 유지 ([Character: ...] 태그)
+
+
+def anonymize_text(text: str, salt: str) -> str:
+    """단어를 같은 종류(한글/영문/숫자), 같은 길이의 의미 없는 문자열로 치환
+
+    공백/줄바꿈/문장부호와 길이는 그대로 두어 토큰 수와 청크 분할이 원문과 비슷하게 유지되고,
+    같은 녹화 안에서는 같은 단어가 항상 같은 문자열로 바뀐다 (salt 없이는 복원 불가).
+    """
+    def replace(match: re.Match) -> str:
+        word = match.group()
+        if word in KEEP_WORDS:
+            return word
+        digest = hmac.new(salt.encode(), word.encode(), hashlib.sha256).digest()
+        while len(digest) < len(word) * 2:
+            digest += hashlib.sha256(digest).digest()
+        chars = []
+        for i, char in enumerate(word):
+            n = int.from_bytes(digest[i * 2:i * 2 + 2], "big")
+            if "가" <= char <= "힣":
+                chars.append(chr(0xAC00 + n % 11172))
+            elif char.isdigit():
+                chars.append(str(n % 10))
+            else:
+                letter = chr(ord("a") + n % 26)
+                chars.append(letter.upper() if char.isupper() else letter)
+        return "".join(chars)
+
+    return WORD_PATTERN.sub(replace, text)
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class RecordedTask:
+    """녹화된 태스크 1건 (요청 + Gemini 호출 목록)"""
+
+    def __init__(self, data: dict):
+        self.data = data
+        self._latencies: dict[str, list[float]] = defaultdict(list)
+        for call in data.get("calls", []):
+            if call.get("latency") is not None:
+                self._latencies[call["type"]].append(call["latency"])
+        self._cursor: dict[str, int] = defaultdict(int)
+
+    def next_latency(self, call_type: str) -> float | None:
+        """call_type의 다음 녹화 지연 (녹화 순서대로, 다 쓰면 None)"""
+        latencies = self._latencies.get(call_type, [])
+        index = self._cursor[call_type]
+        self._cursor[call_type] += 1
+        return latencies[index] if index < len(latencies) else None
+
+
+class Recording:
+    """녹화 파일 (JSONL, 태스크 1건당 1줄)
+
+    replay 중에는 LLM 호출 시점에 입력 텍스트로 녹화된 태스크를 찾아 현재 trace의 태스크에 연결하고,
+    같은 태스크의 이후 호출(이미지 생성 등)은 녹화된 순서대로 지연을 재현한다.
+    """
+
+    def __init__(self, tasks: list[dict]):
+        self.tasks = tasks
+        self._by_text = {text_key(task["text"]): task for task in tasks}
+        self._bound: dict[str, RecordedTask] = {}
+        latencies = defaultdict(list)
+        for task in tasks:
+            for call in task.get("calls", []):
+                if call.get("latency") is not None:
+                    latencies[call["type"]].append(call["latency"])
+        self._medians = {call_type: statistics.median(values) for call_type, values in latencies.items()}
+
+    @classmethod
+    def load(cls, path: str) -> "Recording":
+        with open(path, encoding="utf-8") as f:
+            return cls([json.loads(line) for line in f if line.strip()])
+
+    def bind(self, text: str) -> None:
+        """입력 텍스트에 해당하는 녹화 태스크를 현재 태스크에 연결 (이미 연결됐으면 유지)"""
+        task_id = trace_service.current_task_id()
+        if task_id is None or task_id in self._bound:
+            return
+        data = self._by_text.get(text_key(text))
+        if data is None:
+            logger.warning(f"[Task {task_id[:8]}] 녹화에 없는 입력, fake 응답 사용")
+            return
+        self._bound[task_id] = RecordedTask(data)
+
+    def current(self) -> RecordedTask | None:
+        task_id = trace_service.current_task_id()
+        return self._bound.get(task_id) if task_id else None
+
+    def latency(self, call_type: str) -> float | None:
+        """현재 태스크의 다음 녹화 지연 (없으면 전체 녹화의 중앙값)"""
+        task = self.current()
+        latency = task.next_latency(call_type) if task else None
+        return latency if latency is not None else self._medians.get(call_type)
+
+
+_recordings: dict[str, Recording] = {}
+
+
+def load_recording(path: str) -> Recording:
+    """LLM / 이미지 replay 서비스가 같은 Recording을 공유하도록 경로별로 한 번만 로드"""
+    if path not in _recordings:
+        if not path or not Path(path).exists():
+            raise ValueError(f"replay_file이 없음: {path!r}")
+        _recordings[path] = Recording.load(path)
+    return _recordings[path]
+
+
+class ReplayModel(FakeModel):
+    """녹화된 지연을 재현하는 가짜 모델 (녹화에 없는 호출은 fake 분포 사용, 실패는 재현하지 않음)"""
+
+    def __init__(self, name: str, median_latency: float, recording: Recording):
+        super().__init__(name, median_latency)
+        self.recording = recording
+
+    def _sample(self, call_type: str, key: str) -> tuple[float, bool]:
+        latency = self.recording.latency(call_type)
+        if latency is None:
+            latency, _ = super()._sample(call_type, key)
+        return latency * settings.replay_latency_scale, False
+
+
+class ReplayLLMService(FakeLLMService):
+    """녹화된 검증 결과 / 시나리오를 녹화된 지연으로 반환"""
+
+    def __init__(self, recording: Recording):
+        super().__init__(ReplayModel("replay-llm", settings.fake_llm_latency, recording))
+        self.recording = recording
+
+    def _validation(self, text: str, images: list) -> ValidationResult:
+        task = self.recording.current()
+        if task is None:
+            return super()._validation(text, images)
+        return ValidationResult(
+            is_valid=task.data["valid"],
+            reject_reason=task.data.get("reject_reason"),
+            messages=task.data.get("messages", []),
+        )
+
+    def _episodes(self, text: str) -> list[PanelScenario]:
+        task = self.recording.current()
+        if task is None or not task.data.get("episodes"):
+            return super()._episodes(text)
+        return [
+            PanelScenario(episode_number=i + 1, image_prompt=prompt)
+            for i, prompt in enumerate(task.data["episodes"])
+        ]
+
+    async def validate_input(self, text: str, images: list = None) -> ValidationResult:
+        self.recording.bind(text)
+        return await super().validate_input(text, images)
+
+    async def validate_and_analyze(self, text: str, images: list = None):
+        self.recording.bind(text)
+        return await super().validate_and_analyze(text, images)
+
+    async def analyze_meeting(self, meeting_text: str, images: list = None) -> list[PanelScenario]:
+        self.recording.bind(meeting_text)
+        return await super().analyze_meeting(meeting_text, images)
+
+
+class ReplayImageService(FakeImageService):
+    """녹화된 이미지 호출 지연을 재현하고 플레이스홀더 PNG 반환"""
+
+    def __init__(self, storage: StorageInterface, recording: Recording):
+        super().__init__(
+            storage,
+            ReplayModel("replay-image-pro", settings.fake_image_latency, recording),
+            ReplayModel("replay-image-flash", settings.fake_flash_image_latency, recording),
+        )
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import shutil
+import uuid
+from abc import ABC, abstractmethod
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO
+
+import httpx
+
+from app.config import settings
+from app.services.trace_service import trace_service
+
+logger = logging.getLogger(__name__)
+
+
+class StorageInterface(ABC):
+    """생성/첨부 이미지 저장소 인터페이스"""
+
+    @abstractmethod
+    async def upload(self, image_bytes: bytes, prefix: str) -> str:
+        """PNG 이미지를 저장하고 브라우저에서 열 수 있는 URL 반환"""
+        pass
+
+    @abstractmethod
+    async def upload_file(self, file: BinaryIO, prefix: str) -> str:
+        """upload와 같지만 파일 객체에서 읽으면서 저장 (큰 첨부 이미지를 메모리에 올리지 않도록, 닫는 건 호출한 쪽)"""
+        pass
+
+    @abstractmethod
+    async def fetch(self, url: str) -> bytes:
+        """upload가 반환한 URL의 이미지 읽기"""
+        pass
+
+    @abstractmethod
+    async def put(self, data: bytes, key: str, content_type: str) -> str:
+        """key 경로에 저장하고 URL 반환 (발행된 결과 페이지 등 이미지 외 파일용, 같은 key면 덮어씀)"""
+        pass
+
+
+class S3Storage(StorageInterface):
+    """S3 public-read 버킷에 저장"""
+
+    def __init__(self):
+        import boto3
+
+        self.s3 = boto3.client(
+            "s3",
+            aws_access_key_id=settings.s3_access_key,
+            aws_secret_access_key=settings.s3_secret_key,
+            region_name=settings.s3_region,
+        )
+        self.bucket = settings.s3_bucket
+
+    async def _put(self, file: BinaryIO, key: str, extra_args: dict) -> str:
+        # run_in_executor로 동기 S3 업로드를 비동기로 실행
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None,
+            lambda: self.s3.upload_fileobj(
+                file,
+                self.bucket,
+                key,
+                ExtraArgs={**extra_args, "ACL": "public-read"},
+            ),
+        )
+        return f"https://{self.bucket}.s3.{settings.s3_region}.amazonaws.com/{key}"
+
+    async def upload(self, image_bytes: bytes, prefix: str) -> str:
+        return await self.upload_file(BytesIO(image_bytes), prefix)
+
+    @trace_service.traced("upload_image")
+    async def upload_file(self, file: BinaryIO, prefix: str) -> str:
+        return await self._put(file, f"{prefix}/{uuid.uuid4()}.png", {"ContentType": "image/png"})
+
+    @trace_service.traced("upload_file")
+    async def put(self, data: bytes, key: str, content_type: str) -> str:
+        # 결과 페이지는 발행할 때마다 새 key를 쓰므로 브라우저/CDN이 오래 캐시해도 됨
+        return await self._put(BytesIO(data), key, {
+            "ContentType": content_type,
+            "CacheControl": "public, max-age=31536000, immutable",
+        })
+
+    @trace_service.traced("fetch_image")
+    async def fetch(self, url: str) -> bytes:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(url)
+            response.raise_for_status()
+            return response.content
+
+
+class LocalStorage(StorageInterface):
+    """로컬 디렉터리에 저장하고 /media 경로로 서빙 (오프라인 개발/성능 테스트용)"""
+
+    URL_PREFIX = "/media"
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    async def _put(self, file: BinaryIO, key: str) -> str:
+        path = self.root / key
+
+        def write():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("wb") as out:
+                shutil.copyfileobj(file, out)
+
+        await asyncio.get_running_loop().run_in_executor(None, write)
+        return f"{self.URL_PREFIX}/{key}"
+
+    async def upload(self, image_bytes: bytes, prefix: str) -> str:
+        return await self.upload_file(BytesIO(image_bytes), prefix)
+
+    @trace_service.traced("upload_image")
+    async def upload_file(self, file: BinaryIO, prefix: str) -> str:
+        return await self._put(file, f"{prefix}/{uuid.uuid4()}.png")
+
+    @trace_service.traced("upload_file")
+    async def put(self, data: bytes, key: str, content_type: str) -> str:
+        return await self._put(BytesIO(data), key)
+
+    @trace_service.traced("fetch_image")
+    async def fetch(self, url: str) -> bytes:
+        if not url.startswith(self.URL_PREFIX + "/"):
+            raise ValueError(f"로컬 저장소 URL이 아님: {url}")
+        path = self.root / url[len(self.URL_PREFIX) + 1:]
+        return await asyncio.get_running_loop().run_in_executor(None, path.read_bytes)
+
+
+def create_storage() -> StorageInterface:
+    if settings.storage_backend == "local":
+        return LocalStorage(settings.local_storage_dir)
+    return S3Storage()
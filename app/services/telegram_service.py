@@ -1,10 +1,10 @@
-import asyncio
 import logging
 import urllib.parse
 
 import httpx
 
 from app.config import settings
+from app.services.lifecycle_service import spawn_background
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +21,7 @@ class TelegramService:
         """텔레그램 메시지 전송 (fire-and-forget, 비즈니스 로직에 영향 없음)"""
         if not self.enabled:
             return
-        asyncio.create_task(self._do_send(text))
+        spawn_background(self._do_send(text))
 
     def notify_server_started(self) -> None:
         """서버 시작 알림"""
@@ -64,7 +64,7 @@ class TelegramService:
             async with httpx.AsyncClient() as client:
                 response = await client.get(url, timeout=10.0)
                 if response.status_code == 200:
-                    logger.debug(f"텔레그램 알림 전송 성공: {text}")
+                    logger.debug("텔레그램 알림 전송 성공: %s", text)
                 else:
                     logger.warning(f"텔레그램 알림 전송 실패: {response.status_code}")
         except Exception as e:
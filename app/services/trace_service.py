@@ -0,0 +1,195 @@
+import logging
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from app import json_codec
+
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    """단일 구간 기록 (단계 또는 외부 호출)"""
+
+    __slots__ = ("name", "parent", "start", "end", "attrs", "error")
+
+    def __init__(self, name: str, parent: int | None, start: float, attrs: dict):
+        self.name = name
+        self.parent = parent
+        self.start = start
+        self.end: float | None = None
+        self.attrs = attrs
+        self.error: str | None = None
+
+
+class Trace:
+    """태스크 1건의 span 타임라인"""
+
+    def __init__(self, task_id: str):
+        self.task_id = task_id
+        self.origin = time.perf_counter()
+        self.spans: list[Span] = []
+
+    def to_compact(self) -> list[list]:
+        """[name, parent, start_ms, duration_ms, attrs] 형태의 압축 리스트로 변환"""
+        rows = []
+        for span in self.spans:
+            end = span.end if span.end is not None else time.perf_counter()
+            attrs = dict(span.attrs)
+            if span.error:
+                attrs["error"] = span.error
+            rows.append([
+                span.name,
+                span.parent,
+                round((span.start - self.origin) * 1000),
+                round((end - span.start) * 1000),
+                attrs or None,
+            ])
+        return rows
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[int | None] = ContextVar("current_span", default=None)
+
+
+class TraceService:
+    """태스크별 구간(span) 계측 서비스
+
+    contextvar로 현재 태스크의 Trace를 전달하므로, asyncio.create_task로 파생된
+    호출(검증/시나리오/이미지 생성)도 같은 타임라인에 기록된다.
+    """
+
+    def __init__(self):
+        self._active: dict[str, Trace] = {}
+
+    def start(self, task_id: str) -> Trace:
+        """새 Trace를 시작하고 현재 컨텍스트에 바인딩"""
+        trace = Trace(task_id)
+        self._active[task_id] = trace
+        _current_trace.set(trace)
+        _current_span.set(None)
+        return trace
+
+    def bind(self, task_id: str) -> Trace:
+        """진행 중인 Trace를 현재 컨텍스트에 바인딩 (없으면 새로 시작)"""
+        trace = self._active.get(task_id)
+        if trace is None:
+            return self.start(task_id)
+        _current_trace.set(trace)
+        _current_span.set(None)
+        return trace
+
+    @contextmanager
+    def scoped(self, task_id: str):
+        """현재 컨텍스트에만 바인딩되는 별도 Trace (진행 중인 Trace를 가져오거나 종료하지 않음)
+
+        같은 태스크의 파이프라인이 다른 곳에서 돌고 있어도 그 타임라인을 건드리지 않고
+        토큰 사용량만 태스크에 귀속시킬 때 쓴다.
+        """
+        trace = Trace(task_id)
+        trace_token = _current_trace.set(trace)
+        span_token = _current_span.set(None)
+        try:
+            yield trace
+        finally:
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+
+    def get_active(self, task_id: str) -> Trace | None:
+        return self._active.get(task_id)
+
+    def current_task_id(self) -> str | None:
+        """현재 컨텍스트에 바인딩된 태스크 ID"""
+        trace = _current_trace.get()
+        return trace.task_id if trace else None
+
+    def finish(self, task_id: str) -> str | None:
+        """Trace를 종료하고 DB 저장용 JSON 문자열 반환"""
+        trace = self._active.pop(task_id, None)
+        if trace is None:
+            return None
+        return json_codec.dumps(trace.to_compact())
+
+    @asynccontextmanager
+    async def span(self, name: str, **attrs):
+        """현재 Trace에 구간 기록 (Trace가 없으면 아무것도 하지 않음)"""
+        trace = _current_trace.get()
+        if trace is None:
+            yield
+            return
+
+        span = Span(name, _current_span.get(), time.perf_counter(), attrs)
+        trace.spans.append(span)
+        token = _current_span.set(len(trace.spans) - 1)
+        try:
+            yield
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.end = time.perf_counter()
+            _current_span.reset(token)
+
+    def annotate(self, **attrs) -> None:
+        """현재 span에 속성 추가 (재시도 횟수 등)"""
+        trace = _current_trace.get()
+        index = _current_span.get()
+        if trace is None or index is None:
+            return
+        trace.spans[index].attrs.update(attrs)
+
+    def collect(self, attr: str) -> set:
+        """현재 Trace의 span들에 기록된 속성 값 모음"""
+        trace = _current_trace.get()
+        if trace is None:
+            return set()
+        return {span.attrs[attr] for span in trace.spans if attr in span.attrs}
+
+    def traced(self, name: str):
+        """async 함수 전체를 span으로 감싸는 데코레이터"""
+        def decorator(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                async with self.span(name):
+                    return await func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+
+def build_waterfall(rows: list[list], width: int = 60) -> dict:
+    """압축 span 리스트를 워터폴 형태로 변환"""
+    total_ms = max((start + duration for _, _, start, duration, _ in rows), default=0)
+    scale = width / total_ms if total_ms else 0
+
+    depths: list[int] = []
+    spans = []
+    for name, parent, start, duration, attrs in rows:
+        depth = depths[parent] + 1 if parent is not None else 0
+        depths.append(depth)
+        offset = int(start * scale)
+        length = max(1, int(duration * scale))
+        spans.append({
+            "name": name,
+            "depth": depth,
+            "start_ms": start,
+            "duration_ms": duration,
+            "end_ms": start + duration,
+            "attrs": attrs or {},
+            "bar": " " * offset + "█" * length,
+        })
+
+    # 크리티컬 패스: 각 단계에서 가장 늦게 끝나는 span을 따라 내려감
+    critical_path = []
+    parent = None
+    while True:
+        children = [i for i, row in enumerate(rows) if row[1] == parent]
+        if not children:
+            break
+        parent = max(children, key=lambda i: spans[i]["end_ms"])
+        critical_path.append(parent)
+
+    return {"total_ms": total_ms, "spans": spans, "critical_path": critical_path}
+
+
+trace_service = TraceService()
@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import os
+import tempfile
+from io import BytesIO
+from typing import BinaryIO
+
+import httpx
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".webp")
+
+
+class UploadLimitError(Exception):
+    """업로드 크기/개수 제한 초과 (라우터에서 HTTP 에러로 변환)"""
+
+    def __init__(self, message: str, status_code: int = 413):
+        self.message = message
+        self.status_code = status_code
+        super().__init__(message)
+
+
+class FileTooLargeError(UploadLimitError):
+    """이미지 1장이 파일별 제한 초과"""
+
+
+class SpooledImage:
+    """업로드 이미지 1장 (threshold까지는 메모리, 넘으면 임시 파일에 저장)
+
+    open()마다 독립된 읽기 핸들을 주므로 저장소 업로드와 LLM 첨부 업로드가 동시에 읽어도 되고,
+    큰 이미지는 bytes로 다시 올리지 않고 파일에서 바로 스트리밍한다.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.size = 0
+        self.path: str | None = None
+        self._buffer = bytearray()
+        self._data = b""
+        self._file = None
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self._file is None and self.size <= settings.upload_spool_threshold:
+            self._buffer += chunk
+            return
+        if self._file is None:
+            self._file = tempfile.NamedTemporaryFile(prefix="upload-", delete=False)
+            self.path = self._file.name
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+        self._file.write(chunk)
+
+    def finish(self) -> None:
+        """쓰기 종료 (이후 open으로 읽기)"""
+        if self._file is not None:
+            self._file.close()
+        else:
+            self._data = bytes(self._buffer)
+            self._buffer = bytearray()
+
+    def open(self) -> BinaryIO:
+        """새 읽기 핸들 (닫는 건 호출한 쪽)"""
+        if self.path:
+            return open(self.path, "rb")
+        return BytesIO(self._data)
+
+    def read(self) -> bytes:
+        with self.open() as file:
+            return file.read()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.path:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
+        self._buffer = bytearray()
+        self._data = b""
+
+
+def request_limit_message() -> str:
+    return f"이미지는 합쳐서 {settings.upload_max_request_bytes // (1024 * 1024)}MB까지만 넣을 수 있어요."
+
+
+def count_limit_message() -> str:
+    return f"이미지는 {settings.upload_max_images}장까지만 넣을 수 있어요 ㅠㅠ 좀만 줄여주세요!"
+
+
+class ImageIngestor:
+    """요청 1건의 첨부 이미지를 청크 단위로 받으면서 개수/파일별/요청별 제한 적용
+
+    업로드 파일은 요청 본문이 이미 UploadBodyLimitMiddleware의 제한 안에서 파싱된 것이고,
+    요청이 끝나면 Starlette가 닫으므로 백그라운드 업로드용으로 청크 단위 복사만 한다.
+    URL 이미지는 다운로드하면서 제한을 넘는 순간 중단한다.
+    개수 제한은 실제로 받은 이미지만 센다 (다운로드에 실패한 URL은 제외).
+    """
+
+    def __init__(self):
+        self.images: list[SpooledImage] = []
+        self.total_bytes = 0
+        self.closed = False
+
+    async def add_upload(self, upload: UploadFile) -> None:
+        """업로드 파일을 청크 단위로 복사 (빈 파일은 무시)"""
+        if upload.size is not None and upload.size > settings.upload_max_file_bytes:
+            raise FileTooLargeError(self._file_limit_message())
+        image = SpooledImage(upload.filename)
+        kept = False
+        try:
+            while chunk := await upload.read(CHUNK_SIZE):
+                self._write(image, chunk)
+            kept = self._keep(image)
+        finally:
+            if not kept:
+                image.close()
+
+    async def add_urls(self, urls: list[str]) -> None:
+        """외부 URL 이미지들을 병렬로 받음 (요청 제한을 넘으면 나머지 다운로드도 바로 취소)"""
+        try:
+            async with httpx.AsyncClient(timeout=10.0) as client, asyncio.TaskGroup() as group:
+                for url in urls:
+                    group.create_task(self.add_url(client, url))
+        except* UploadLimitError as errors:
+            raise errors.exceptions[0] from None
+
+    async def add_url(self, client: httpx.AsyncClient, url: str) -> None:
+        """외부 URL 이미지를 스트리밍 다운로드 (실패하거나 파일 제한을 넘으면 건너뜀)"""
+        image = SpooledImage(url)
+        kept = False
+        try:
+            async with client.stream("GET", url, follow_redirects=True) as response:
+                content_type = response.headers.get("content-type", "")
+                if response.status_code != 200 or not (
+                    "image" in content_type or url.lower().endswith(IMAGE_EXTENSIONS)
+                ):
+                    logger.warning(f"이미지 다운로드 실패: {url} (status={response.status_code})")
+                    return
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    self._write(image, chunk)
+            kept = self._keep(image)
+        except FileTooLargeError:
+            # URL 이미지는 다른 다운로드 실패처럼 건너뜀
+            logger.warning(f"이미지 다운로드 중단 (파일 크기 제한 초과): {url}")
+        except UploadLimitError:
+            raise
+        except Exception as e:
+            logger.warning(f"이미지 다운로드 에러: {url} ({e})")
+        finally:
+            # 실패/취소되거나 이미 닫힌 ingestor면 여기서 정리
+            if not kept:
+                image.close()
+
+    def close(self) -> None:
+        self.closed = True
+        for image in self.images:
+            image.close()
+        self.images = []
+
+    def _file_limit_message(self) -> str:
+        return f"이미지는 한 장에 {settings.upload_max_file_bytes // (1024 * 1024)}MB까지만 넣을 수 있어요."
+
+    def _write(self, image: SpooledImage, chunk: bytes) -> None:
+        if self.closed:
+            raise UploadLimitError("업로드가 이미 중단됐어요.")
+        self.total_bytes += len(chunk)
+        if image.size + len(chunk) > settings.upload_max_file_bytes:
+            self.total_bytes -= image.size + len(chunk)
+            raise FileTooLargeError(self._file_limit_message())
+        if self.total_bytes > settings.upload_max_request_bytes:
+            raise UploadLimitError(request_limit_message())
+        image.write(chunk)
+
+    def _keep(self, image: SpooledImage) -> bool:
+        """받은 이미지 추가 (빈 이미지는 버림, 개수 제한 초과 시 UploadLimitError)"""
+        if image.size == 0 or self.closed:
+            return False
+        if len(self.images) >= settings.upload_max_images:
+            raise UploadLimitError(count_limit_message(), status_code=400)
+        image.finish()
+        self.images.append(image)
+        return True
+
+
+class UploadBodyLimitMiddleware:
+    """업로드 경로의 요청 본문 크기 제한 (ASGI)
+
+    Content-Length로 먼저 거절하고, 헤더가 없거나 실제 본문이 더 길어도
+    받은 바이트를 세다가 제한을 넘는 순간 multipart 파싱(임시 파일 저장)을 중단시킨다.
+    """
+
+    def __init__(self, app: ASGIApp, paths: set[str], max_bytes: int):
+        self.app = app
+        self.paths = paths
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_bytes:
+            response = JSONResponse(status_code=413, content={"detail": request_limit_message()})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_limited() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # 본문을 읽는 쪽(FastAPI 폼 파싱)에서 그대로 413 응답으로 바뀜
+                    raise HTTPException(status_code=413, detail=request_limit_message())
+            return message
+
+        await self.app(scope, receive_limited, send)
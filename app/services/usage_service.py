@@ -0,0 +1,64 @@
+import logging
+
+from app.database import async_session
+from app.models import GeminiUsage
+from app.services.lifecycle_service import spawn_background
+from app.services.trace_service import trace_service
+
+logger = logging.getLogger(__name__)
+
+
+def _image_token_count(details) -> int:
+    """modality별 토큰 목록에서 IMAGE 토큰만 합산"""
+    total = 0
+    for detail in details or []:
+        modality = getattr(detail.modality, "value", detail.modality)
+        if modality == "IMAGE":
+            total += detail.token_count or 0
+    return total
+
+
+class UsageService:
+    """Gemini generate_content 응답의 usage_metadata 기록 서비스"""
+
+    def record(self, call_type: str, model: str, response, latency: float, attempts: int = 1) -> None:
+        """응답의 토큰 사용량을 현재 태스크 기준으로 저장 (비즈니스 로직에 영향 없음)"""
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return
+
+        record = GeminiUsage(
+            task_id=trace_service.current_task_id(),
+            call_type=call_type,
+            model=model,
+            prompt_tokens=usage.prompt_token_count or 0,
+            cached_tokens=usage.cached_content_token_count or 0,
+            output_tokens=usage.candidates_token_count or 0,
+            thoughts_tokens=usage.thoughts_token_count or 0,
+            image_tokens=(
+                _image_token_count(usage.prompt_tokens_details)
+                + _image_token_count(usage.candidates_tokens_details)
+            ),
+            total_tokens=usage.total_token_count or 0,
+            latency=round(latency, 3),
+            attempts=attempts,
+        )
+        trace_service.annotate(
+            prompt_tokens=record.prompt_tokens,
+            cached_tokens=record.cached_tokens,
+            output_tokens=record.output_tokens,
+        )
+
+        spawn_background(self._save(record))
+
+    async def _save(self, record: GeminiUsage) -> None:
+        """새 세션으로 사용량 저장 (내부용)"""
+        try:
+            async with async_session() as db:
+                db.add(record)
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"토큰 사용량 저장 실패 ({record.call_type}): {e}")
+
+
+usage_service = UsageService()
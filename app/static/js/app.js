@@ -74,10 +74,12 @@ document.addEventListener('DOMContentLoaded', () => {
             for (const task of data.tasks) {
                 const item = document.createElement('a');
                 item.className = 'history-item';
-                item.href = task.status === 'completed' ? `/view/${task.id}` : '#';
+                const viewable = task.status === 'completed' || task.status === 'preview';
+                item.href = viewable ? `/view/${task.id}` : '#';
 
                 const statusText = {
                     completed: '완료',
+                    preview: '다듬는 중',
                     processing: '생성 중',
                     pending: '대기 중'
                 };
@@ -87,7 +89,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 item.innerHTML = `
                     ${task.thumbnail_url
                         ? `<img class="history-thumbnail" src="${task.thumbnail_url}" alt="">`
-                        : `<div class="history-thumbnail placeholder">${task.status === 'completed' ? '🎨' : '⏳'}</div>`
+                        : `<div class="history-thumbnail placeholder">${viewable ? '🎨' : '⏳'}</div>`
                     }
                     <div class="history-info">
                         <div class="history-preview">${escapeHtml(task.meeting_text_preview)}</div>
@@ -98,7 +100,7 @@ document.addEventListener('DOMContentLoaded', () => {
                     </div>
                 `;
 
-                if (task.status !== 'completed') {
+                if (!viewable) {
                     item.onclick = (e) => {
                         e.preventDefault();
                         if (task.status === 'processing') {
@@ -559,7 +561,8 @@ document.addEventListener('DOMContentLoaded', () => {
                 const response = await apiFetch(`${API_BASE_URL}/status/${taskId}`);
                 const status = await response.json();
 
-                if (status.status === 'completed') {
+                // preview: flash 프리뷰가 준비됨 → 결과 페이지에서 최종본으로 교체됨
+                if (status.status === 'completed' || status.status === 'preview') {
                     updateProgress(100, '완료!');
                     cleanup();
                     setTimeout(() => {
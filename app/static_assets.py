@@ -0,0 +1,190 @@
+"""정적 파일 빌드: 내용 해시를 붙인 사본 + 미리 압축한 .gz/.br + manifest.json
+
+static_dir의 파일을 {static_dir}/dist/ 아래에 style.3f9a1c2b7d.css 같은 이름으로 복사하고,
+서버는 HTML 안의 /static/... 경로를 manifest의 해시 경로로 바꿔서 내보냅니다.
+해시 경로는 내용이 바뀌면 URL도 바뀌므로 immutable로 1년 캐시합니다.
+이전 빌드의 해시 파일은 지우지 않습니다 (발행해 둔 결과 페이지가 계속 참조).
+
+    python -m app.static_assets
+    python -m app.static_assets --static-dir docs/static --html docs/index.html docs/result.html
+
+빌드하지 않으면 원래 경로 그대로 서빙합니다 (no-cache로 매번 재검증).
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from app.compression import accepts_encoding, brotli
+from app.config import settings
+
+BUILD_DIR = "dist"
+MANIFEST = "manifest.json"
+HASH_LENGTH = 10
+IMMUTABLE = "public, max-age=31536000, immutable"
+# 미리 압축할 형식 (이미지는 이미 압축돼 있음)
+COMPRESSIBLE_SUFFIXES = {".css", ".js", ".html", ".json", ".svg", ".txt"}
+# HTML 안의 정적 파일 참조: "/static/css/style.css?v=2", "static/js/app.js" (절대 URL은 제외)
+STATIC_REF = re.compile(r"""(?<=["'(])(/?)static/([^"'()?#\s]+)(?:\?[^"'()#\s]*)?""")
+
+
+def build(static_dir: str | Path) -> dict[str, str]:
+    """static_dir의 파일을 해시 경로로 복사하고 manifest 반환 (원본 상대 경로 → dist/ 해시 경로)"""
+    root = Path(static_dir)
+    out = root / BUILD_DIR
+    manifest = {}
+    for path in sorted(root.rglob("*")):
+        rel = path.relative_to(root)
+        if not path.is_file() or rel.parts[0] == BUILD_DIR or any(part.startswith(".") for part in rel.parts):
+            continue
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+        hashed = rel.with_name(f"{rel.stem}.{digest}{rel.suffix}")
+        target = out / hashed
+        manifest[rel.as_posix()] = f"{BUILD_DIR}/{hashed.as_posix()}"
+        if target.exists():
+            continue  # 내용이 같으면 이름도 같음
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if rel.suffix in COMPRESSIBLE_SUFFIXES and len(data) >= settings.compress_min_size:
+            _write(target.with_name(target.name + ".gz"), gzip.compress(data, compresslevel=9, mtime=0))
+            if brotli is not None:
+                _write(target.with_name(target.name + ".br"), brotli.compress(data, quality=11))
+        # 본 파일을 마지막에 써서, 있으면 압축본도 있는 것으로 간주
+        _write(target, data)
+    out.mkdir(parents=True, exist_ok=True)
+    _write(out / MANIFEST, json.dumps(manifest, indent=2, sort_keys=True).encode())
+    return manifest
+
+
+def _write(path: Path, data: bytes) -> None:
+    """임시 파일에 쓰고 교체 (서빙 중인 서버가 쓰다 만 파일을 보지 않도록)"""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class StaticAssets:
+    """빌드 manifest 기반 정적 파일 URL (빌드 전이면 원래 경로)"""
+
+    def __init__(self, static_dir: str):
+        self.static_dir = Path(static_dir)
+        self._manifest: dict[str, str] | None = None
+        self._manifest_mtime: float | None = None
+        self._pages: dict[Path, str] = {}
+
+    @property
+    def manifest(self) -> dict[str, str]:
+        # dev에서는 다시 빌드하면 바로 반영되도록 매번 확인
+        if self._manifest is None or settings.env == "DEV":
+            self._load_manifest()
+        return self._manifest
+
+    def _load_manifest(self) -> None:
+        path = self.static_dir / BUILD_DIR / MANIFEST
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            self._manifest, self._manifest_mtime = {}, None
+            return
+        if mtime != self._manifest_mtime:
+            self._manifest = json.loads(path.read_text(encoding="utf-8"))
+            self._manifest_mtime = mtime
+            self._pages.clear()
+
+    def url(self, path: str) -> str:
+        """정적 파일 URL (예: css/style.css → /static/dist/css/style.3f9a1c2b7d.css)"""
+        return f"/static/{self.manifest.get(path, path)}"
+
+    def rewrite(self, html: str) -> str:
+        """HTML 안의 /static/... 참조를 해시 경로로 치환 (캐시 무효화용 ?v=는 제거)"""
+        manifest = self.manifest
+        if not manifest:
+            return html
+
+        def replace(match: re.Match) -> str:
+            hashed = manifest.get(match.group(2))
+            return f"{match.group(1)}static/{hashed}" if hashed else match.group(0)
+
+        return STATIC_REF.sub(replace, html)
+
+    def page(self, path: Path) -> str:
+        """템플릿 HTML을 읽어 정적 파일 경로를 치환한 결과 (manifest가 바뀔 때까지 캐시, dev에서는 매번)"""
+        manifest = self.manifest
+        if path not in self._pages or settings.env == "DEV":
+            html = path.read_text(encoding="utf-8")
+            self._pages[path] = self.rewrite(html) if manifest else html
+        return self._pages[path]
+
+
+class AssetStaticFiles(StaticFiles):
+    """/static 서빙: 해시 경로(dist/)는 immutable 캐시 + 미리 압축한 파일, 원래 경로는 no-cache"""
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200) -> Response:
+        rel = os.path.relpath(full_path, os.path.realpath(self.directory))
+        if rel.split(os.sep)[0] != BUILD_DIR:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+            response.headers["Cache-Control"] = "no-cache"
+            return response
+
+        request_headers = Headers(scope=scope)
+        headers = {"Cache-Control": IMMUTABLE}
+        response = None
+        if Path(full_path).suffix in COMPRESSIBLE_SUFFIXES:
+            response = self._precompressed(full_path, request_headers, headers, status_code)
+        if response is None:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result, headers=headers)
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    @staticmethod
+    def _precompressed(full_path, request_headers: Headers, headers: dict, status_code: int) -> Response | None:
+        """클라이언트가 받을 수 있는 미리 압축한 파일 (br 우선, 없으면 None)"""
+        for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+            if not accepts_encoding(request_headers, encoding):
+                continue
+            try:
+                stat_result = os.stat(f"{full_path}{suffix}")
+            except FileNotFoundError:
+                continue
+            return FileResponse(
+                f"{full_path}{suffix}",
+                status_code=status_code,
+                stat_result=stat_result,
+                media_type=mimetypes.guess_type(str(full_path))[0] or "text/plain",
+                headers={**headers, "Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+            )
+        return None
+
+
+static_assets = StaticAssets(settings.static_dir)
+static_url = static_assets.url
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--static-dir", default=settings.static_dir, help="빌드할 정적 파일 디렉터리")
+    parser.add_argument("--html", nargs="*", default=[], help="정적 파일 경로를 해시 경로로 치환할 HTML 파일 (제자리 수정)")
+    args = parser.parse_args()
+
+    manifest = build(args.static_dir)
+    print(f"{len(manifest)}개 파일 → {Path(args.static_dir) / BUILD_DIR}")
+    assets = StaticAssets(args.static_dir)
+    for name in args.html:
+        path = Path(name)
+        path.write_text(assets.rewrite(path.read_text(encoding="utf-8")), encoding="utf-8")
+        print(f"치환: {path}")
+
+
+if __name__ == "__main__":
+    main()
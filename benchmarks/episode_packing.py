@@ -0,0 +1,129 @@
+"""에피소드 개별 생성 vs 묶음 생성(2개를 이미지 1장으로 생성 후 분리) 비교 벤치마크
+
+실제 Gemini API를 호출하므로 .env의 GEMINI_API_KEY가 필요합니다.
+S3 대신 --out 디렉터리에 이미지를 저장하므로 두 방식의 결과물을 나란히 비교할 수 있습니다.
+
+    python -m benchmarks.episode_packing --runs 2
+    python -m benchmarks.episode_packing --runs 1 --reference sheet.png --out /tmp/packing
+
+각 방식별로 전체 소요시간, 이미지 호출 수, 토큰 사용량(prompt / output)을 출력합니다.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+# 토큰 사용량 저장용 임시 DB (운영 DB에 쓰지 않도록 import 전에 설정)
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.gettempdir()}/toonify_bench.db")
+# 같은 프롬프트를 반복 호출하므로 이미지 캐시는 끔
+os.environ.setdefault("IMAGE_CACHE_ENABLED", "false")
+
+from app.config import settings  # noqa: E402
+from app.database import init_db  # noqa: E402
+from app.services.comic_service import comic_service  # noqa: E402
+from app.schemas import PanelScenario  # noqa: E402
+from app.services.providers import get_image_service, get_storage  # noqa: E402
+from app.services.trace_service import trace_service  # noqa: E402
+
+SAMPLE_PROMPTS = [
+    "[Character: PM] (short black hair, navy cardigan) points at a calendar on the wall. Speech bubble: '베타는 15일!'",
+    "[Character: Dev] (glasses, grey hoodie) raises a hand nervously at the meeting table. Speech bubble: '결제 연동이 남았어요...'",
+    "[Character: Designer] (pink beanie, striped shirt) shows onboarding sketches on a tablet. Speech bubble: '금요일까지 드릴게요'",
+    "[Character: PM] and [Character: Dev] shake hands in front of a whiteboard reading '베타 20일'. Speech bubble: '그럼 확정!'",
+]
+
+
+def _token_totals(task_id: str) -> dict:
+    """Trace span 속성에 기록된 토큰 수 합산"""
+    trace = trace_service.get_active(task_id)
+    totals = {"calls": 0, "prompt_tokens": 0, "output_tokens": 0}
+    for span in trace.spans:
+        if "prompt_tokens" in span.attrs:
+            totals["calls"] += 1
+            for key in ("prompt_tokens", "output_tokens"):
+                totals[key] += span.attrs.get(key) or 0
+    return totals
+
+
+async def run_individual(prompts: list[str], reference: str) -> list[str]:
+    return list(await asyncio.gather(*[
+        get_image_service().generate_image_with_reference(prompt, reference) for prompt in prompts
+    ]))
+
+
+async def run_packed(prompts: list[str], reference: str) -> list[str]:
+    groups = comic_service._episode_groups(list(range(len(prompts))))
+    results = await asyncio.gather(*[
+        get_image_service().generate_packed_with_reference([prompts[i] for i in group], reference)
+        if len(group) > 1
+        else get_image_service().generate_image_with_reference(prompts[group[0]], reference)
+        for group in groups
+    ])
+    return [
+        path
+        for result in results
+        for path in (result if isinstance(result, list) else [result])
+    ]
+
+
+def _summary(values: list[float]) -> str:
+    return f"mean {statistics.mean(values):6.2f}s  p50 {statistics.median(values):6.2f}s  max {max(values):6.2f}s"
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=2)
+    parser.add_argument("--reference", help="캐릭터 시트 이미지 파일 (기본: 샘플 프롬프트로 새로 생성)")
+    parser.add_argument("--out", default=f"{tempfile.gettempdir()}/toonify_packing", help="결과 이미지 저장 경로")
+    args = parser.parse_args()
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # S3 대신 --out 디렉터리에 저장
+    settings.storage_backend = "local"
+    settings.local_storage_dir = str(out_dir)
+    # 묶음 방식은 설정과 관계없이 항상 2개씩 묶어서 비교
+    settings.episode_packing_enabled = True
+    settings.episode_packing_min_episodes = 2
+    settings.progressive_rendering = False
+
+    await init_db()
+
+    if args.reference:
+        reference = await get_storage().upload(Path(args.reference).read_bytes(), prefix="reference")
+    else:
+        panels = [PanelScenario(episode_number=i + 1, image_prompt=p) for i, p in enumerate(SAMPLE_PROMPTS)]
+        reference = await get_image_service().generate_image_fast(comic_service._build_character_sheet_prompt(panels, "bench"))
+        print(f"캐릭터 시트: {reference}")
+
+    modes = {"individual": run_individual, "packed": run_packed}
+    for name, runner in modes.items():
+        elapsed_times = []
+        tokens = {"calls": 0, "prompt_tokens": 0, "output_tokens": 0}
+        for i in range(args.runs):
+            task_id = f"bench-{name}-{i}"
+            trace_service.start(task_id)
+            start = time.perf_counter()
+            paths = await runner(SAMPLE_PROMPTS, reference)
+            elapsed_times.append(time.perf_counter() - start)
+            for key, value in _token_totals(task_id).items():
+                tokens[key] += value
+            trace_service.finish(task_id)
+            print(f"[{name} #{i + 1}] " + " ".join(Path(p).name for p in paths))
+
+        print(f"\n=== {name} ({args.runs} runs, 에피소드 {len(SAMPLE_PROMPTS)}개) ===")
+        print(f"전체 소요시간   {_summary(elapsed_times)}")
+        print(
+            f"run당 호출 {tokens['calls'] / args.runs:.1f}회 / "
+            f"prompt {tokens['prompt_tokens'] // args.runs} / "
+            f"output {tokens['output_tokens'] // args.runs} tokens"
+        )
+
+    print(f"\n결과 이미지: {out_dir}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
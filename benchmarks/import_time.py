@@ -0,0 +1,67 @@
+"""app.main import 시간 측정 및 예산 검사 (python -X importtime 기반)
+
+워커 부팅/테스트 수집 시간을 지키기 위해, 외부 API SDK(google-genai, boto3 등)는
+app.main import 시점에 로드되지 않아야 합니다 (app/services/providers.py에서 첫 사용 시 로드).
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget-ms 1500 --top 20
+
+새 프로세스에서 import를 --runs회 반복해 최솟값을 기준으로 판단하고,
+누적 시간이 큰 모듈 상위 --top개를 출력합니다.
+예산 초과 또는 지연 로드 대상 모듈이 import되면 exit code 1로 종료합니다.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# app.main import 시점에 로드되면 안 되는 모듈
+LAZY_MODULES = ("google.genai", "boto3", "botocore", "PIL.Image")
+
+
+def measure() -> dict[str, tuple[int, int]]:
+    """새 인터프리터에서 app.main import 후 모듈별 (self_us, cumulative_us) 반환"""
+    env = dict(os.environ)
+    env.setdefault("GEMINI_API_KEY", "import-time-check")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=1500, help="app.main import 시간 예산 (ms)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.runs)]
+    best = min(runs, key=lambda modules: modules["app.main"][1])
+    total_ms = best["app.main"][1] / 1000
+
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for name, (self_us, cumulative_us) in sorted(best.items(), key=lambda item: -item[1][1])[:args.top]:
+        print(f"{cumulative_us / 1000:10.1f}ms {self_us / 1000:8.1f}ms  {name}")
+
+    failed = False
+    loaded = [name for name in LAZY_MODULES if name in best]
+    if loaded:
+        print(f"\n지연 로드 대상 모듈이 app.main import 시점에 로드됨: {', '.join(loaded)}")
+        failed = True
+    status = "OK" if total_ms <= args.budget_ms else "초과"
+    print(f"\napp.main import {total_ms:.0f}ms (예산 {args.budget_ms:.0f}ms, {args.runs}회 중 최솟값) {status}")
+    if total_ms > args.budget_ms:
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""parallel(검증/시나리오 2회 호출) vs single(통합 1회 호출) 모드 비교 벤치마크
+
+실제 Gemini API를 호출하므로 .env의 GEMINI_API_KEY가 필요합니다.
+
+    python -m benchmarks.llm_modes --runs 5
+    python -m benchmarks.llm_modes --runs 3 --input my_meeting.txt
+
+각 모드별로 사용자가 응답을 받기까지의 시간(검증 결과), 시나리오 완료까지의 시간,
+호출 수와 토큰 사용량(prompt / cached / output)을 출력합니다.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+# 토큰 사용량 저장용 임시 DB (운영 DB에 쓰지 않도록 import 전에 설정)
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.gettempdir()}/toonify_bench.db")
+
+from app.database import init_db  # noqa: E402
+from app.services.llm_service import COMBINED_PROMPT  # noqa: E402
+from app.services.providers import get_llm_service  # noqa: E402
+from app.services.trace_service import trace_service  # noqa: E402
+
+SAMPLE_TEXT = """
+[주간 회의] 참석: 김PM, 이개발, 박디자인
+김PM: 다음 달 출시 일정 확정해야 합니다. 베타는 15일, 정식은 30일로 생각 중이에요.
+이개발: 결제 모듈 연동이 아직 남아서 베타를 20일로 미루는 게 안전합니다.
+박디자인: 온보딩 화면 시안은 이번 주 금요일까지 드릴게요.
+김PM: 그럼 베타 20일, 정식 30일 유지로 하죠. 이개발님은 결제 QA 계획 공유 부탁드립니다.
+이개발: 네, 수요일까지 공유하겠습니다.
+""".strip()
+
+
+def _token_totals(task_id: str) -> dict:
+    """Trace span 속성에 기록된 토큰 수 합산"""
+    trace = trace_service.get_active(task_id)
+    totals = {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0, "output_tokens": 0}
+    for span in trace.spans:
+        if "prompt_tokens" in span.attrs:
+            totals["calls"] += 1
+            for key in ("prompt_tokens", "cached_tokens", "output_tokens"):
+                totals[key] += span.attrs.get(key) or 0
+    return totals
+
+
+async def run_parallel(text: str) -> tuple[float, float]:
+    start = time.perf_counter()
+    validation_task = asyncio.create_task(get_llm_service().validate_input(text))
+    scenario_task = asyncio.create_task(get_llm_service().analyze_meeting(text))
+    await validation_task
+    validation_elapsed = time.perf_counter() - start
+    await scenario_task
+    return validation_elapsed, time.perf_counter() - start
+
+
+async def run_single(text: str) -> tuple[float, float]:
+    start = time.perf_counter()
+    await get_llm_service().validate_and_analyze(text)
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed
+
+
+def _summary(values: list[float]) -> str:
+    return f"mean {statistics.mean(values):6.2f}s  p50 {statistics.median(values):6.2f}s  max {max(values):6.2f}s"
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--input", help="입력 텍스트 파일 (기본: 내장 샘플 회의록)")
+    args = parser.parse_args()
+
+    text = open(args.input, encoding="utf-8").read() if args.input else SAMPLE_TEXT
+
+    await init_db()
+    get_llm_service().prompt_cache.register("combined", COMBINED_PROMPT)
+    await get_llm_service().prompt_cache.start()
+
+    modes = {"parallel": run_parallel, "single": run_single}
+    for name, runner in modes.items():
+        validation_times, scenario_times = [], []
+        tokens = {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0, "output_tokens": 0}
+        for i in range(args.runs):
+            task_id = f"bench-{name}-{i}"
+            trace_service.start(task_id)
+            validation_elapsed, scenario_elapsed = await runner(text)
+            validation_times.append(validation_elapsed)
+            scenario_times.append(scenario_elapsed)
+            for key, value in _token_totals(task_id).items():
+                tokens[key] += value
+            trace_service.finish(task_id)
+
+        print(f"\n=== {name} ({args.runs} runs, 입력 {len(text)}자) ===")
+        print(f"검증 응답까지   {_summary(validation_times)}")
+        print(f"시나리오 완료   {_summary(scenario_times)}")
+        print(
+            f"run당 호출 {tokens['calls'] / args.runs:.1f}회 / "
+            f"prompt {tokens['prompt_tokens'] // args.runs} "
+            f"(cached {tokens['cached_tokens'] // args.runs}) / "
+            f"output {tokens['output_tokens'] // args.runs} tokens"
+        )
+
+    await get_llm_service().prompt_cache.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,372 @@
+"""만화 생성 파이프라인 전체 부하 테스트 (fake provider + 로컬 저장소, API 키 불필요)
+
+앱을 같은 프로세스의 별도 스레드에서 uvicorn으로 띄우고, 가상 사용자들이 HTTP로
+/generate(또는 /generate-with-images) → /status 폴링 → /result 까지 반복합니다.
+
+    python -m benchmarks.load                      # 기본 프로필로 실행 후 baseline과 비교
+    python -m benchmarks.load --users 20 --tasks-per-user 5 --no-check
+    python -m benchmarks.load --update-baseline    # 현재 결과를 baseline으로 저장
+
+출력: 처리량(완료 태스크/초), 요청 수락(accept) / 완료까지(e2e) 지연 p50·p95·p99,
+단계별(span) 지연, DB 커넥션 풀 사용량, 서버 이벤트 루프 지연.
+baseline(benchmarks/baselines/load.json) 대비 처리량이 --tolerance 이상 떨어지거나
+E2E p95가 --tolerance 이상 늘면 exit code 1로 종료합니다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from io import BytesIO
+from pathlib import Path
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "load.json"
+
+# 사용자 프로필 (--profile 이름:비중)
+PROFILES = {
+    "text": "텍스트만 보내는 사용자 (/generate)",
+    "images": "이미지 1장을 첨부하는 사용자 (/generate-with-images)",
+}
+
+SAMPLE_LINES = [
+    "김PM: 베타 출시는 20일, 정식 출시는 30일로 확정합니다.",
+    "이개발: 결제 모듈 연동 QA 계획을 수요일까지 공유하겠습니다.",
+    "박디자인: 온보딩 화면 시안은 금요일까지 드릴게요.",
+    "최마케팅: 출시 알림 메일은 베타 전날 발송 예정입니다.",
+    "김PM: 다음 회의에서 베타 피드백 수집 방식을 정하죠.",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=8, help="동시 가상 사용자 수")
+    parser.add_argument("--tasks-per-user", type=int, default=3)
+    parser.add_argument("--profile", action="append", default=None,
+                        help="사용자 프로필 이름[:비중] (기본: text:3, images:1)")
+    parser.add_argument("--think-time", type=float, default=0.2, help="사용자별 다음 요청까지 대기 (초)")
+    parser.add_argument("--poll-interval", type=float, default=0.1)
+    parser.add_argument("--episodes", type=int, default=4, help="fake 시나리오 에피소드 수")
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="fake LLM 지연 중앙값 (초)")
+    parser.add_argument("--image-latency", type=float, default=1.0, help="fake pro 이미지 지연 중앙값 (초)")
+    parser.add_argument("--flash-latency", type=float, default=0.4, help="fake flash 이미지 지연 중앙값 (초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tolerance", type=float, default=0.2, help="baseline 대비 허용 악화 비율")
+    parser.add_argument("--no-check", action="store_true", help="baseline 비교 생략")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", help="결과를 JSON 파일로도 저장")
+    return parser.parse_args()
+
+
+def configure_env(args: argparse.Namespace, workdir: str) -> None:
+    """app import 전에 fake provider / 임시 DB / 로컬 저장소 설정"""
+    os.environ.update({
+        "ENV": "DEV",
+        "DATABASE_URL": f"sqlite+aiosqlite:///{workdir}/load.db",
+        "LLM_PROVIDER": "fake",
+        "IMAGE_PROVIDER": "fake",
+        "STORAGE_BACKEND": "local",
+        "LOCAL_STORAGE_DIR": f"{workdir}/media",
+        "ATTACHMENT_MODE": "inline",
+        "GEMINI_CONTEXT_CACHE_ENABLED": "false",
+        "FAKE_SEED": str(args.seed),
+        "FAKE_EPISODE_COUNT": str(args.episodes),
+        "FAKE_LLM_LATENCY": str(args.llm_latency),
+        "FAKE_IMAGE_LATENCY": str(args.image_latency),
+        "FAKE_FLASH_IMAGE_LATENCY": str(args.flash_latency),
+        "FAKE_FAILURE_RATE": str(args.failure_rate),
+    })
+
+
+def admin_headers() -> dict:
+    """/debug/trace 조회용 (ADMIN_TOKEN이 설정돼 있으면 로컬 요청도 토큰 필요)"""
+    token = os.environ.get("ADMIN_TOKEN")
+    return {"X-Admin-Token": token} if token else {}
+
+
+def percentiles(values: list[float]) -> dict:
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+    return {
+        "count": len(ordered),
+        "mean": round(statistics.mean(ordered), 4),
+        "p50": round(pick(0.5), 4),
+        "p95": round(pick(0.95), 4),
+        "p99": round(pick(0.99), 4),
+        "max": round(ordered[-1], 4),
+    }
+
+
+class ServerProbe:
+    """서버 이벤트 루프에서 루프 지연 / DB 풀 사용량을 주기적으로 샘플링"""
+
+    INTERVAL = 0.05
+
+    def __init__(self):
+        self.loop_lag: list[float] = []
+        self.pool_checked_out: list[int] = []
+        self.pool_overflow: list[int] = []
+
+    async def run(self) -> None:
+        from app.database import engine
+
+        pool = engine.pool
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.INTERVAL)
+            self.loop_lag.append(time.perf_counter() - start - self.INTERVAL)
+            self.pool_checked_out.append(pool.checkedout())
+            self.pool_overflow.append(max(0, pool.overflow()))
+
+    def summary(self) -> dict:
+        from app.database import engine
+
+        return {
+            "loop_lag": percentiles(self.loop_lag),
+            "db_pool": {
+                "size": engine.pool.size(),
+                "max_checked_out": max(self.pool_checked_out, default=0),
+                "mean_checked_out": round(statistics.mean(self.pool_checked_out), 2) if self.pool_checked_out else 0,
+                "max_overflow": max(self.pool_overflow, default=0),
+            },
+        }
+
+
+class AppServer:
+    """앱을 별도 스레드의 이벤트 루프에서 uvicorn으로 실행 (부하 발생기와 루프 분리)"""
+
+    def __init__(self, probe: ServerProbe):
+        import uvicorn
+
+        from app.main import app
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self.server = uvicorn.Server(uvicorn.Config(
+            app, host="127.0.0.1", port=self.port, log_level="warning", lifespan="on",
+        ))
+        self.probe = probe
+        self.thread = threading.Thread(target=lambda: asyncio.run(self._serve()), daemon=True)
+
+    async def _serve(self) -> None:
+        probe_task = asyncio.create_task(self.probe.run())
+        try:
+            await self.server.serve()
+        finally:
+            probe_task.cancel()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> None:
+        self.thread.start()
+        while not self.server.started:
+            if not self.thread.is_alive():
+                raise RuntimeError("서버 시작 실패")
+            time.sleep(0.05)
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        self.thread.join(timeout=30)
+
+
+def _sample_png() -> bytes:
+    from PIL import Image
+
+    buffer = BytesIO()
+    Image.new("RGB", (320, 240), "white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class LoadRunner:
+    def __init__(self, args: argparse.Namespace, base_url: str):
+        self.args = args
+        self.base_url = base_url
+        self.rng = random.Random(args.seed)
+        self.profiles = self._parse_profiles(args.profile or ["text:3", "images:1"])
+        self.png = _sample_png()
+        self.accept_latency: list[float] = []
+        self.e2e_latency: dict[str, list[float]] = defaultdict(list)
+        self.stages: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, int] = defaultdict(int)
+
+    @staticmethod
+    def _parse_profiles(specs: list[str]) -> list[tuple[str, float]]:
+        profiles = []
+        for spec in specs:
+            name, _, weight = spec.partition(":")
+            if name not in PROFILES:
+                raise SystemExit(f"알 수 없는 프로필: {name} (가능: {', '.join(PROFILES)})")
+            profiles.append((name, float(weight or 1)))
+        return profiles
+
+    def _meeting_text(self, user: int, index: int) -> str:
+        # 사용자/회차마다 다른 입력 (이미지 캐시, fake 지연 seed가 겹치지 않도록)
+        lines = self.rng.sample(SAMPLE_LINES, k=len(SAMPLE_LINES))
+        return f"[회의 {user}-{index}]\n" + "\n".join(lines)
+
+    async def _submit(self, client, profile: str, text: str):
+        if profile == "images":
+            return await client.post(
+                "/generate-with-images",
+                data={"meeting_text": text},
+                files=[("images", ("meeting.png", self.png, "image/png"))],
+            )
+        return await client.post("/generate", json={"meeting_text": text})
+
+    async def _run_task(self, client, user: int, index: int) -> None:
+        profile = self.rng.choices([p for p, _ in self.profiles], weights=[w for _, w in self.profiles])[0]
+        start = time.perf_counter()
+        response = await self._submit(client, profile, self._meeting_text(user, index))
+        self.accept_latency.append(time.perf_counter() - start)
+        if response.status_code != 200:
+            self.statuses[f"http_{response.status_code}"] += 1
+            return
+
+        task_id = response.json()["task"]["id"]
+        while True:
+            await asyncio.sleep(self.args.poll_interval)
+            status = (await client.get(f"/status/{task_id}")).json()["status"]
+            if status in ("completed", "failed"):
+                break
+        await client.get(f"/result/{task_id}")
+        self.e2e_latency[profile].append(time.perf_counter() - start)
+        self.statuses[status] += 1
+
+        trace = (await client.get(f"/debug/trace/{task_id}")).json()
+        for span in trace.get("spans", []):
+            self.stages[span["name"]].append(span["duration_ms"] / 1000)
+
+    async def _user(self, client, user: int) -> None:
+        for index in range(self.args.tasks_per_user):
+            await self._run_task(client, user, index)
+            await asyncio.sleep(self.args.think_time)
+
+    async def run(self) -> float:
+        import httpx
+
+        limits = httpx.Limits(max_connections=self.args.users * 2)
+        async with httpx.AsyncClient(base_url=self.base_url, headers=admin_headers(), timeout=120, limits=limits) as client:
+            start = time.perf_counter()
+            await asyncio.gather(*[self._user(client, user) for user in range(self.args.users)])
+            return time.perf_counter() - start
+
+
+def build_report(args: argparse.Namespace, runner: LoadRunner, probe: ServerProbe, elapsed: float) -> dict:
+    all_e2e = [value for values in runner.e2e_latency.values() for value in values]
+    return {
+        "config": {
+            "users": args.users,
+            "tasks_per_user": args.tasks_per_user,
+            "profiles": [f"{name}:{weight:g}" for name, weight in runner.profiles],
+            "episodes": args.episodes,
+            "llm_latency": args.llm_latency,
+            "image_latency": args.image_latency,
+            "flash_latency": args.flash_latency,
+            "failure_rate": args.failure_rate,
+            "seed": args.seed,
+        },
+        "elapsed": round(elapsed, 3),
+        "throughput": round(runner.statuses["completed"] / elapsed, 4),
+        "statuses": dict(runner.statuses),
+        "accept": percentiles(runner.accept_latency),
+        "e2e": percentiles(all_e2e),
+        "e2e_by_profile": {name: percentiles(values) for name, values in runner.e2e_latency.items()},
+        "stages": {name: percentiles(values) for name, values in sorted(runner.stages.items())},
+        **probe.summary(),
+    }
+
+
+def print_report(report: dict) -> None:
+    def row(name: str, stats: dict) -> str:
+        if not stats.get("count"):
+            return f"  {name:<32} -"
+        return (
+            f"  {name:<32} n={stats['count']:<4} p50 {stats['p50']:7.3f}s  "
+            f"p95 {stats['p95']:7.3f}s  p99 {stats['p99']:7.3f}s"
+        )
+
+    print(f"\n=== 부하 테스트 ({report['config']['users']} users × {report['config']['tasks_per_user']} tasks) ===")
+    print(f"소요 {report['elapsed']:.1f}s, 처리량 {report['throughput']:.3f} tasks/s, 상태 {report['statuses']}")
+    print(row("accept", report["accept"]))
+    print(row("e2e", report["e2e"]))
+    for name, stats in report["e2e_by_profile"].items():
+        print(row(f"e2e [{name}]", stats))
+    print("단계별:")
+    for name, stats in report["stages"].items():
+        print(row(name, stats))
+    pool = report["db_pool"]
+    print(f"DB 풀: size {pool['size']}, 최대 사용 {pool['max_checked_out']}, 평균 {pool['mean_checked_out']}, 최대 overflow {pool['max_overflow']}")
+    print(row("loop lag", report["loop_lag"]))
+
+
+def check_baseline(report: dict, tolerance: float) -> bool:
+    """baseline 대비 처리량 / E2E p95 회귀 검사 (설정이 다르면 비교하지 않고 실패)"""
+    if not BASELINE_PATH.exists():
+        print(f"\nbaseline 없음: {BASELINE_PATH} (--update-baseline으로 생성)")
+        return True
+    baseline = json.loads(BASELINE_PATH.read_text())
+    if baseline["config"] != report["config"]:
+        print("\nbaseline과 실행 설정이 달라 비교할 수 없음 (--no-check 또는 --update-baseline)")
+        return False
+
+    checks = [
+        ("throughput", baseline["throughput"], report["throughput"], report["throughput"] >= baseline["throughput"] * (1 - tolerance)),
+        ("e2e p95", baseline["e2e"]["p95"], report["e2e"]["p95"], report["e2e"]["p95"] <= baseline["e2e"]["p95"] * (1 + tolerance)),
+        ("failed", baseline["statuses"].get("failed", 0), report["statuses"].get("failed", 0),
+         report["statuses"].get("failed", 0) <= baseline["statuses"].get("failed", 0)),
+    ]
+    print(f"\nbaseline 비교 (허용 {tolerance:.0%}):")
+    for name, expected, actual, ok in checks:
+        print(f"  {name:<12} baseline {expected:<10} 현재 {actual:<10} {'OK' if ok else '회귀'}")
+    return all(ok for *_, ok in checks)
+
+
+def main() -> int:
+    args = parse_args()
+    workdir = tempfile.mkdtemp(prefix="toonify_load_")
+    configure_env(args, workdir)
+
+    import logging
+
+    probe = ServerProbe()
+    server = AppServer(probe)
+    # 앱 로그(INFO)는 부하 테스트 출력에 섞이지 않도록 숨김
+    logging.getLogger().setLevel(logging.WARNING)
+    server.start()
+    try:
+        runner = LoadRunner(args, server.base_url)
+        elapsed = asyncio.run(runner.run())
+    finally:
+        server.stop()
+
+    report = build_report(args, runner, probe, elapsed)
+    print_report(report)
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.update_baseline:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+        print(f"\nbaseline 저장: {BASELINE_PATH}")
+        return 0
+    if args.no_check:
+        return 0
+    return 0 if check_baseline(report, args.tolerance) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
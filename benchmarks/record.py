@@ -0,0 +1,105 @@
+"""운영 DB의 태스크 / Gemini 호출 기록을 익명화해서 replay용 녹화 파일(JSONL)로 내보내기
+
+tasks(입력, 검증 결과, 소요시간), comics(시나리오), gemini_usage(호출별 지연/토큰)를
+태스크 1건당 1줄로 묶습니다. 텍스트는 단어 단위로 같은 종류/길이의 무의미한 문자열로 바꾸고
+(salt는 저장하지 않음), 요청 시각은 첫 태스크 기준 offset(초)만 남깁니다.
+
+    DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.record --since 2026-10-01 --until 2026-10-08 --out week.jsonl
+    python -m benchmarks.record --limit 200 --out recent.jsonl
+
+녹화 파일은 benchmarks/replay.py로 재생합니다.
+"""
+import argparse
+import asyncio
+import json
+import secrets
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import select
+
+from app.database import async_session
+from app.models import Comic, GeminiUsage, Task
+from app.services.replay_providers import anonymize_text
+
+
+def build_entry(task: Task, origin: datetime, comics: list[Comic], calls: list[GeminiUsage], salt: str) -> dict:
+    episodes = []
+    for comic in comics:
+        for panel in comic.panels_json or []:
+            episodes.append(anonymize_text(panel["image_prompt"], salt))
+    return {
+        "offset": round((task.created_at - origin).total_seconds(), 3),
+        "images": len(task.meeting_img or []),
+        "text": anonymize_text(task.meeting_text, salt),
+        "valid": task.is_valid is not False,
+        "reject_reason": anonymize_text(task.reject_reason, salt) if task.reject_reason else None,
+        "status": task.status,
+        "duration": task.total_duration,
+        "episodes": episodes,
+        "calls": [
+            {
+                "type": call.call_type,
+                "model": call.model,
+                "latency": call.latency,
+                "attempts": call.attempts,
+                "prompt_tokens": call.prompt_tokens,
+                "output_tokens": call.output_tokens,
+            }
+            for call in calls
+        ],
+    }
+
+
+async def export(args: argparse.Namespace) -> int:
+    query = select(Task).order_by(Task.created_at)
+    if args.since:
+        query = query.where(Task.created_at >= datetime.fromisoformat(args.since))
+    if args.until:
+        query = query.where(Task.created_at < datetime.fromisoformat(args.until))
+    if args.limit:
+        # 최근 N건 (시간순으로 다시 정렬)
+        query = query.order_by(None).order_by(Task.created_at.desc()).limit(args.limit)
+
+    async with async_session() as db:
+        tasks = sorted((await db.execute(query)).scalars().all(), key=lambda task: task.created_at)
+        if not tasks:
+            return 0
+        task_ids = [task.id for task in tasks]
+
+        comics = defaultdict(list)
+        result = await db.execute(select(Comic).where(Comic.task_id.in_(task_ids)).order_by(Comic.part_number))
+        for comic in result.scalars():
+            comics[comic.task_id].append(comic)
+
+        calls = defaultdict(list)
+        result = await db.execute(
+            select(GeminiUsage).where(GeminiUsage.task_id.in_(task_ids)).order_by(GeminiUsage.created_at)
+        )
+        for call in result.scalars():
+            calls[call.task_id].append(call)
+
+    salt = args.salt or secrets.token_hex(16)
+    origin = tasks[0].created_at
+    with open(args.out, "w", encoding="utf-8") as f:
+        for task in tasks:
+            entry = build_entry(task, origin, comics[task.id], calls[task.id], salt)
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return len(tasks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--since", help="시작 시각 (ISO, KST)")
+    parser.add_argument("--until", help="종료 시각 (ISO, KST, 미포함)")
+    parser.add_argument("--limit", type=int, help="최근 N건만")
+    parser.add_argument("--salt", help="익명화 salt (기본: 무작위, 같은 salt면 같은 단어가 같은 문자열로 바뀜)")
+    parser.add_argument("--out", required=True)
+    args = parser.parse_args()
+
+    count = asyncio.run(export(args))
+    print(f"{count}건 녹화: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""녹화 파일(benchmarks/record.py)을 원래 도착 간격대로 앱에 다시 보내는 replay 벤치마크
+
+앱은 benchmarks/load.py와 같은 방식으로 같은 프로세스에서 띄우고, Gemini 대신
+replay provider가 녹화된 검증 결과/시나리오와 호출 지연을 그대로 돌려줍니다 (API 키 불필요).
+
+    python -m benchmarks.replay week.jsonl                    # 원래 속도
+    python -m benchmarks.replay week.jsonl --speed 10         # 도착 간격 1/10 (부하 10배)
+    python -m benchmarks.replay week.jsonl --latency-scale 0.5 --json after.json --compare before.json
+
+출력: 처리량, 요청 수락 / 완료까지(e2e) 지연 p50·p95·p99 (녹화 당시 소요시간과 나란히),
+단계별 지연, DB 커넥션 풀 사용량, 서버 이벤트 루프 지연.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from benchmarks.load import AppServer, ServerProbe, _sample_png, admin_headers, percentiles
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", help="녹화 파일 (JSONL)")
+    parser.add_argument("--speed", type=float, default=1.0, help="도착 간격 배속 (2면 2배 빠르게 도착)")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="녹화된 Gemini 지연에 곱할 배율")
+    parser.add_argument("--limit", type=int, help="앞에서부터 N건만 재생")
+    parser.add_argument("--poll-interval", type=float, default=0.5)
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--compare", help="이전 결과 JSON과 비교")
+    return parser.parse_args()
+
+
+def configure_env(args: argparse.Namespace, workdir: str) -> None:
+    """app import 전에 replay provider / 임시 DB / 로컬 저장소 설정"""
+    os.environ.update({
+        "ENV": "DEV",
+        "DATABASE_URL": f"sqlite+aiosqlite:///{workdir}/replay.db",
+        "LLM_PROVIDER": "replay",
+        "IMAGE_PROVIDER": "replay",
+        "REPLAY_FILE": str(Path(args.recording).resolve()),
+        "REPLAY_LATENCY_SCALE": str(args.latency_scale),
+        "STORAGE_BACKEND": "local",
+        "LOCAL_STORAGE_DIR": f"{workdir}/media",
+        "ATTACHMENT_MODE": "inline",
+        "GEMINI_CONTEXT_CACHE_ENABLED": "false",
+    })
+
+
+class Replayer:
+    def __init__(self, args: argparse.Namespace, base_url: str, entries: list[dict]):
+        self.args = args
+        self.base_url = base_url
+        self.entries = entries
+        self.png = _sample_png()
+        self.accept_latency: list[float] = []
+        self.e2e_latency: list[float] = []
+        self.stages: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, int] = defaultdict(int)
+
+    async def _submit(self, client, entry: dict):
+        if entry["images"]:
+            return await client.post(
+                "/generate-with-images",
+                data={"meeting_text": entry["text"]},
+                files=[("images", (f"{i}.png", self.png, "image/png")) for i in range(entry["images"])],
+            )
+        return await client.post("/generate", json={"meeting_text": entry["text"]})
+
+    async def _replay(self, client, entry: dict, origin: float) -> None:
+        await asyncio.sleep(max(0.0, origin + entry["offset"] / self.args.speed - time.perf_counter()))
+        start = time.perf_counter()
+        response = await self._submit(client, entry)
+        self.accept_latency.append(time.perf_counter() - start)
+        if response.status_code == 400:
+            self.statuses["rejected"] += 1
+            return
+        if response.status_code != 200:
+            self.statuses[f"http_{response.status_code}"] += 1
+            return
+
+        task_id = response.json()["task"]["id"]
+        while True:
+            await asyncio.sleep(self.args.poll_interval)
+            status = (await client.get(f"/status/{task_id}")).json()["status"]
+            if status in ("completed", "failed"):
+                break
+        await client.get(f"/result/{task_id}")
+        self.e2e_latency.append(time.perf_counter() - start)
+        self.statuses[status] += 1
+
+        trace = (await client.get(f"/debug/trace/{task_id}")).json()
+        for span in trace.get("spans", []):
+            self.stages[span["name"]].append(span["duration_ms"] / 1000)
+
+    async def run(self) -> float:
+        import httpx
+
+        async with httpx.AsyncClient(base_url=self.base_url, headers=admin_headers(), timeout=600) as client:
+            origin = time.perf_counter()
+            await asyncio.gather(*[self._replay(client, entry, origin) for entry in self.entries])
+            return time.perf_counter() - origin
+
+
+def print_report(report: dict) -> None:
+    def row(name: str, stats: dict) -> str:
+        if not stats.get("count"):
+            return f"  {name:<32} -"
+        return (
+            f"  {name:<32} n={stats['count']:<4} p50 {stats['p50']:7.3f}s  "
+            f"p95 {stats['p95']:7.3f}s  p99 {stats['p99']:7.3f}s"
+        )
+
+    config = report["config"]
+    print(f"\n=== replay ({config['tasks']}건, 도착 {config['speed']:g}배속, 지연 ×{config['latency_scale']:g}) ===")
+    print(f"소요 {report['elapsed']:.1f}s, 처리량 {report['throughput']:.3f} tasks/s, 상태 {report['statuses']}")
+    print(row("accept", report["accept"]))
+    print(row("e2e", report["e2e"]))
+    print(row("e2e (recorded)", report["recorded_e2e"]))
+    print("단계별:")
+    for name, stats in report["stages"].items():
+        print(row(name, stats))
+    pool = report["db_pool"]
+    print(f"DB 풀: size {pool['size']}, 최대 사용 {pool['max_checked_out']}, 평균 {pool['mean_checked_out']}, 최대 overflow {pool['max_overflow']}")
+    print(row("loop lag", report["loop_lag"]))
+
+
+def print_comparison(report: dict, previous: dict) -> None:
+    if previous["config"] != report["config"]:
+        print("\n비교 대상과 replay 설정이 다름 (참고용)")
+    print("\n이전 결과와 비교:")
+    for label, path in [("throughput", ("throughput",)), ("e2e p50", ("e2e", "p50")),
+                        ("e2e p95", ("e2e", "p95")), ("e2e p99", ("e2e", "p99"))]:
+        before, after = previous, report
+        for key in path:
+            before, after = before.get(key, {}), after.get(key, {})
+        if not isinstance(before, (int, float)) or not isinstance(after, (int, float)) or not before:
+            continue
+        print(f"  {label:<12} {before:>9.3f} → {after:>9.3f} ({(after - before) / before:+.1%})")
+
+
+def main() -> int:
+    args = parse_args()
+    with open(args.recording, encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    entries = entries[:args.limit] if args.limit else entries
+    if not entries:
+        print("녹화된 태스크가 없음")
+        return 1
+
+    workdir = tempfile.mkdtemp(prefix="toonify_replay_")
+    configure_env(args, workdir)
+
+    import logging
+
+    probe = ServerProbe()
+    server = AppServer(probe)
+    logging.getLogger().setLevel(logging.WARNING)
+    server.start()
+    try:
+        replayer = Replayer(args, server.base_url, entries)
+        elapsed = asyncio.run(replayer.run())
+    finally:
+        server.stop()
+
+    report = {
+        "config": {
+            "recording": Path(args.recording).name,
+            "tasks": len(entries),
+            "speed": args.speed,
+            "latency_scale": args.latency_scale,
+        },
+        "elapsed": round(elapsed, 3),
+        "throughput": round(replayer.statuses["completed"] / elapsed, 4),
+        "statuses": dict(replayer.statuses),
+        "accept": percentiles(replayer.accept_latency),
+        "e2e": percentiles(replayer.e2e_latency),
+        "recorded_e2e": percentiles([
+            entry["duration"] for entry in entries if entry["status"] == "completed" and entry.get("duration")
+        ]),
+        "stages": {name: percentiles(values) for name, values in sorted(replayer.stages.items())},
+        **probe.summary(),
+    }
+    print_report(report)
+    if args.compare:
+        print_comparison(report, json.loads(Path(args.compare).read_text()))
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
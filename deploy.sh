@@ -22,6 +22,14 @@ sed -i '' "s|const API_BASE_URL = '';|const API_BASE_URL = '${NGROK_URL}';|g" do
 # result.html의 API_BASE_URL도 변경
 sed -i '' "s|const API_BASE_URL = '';|const API_BASE_URL = '${NGROK_URL}';|g" docs/result.html
 
+echo "🔖 정적 파일 해시 경로 빌드 중..."
+
+# 서버용 (app/static/dist, 서버 재시작 후 반영)
+python -m app.static_assets
+
+# GitHub Pages용 (URL 변경 후 빌드해야 app.js 해시에 반영됨, HTML의 정적 파일 경로 치환)
+python -m app.static_assets --static-dir docs/static --html docs/index.html docs/result.html
+
 echo "✅ 완료!"
 echo ""
 echo "📌 ngrok URL 변경 시:"
@@ -0,0 +1,62 @@
+-- 기존 DB 업그레이드: 추적/사용량/이미지 tier/프리뷰/멀티 워커/결과 페이지 발행 컬럼과 테이블
+--
+-- init_db(create_all)는 없는 테이블만 만들고 기존 tasks/comics 테이블에 컬럼은 추가하지 않으므로
+-- 이전 버전으로 만든 DB는 새 버전 배포 전에 한 번만 실행할 것 (MySQL 기준).
+--   mysql -u <user> -p <db> < migrations/001_pipeline_columns.sql
+-- ALTER TABLE과 tasks 인덱스는 다시 실행하면 이미 있다는 에러가 나므로 재실행하지 말 것.
+-- 새 테이블은 서버 시작 시 create_all이 먼저 만들었을 수 있어서 인덱스까지 CREATE TABLE IF NOT EXISTS 안에 둠.
+-- SQLite/PostgreSQL은 ALTER TABLE 부분만 그대로 쓰면 되고 (DATETIME은 PostgreSQL에서 TIMESTAMP), 새 테이블은 create_all에 맡김.
+
+-- tasks
+ALTER TABLE tasks ADD COLUMN trace_json TEXT NULL;            -- 단계별 span 타임라인
+ALTER TABLE tasks ADD COLUMN image_tier VARCHAR(30) NULL;     -- 에피소드 이미지 라우팅 tier
+ALTER TABLE tasks ADD COLUMN worker_id VARCHAR(64) NULL;      -- 처리 중인 워커
+ALTER TABLE tasks ADD COLUMN heartbeat_at DATETIME NULL;      -- 워커 heartbeat
+ALTER TABLE tasks ADD COLUMN published_url TEXT NULL;         -- 저장소에 발행된 결과 페이지 URL
+CREATE INDEX ix_tasks_heartbeat_at ON tasks (heartbeat_at);
+-- status에 preview 추가: VARCHAR(20) 그대로 사용, 변경 없음
+
+-- comics
+ALTER TABLE comics ADD COLUMN image_tiers TEXT NULL;          -- 이미지별 품질 목록 preview | final
+
+-- Gemini 호출별 토큰 사용량
+CREATE TABLE IF NOT EXISTS gemini_usages (
+    id VARCHAR(36) NOT NULL,
+    task_id VARCHAR(36) NULL,
+    call_type VARCHAR(30) NOT NULL,
+    model VARCHAR(50) NOT NULL,
+    prompt_tokens INTEGER NULL,
+    cached_tokens INTEGER NULL,
+    output_tokens INTEGER NULL,
+    thoughts_tokens INTEGER NULL,
+    image_tokens INTEGER NULL,
+    total_tokens INTEGER NULL,
+    latency FLOAT NULL,
+    attempts INTEGER NULL,
+    created_at DATETIME NULL,
+    PRIMARY KEY (id),
+    INDEX ix_gemini_usages_task_id (task_id),
+    INDEX ix_gemini_usages_created_at (created_at),
+    FOREIGN KEY (task_id) REFERENCES tasks (id)
+);
+
+-- 생성 이미지 캐시
+CREATE TABLE IF NOT EXISTS image_cache (
+    `key` VARCHAR(64) NOT NULL,
+    image_path TEXT NOT NULL,
+    model VARCHAR(50) NOT NULL,
+    image_size VARCHAR(10) NULL,
+    hit_count INTEGER NULL,
+    created_at DATETIME NULL,
+    last_used_at DATETIME NULL,
+    PRIMARY KEY (`key`),
+    INDEX ix_image_cache_last_used_at (last_used_at)
+);
+
+-- 리더 선출 lease
+CREATE TABLE IF NOT EXISTS leases (
+    name VARCHAR(50) NOT NULL,
+    holder VARCHAR(64) NOT NULL,
+    expires_at DATETIME NOT NULL,
+    PRIMARY KEY (name)
+);
@@ -0,0 +1,22 @@
+import os
+import tempfile
+
+# app 모듈을 import하기 전에 테스트용 SQLite DB로 지정 (.env의 DATABASE_URL보다 우선)
+_db_dir = tempfile.mkdtemp(prefix="toonify-test-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ["ENV"] = "test"
+
+import pytest_asyncio  # noqa: E402
+
+from app.database import Base, engine, init_db  # noqa: E402
+
+
+@pytest_asyncio.fixture
+async def db_tables():
+    """테스트마다 빈 테이블 생성 후 삭제"""
+    await init_db()
+    yield
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    # 테스트마다 이벤트 루프가 바뀌므로 풀의 연결을 버림
+    await engine.dispose()
@@ -0,0 +1,61 @@
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from app.config import settings
+from app.database import async_session
+from app.models import ImageCacheEntry
+from app.models.models import now_kst
+from app.services.image_cache_service import ImageCacheService
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.usefixtures("db_tables")]
+
+
+@pytest.fixture(autouse=True)
+def small_cache(monkeypatch):
+    monkeypatch.setattr(settings, "image_cache_enabled", True)
+    monkeypatch.setattr(settings, "image_cache_max_entries", 2)
+
+
+async def _keys() -> set[str]:
+    async with async_session() as db:
+        return set(await db.scalars(select(ImageCacheEntry.key)))
+
+
+async def _age(key: str, seconds: float) -> None:
+    async with async_session() as db:
+        await db.execute(
+            update(ImageCacheEntry)
+            .where(ImageCacheEntry.key == key)
+            .values(last_used_at=now_kst() - timedelta(seconds=seconds))
+        )
+        await db.commit()
+
+
+async def test_evicts_least_recently_used_over_limit():
+    cache = ImageCacheService()
+    await cache._save("a", "/a.png", "pro", "2K")
+    await cache._save("b", "/b.png", "pro", "2K")
+    await _age("a", 20)
+    await _age("b", 10)
+
+    await cache._save("c", "/c.png", "pro", "2K")
+    assert await _keys() == {"b", "c"}
+
+
+async def test_pending_hits_count_before_eviction():
+    cache = ImageCacheService()
+    await cache._save("a", "/a.png", "pro", "2K")
+    await cache._save("b", "/b.png", "pro", "2K")
+    await _age("a", 20)
+    await _age("b", 10)
+
+    # a는 최근에 적중했지만 아직 DB에 반영 전
+    assert await cache.lookup(["a"]) == "/a.png"
+    await cache._save("c", "/c.png", "pro", "2K")
+    assert await _keys() == {"a", "c"}
+
+    async with async_session() as db:
+        assert (await db.get(ImageCacheEntry, "a")).hit_count == 1
+    cache._flush_task.cancel()
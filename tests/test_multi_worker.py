@@ -0,0 +1,113 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from app.config import settings
+from app.database import async_session
+from app.models import Comic, Lease, Task
+from app.models.models import now_kst
+from app.services.leader_service import LeaderElection
+from app.services.lifecycle_service import INTERRUPTED_MESSAGE, LifecycleService
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.usefixtures("db_tables")]
+
+
+@pytest.fixture(autouse=True)
+def multi_worker(monkeypatch):
+    monkeypatch.setattr(settings, "multi_worker", True)
+    monkeypatch.setattr(settings, "leader_lease_ttl", 30)
+    monkeypatch.setattr(settings, "stale_task_seconds", 90)
+
+
+async def _add_task(heartbeat_ago: float, with_scenario: bool = False) -> str:
+    heartbeat_at = now_kst() - timedelta(seconds=heartbeat_ago)
+    async with async_session() as db:
+        task = Task(meeting_text="회의", status="processing", worker_id="dead-worker", heartbeat_at=heartbeat_at)
+        db.add(task)
+        await db.flush()
+        if with_scenario:
+            db.add(Comic(task_id=task.id, part_number=1, panels_json=[{"image_prompt": "p"}]))
+        await db.commit()
+        return task.id
+
+
+async def test_single_leader_among_workers():
+    workers = [LeaderElection(worker_id=f"worker-{i}") for i in range(3)]
+    for worker in workers:
+        await worker._acquire()
+    assert [worker.is_leader for worker in workers] == [True, False, False]
+
+    # 리더의 갱신, 다른 워커의 재시도 후에도 리더는 그대로
+    for worker in reversed(workers):
+        await worker._acquire()
+    assert [worker.is_leader for worker in workers] == [True, False, False]
+
+
+async def test_takeover_after_lease_expiry():
+    first, second = LeaderElection(worker_id="worker-a"), LeaderElection(worker_id="worker-b")
+    await first._acquire()
+    await second._acquire()
+    assert first.is_leader and not second.is_leader
+
+    # 리더가 갱신하지 못한 채 TTL이 지남
+    async with async_session() as db:
+        await db.execute(update(Lease).values(expires_at=now_kst() - timedelta(seconds=1)))
+        await db.commit()
+
+    await second._acquire()
+    await first._acquire()
+    assert second.is_leader and not first.is_leader
+    async with async_session() as db:
+        assert (await db.get(Lease, "leader")).holder == "worker-b"
+
+
+async def test_released_lease_is_taken_immediately():
+    first, second = LeaderElection(worker_id="worker-a"), LeaderElection(worker_id="worker-b")
+    await first._acquire()
+    await first.stop()
+    await second._acquire()
+    assert second.is_leader and not first.is_leader
+
+
+async def test_only_one_sweeper_claims_stale_task():
+    task_id = await _add_task(heartbeat_ago=600)
+    async with async_session() as db_a, async_session() as db_b:
+        task_a = await db_a.get(Task, task_id)
+        task_b = await db_b.get(Task, task_id)
+        claimed = [await LifecycleService._claim(db_a, task_a), await LifecycleService._claim(db_b, task_b)]
+    assert claimed == [True, False]
+
+
+async def test_concurrent_sweeps_resume_task_once():
+    task_id = await _add_task(heartbeat_ago=600, with_scenario=True)
+    resumed = []
+
+    async def resume(db, resumed_task_id):
+        resumed.append(resumed_task_id)
+
+    sweepers = [LifecycleService() for _ in range(2)]
+    for sweeper in sweepers:
+        sweeper._resume = resume
+    await asyncio.gather(*(sweeper.sweep(settings.stale_task_seconds) for sweeper in sweepers))
+    await asyncio.gather(*(task for sweeper in sweepers for task in list(sweeper._pipelines.values())))
+
+    assert resumed == [task_id]
+
+
+async def test_sweep_skips_live_and_admitting_tasks():
+    live_id = await _add_task(heartbeat_ago=10)
+    admitting_id = await _add_task(heartbeat_ago=600)
+    stale_id = await _add_task(heartbeat_ago=600)
+
+    sweeper = LifecycleService()
+    with sweeper.admitting(admitting_id):
+        await sweeper.sweep(settings.stale_task_seconds)
+
+    async with async_session() as db:
+        rows = dict((await db.execute(select(Task.id, Task.status))).all())
+        stale = await db.get(Task, stale_id)
+    assert rows[live_id] == "processing"
+    assert rows[admitting_id] == "processing"
+    assert stale.status == "failed" and stale.error_message == INTERRUPTED_MESSAGE